@@ -0,0 +1,136 @@
+import threading
+import time
+from agents.base_agent import SearchCancelled
+from agents.decision_stats import agent_label
+from core.game_engine import GameEngine
+from core.match_log import decode_action
+
+# Appended to the agent name of replies served from agents.speculation instead of decided
+# on the spot; their latency is the wait for the reply, not the search
+SPECULATED_TAG = '/speculated'
+
+
+class AgentWorker:
+    """Runs an agent's decide_action on a background thread so the GUI keeps rendering.
+
+    The agent works on a private clone of the game state; the action it picks is mapped
+    back to the matching action of the live state when the result is collected. With a
+    speculator (agents.speculation.Speculator), a reply it computed ahead is served instead;
+    served replies bypass the agent's decide_action, so they are filed in decision_stats
+    separately, under the agent's name tagged SPECULATED_TAG.
+    """
+
+    def __init__(self, on_done=None, speculator=None, decision_stats=None):
+        self.on_done = on_done  # called from the worker thread when a decision is ready
+        self.speculator = speculator
+        self.decision_stats = decision_stats
+        self._lock = threading.Lock()
+        self._job = 0
+        self._stop_event = None
+        self._thread = None
+        self._result = None
+        self._error = None
+        self._valid_actions = None
+        self.busy = False
+
+    def start(self, agent, game_state, valid_actions):
+        self.cancel()
+        reply = self.speculator.claim(game_state) if self.speculator is not None else None
+
+        search_state = game_state.clone()
+        search_actions = GameEngine(search_state).get_valid_actions()
+        stop_event = threading.Event()
+        agent.stop_event = stop_event
+
+        with self._lock:
+            self._job += 1
+            job = self._job
+            self._stop_event = stop_event
+            self._result = None
+            self._error = None
+            self._valid_actions = valid_actions
+            self.busy = True
+
+        if reply is not None:
+            started = time.perf_counter()
+            reply.add_done_callback(
+                lambda future: self._collect(job, future, agent, search_state, search_actions, started))
+        else:
+            self._start_thread(job, agent, search_state, search_actions)
+
+    def _start_thread(self, job, agent, search_state, search_actions):
+        self._thread = threading.Thread(
+            target=self._run, args=(job, agent, search_state, search_actions), daemon=True
+        )
+        self._thread.start()
+
+    def _collect(self, job, reply, agent, search_state, search_actions, started):
+        """Finish the job with a speculated reply, or search after all if it was not computed."""
+        result = None
+        code = None if reply.cancelled() or reply.exception() is not None else reply.result()
+        if code is not None:
+            try:
+                result = decode_action(code, search_actions)
+            except ValueError:
+                pass
+        if result is None:
+            with self._lock:
+                if job != self._job:
+                    return
+            self._start_thread(job, agent, search_state, search_actions)
+            return
+        if self.decision_stats is not None and job == self._job:
+            self.decision_stats.record(agent_label(agent) + SPECULATED_TAG, search_state.round_number,
+                                       len(search_state.players[agent.player_id].hand),
+                                       time.perf_counter() - started)
+        self._finish(job, result, None)
+
+    def _run(self, job, agent, search_state, search_actions):
+        result = None
+        error = None
+        try:
+            result = agent.decide_action(search_state, search_actions)
+        except SearchCancelled:
+            return
+        except Exception as e:
+            error = e
+        self._finish(job, result, error)
+
+    def _finish(self, job, result, error):
+        with self._lock:
+            if job != self._job:
+                return  # cancelled or superseded while thinking
+            self._result = result
+            self._error = error
+            self.busy = False
+
+        if self.on_done:
+            self.on_done()
+
+    def poll(self):
+        """Return the chosen action (from the live valid actions) once ready, else None."""
+        with self._lock:
+            if self.busy or (self._result is None and self._error is None):
+                return None
+            result, error = self._result, self._error
+            valid_actions = self._valid_actions
+            self._result = None
+            self._error = None
+
+        if error is not None:
+            raise error
+
+        for action in valid_actions:
+            if action.key() == result.key():
+                return action
+        return valid_actions[0]
+
+    def cancel(self):
+        with self._lock:
+            self._job += 1
+            if self._stop_event is not None:
+                self._stop_event.set()
+            self._stop_event = None
+            self._result = None
+            self._error = None
+            self.busy = False
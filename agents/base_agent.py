@@ -1,10 +1,25 @@
+import random
+
+
+class SearchCancelled(Exception):
+    """Raised inside decide_action when the agent's stop_event is set."""
+
+
 class BaseAgent:
-    def __init__(self, player_id):
+    def __init__(self, player_id, rng=None):
         self.player_id = player_id
+        # random.Random used for tie-breaks and mixed strategies; the global random module by default
+        self.rng = rng if rng is not None else random
+        # Optional threading.Event; long-running agents poll it and raise SearchCancelled
+        self.stop_event = None
     
     def decide_action(self, game_state, valid_actions):
         raise NotImplementedError
     
+    def check_stop(self):
+        if self.stop_event is not None and self.stop_event.is_set():
+            raise SearchCancelled()
+    
     def calculate_board_strength(self, board):
         total = 0
         for row in ['melee', 'ranged', 'siege']:
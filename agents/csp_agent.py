@@ -1,13 +1,44 @@
 from agents.base_agent import BaseAgent
 from core.action import Action
 from core.game_engine import GameEngine
-import random
 
 class CSPAgent(BaseAgent):
+    # Weights of the soft-constraint objectives in _evaluate_action
+    DEFAULT_PARAMS = {
+        'strength_improvement': 10,
+        'winning': 100,
+        'optimal_lead': 50,
+        'overcommit': 30,
+        'efficiency': 5,
+        'high_card_when_losing': 40,
+        'low_card_when_winning': 30,
+        'medium_card_when_tied': 25,
+        'round1_early_pass': 200,
+        'round1_high_card': 50,
+        'round2_ahead_pass': 150,
+        'round2_behind_strong_card': 60,
+        'round3_ahead_pass': 300,
+        'round3_behind_per_strength': 15,
+        'round3_tied_per_strength': 12,
+        'debuff_net_gain': 15,
+        'debuff_timing': 100,
+        'scorch_net_gain': 20,
+        'scorch_high_value': 150,
+        'match_opp_pass': 250,
+        'minimal_win_after_opp_pass': 100,
+        'card_advantage': 20,
+        'card_disadvantage_pass': 50,
+        'tiebreak_pass': 200,
+        'tiebreak_must_win': 50,
+        'desperation': 40,
+    }
     
-    def __init__(self, player_id):
-        super().__init__(player_id)
+    def __init__(self, player_id, params=None, rng=None):
+        super().__init__(player_id, rng)
         self.action_history = []
+        self.params = dict(self.DEFAULT_PARAMS)
+        if params:
+            self.params.update(params)
     
     def decide_action(self, game_state, valid_actions):
         if len(valid_actions) == 1:
@@ -121,6 +152,7 @@ class CSPAgent(BaseAgent):
         return feasible if feasible else valid_actions
     
     def _evaluate_action(self, game_state, action, my_state, opp_state):
+        p = self.params
         score = 0.0
         
         # Get current state information
@@ -145,72 +177,72 @@ class CSPAgent(BaseAgent):
         
         # === OBJECTIVE 1: Maximize strength difference ===
         strength_improvement = sim_strength_diff - strength_diff
-        score += strength_improvement * 10
+        score += strength_improvement * p['strength_improvement']
         
         # === OBJECTIVE 2: Win the round with minimum investment ===
         if sim_strength_diff > 0:
             # Winning - bonus for being ahead
-            score += 100
+            score += p['winning']
             
             # Prefer minimal lead (save cards for later)
             if sim_strength_diff <= 5:
-                score += 50  # Optimal lead
+                score += p['optimal_lead']  # Optimal lead
             elif sim_strength_diff > 15:
-                score -= 30  # Overcommitting
+                score -= p['overcommit']  # Overcommitting
         
         # === OBJECTIVE 3: Resource efficiency ===
         if action.type == Action.PLAY_UNIT:
             # Efficiency: strength gained per card played
             efficiency = action.card.strength / max(1, my_cards)
-            score += efficiency * 5
+            score += efficiency * p['efficiency']
             
             # Bonus for appropriate strength cards based on situation
             if strength_diff < -10:
                 # Losing - prefer high-strength cards
                 if action.card.strength >= 7:
-                    score += 40
+                    score += p['high_card_when_losing']
             elif strength_diff > 10:
                 # Winning - prefer low-strength cards
                 if action.card.strength <= 5:
-                    score += 30
+                    score += p['low_card_when_winning']
             else:
                 # Tied - prefer medium-strength cards
                 if 4 <= action.card.strength <= 7:
-                    score += 25
+                    score += p['medium_card_when_tied']
         
         # === OBJECTIVE 4: Round-specific strategies ===
         if round_num == 1:
             # Early round - conservative play
             if action.type == Action.PASS and strength_diff > 3:
-                score += 200  # Pass early when winning
+                score += p['round1_early_pass']  # Pass early when winning
             if action.type == Action.PLAY_UNIT and action.card.strength >= 8:
-                score -= 50  # Penalty for high cards early
+                score -= p['round1_high_card']  # Penalty for high cards early
         
         elif round_num == 2:
             # Mid round - balanced play
             if rounds_won_diff > 0:
                 # Already won a round - can be conservative
                 if action.type == Action.PASS and strength_diff >= 0:
-                    score += 150
+                    score += p['round2_ahead_pass']
             elif rounds_won_diff < 0:
                 # Lost first round - must win this
                 if action.type == Action.PLAY_UNIT and action.card.strength >= 6:
-                    score += 60
+                    score += p['round2_behind_strong_card']
         
         elif round_num == 3:
             # Final round - decisive play
             if rounds_won_diff > 0:
                 # Already winning - just need to not lose
                 if action.type == Action.PASS:
-                    score += 300
+                    score += p['round3_ahead_pass']
             elif rounds_won_diff < 0:
                 # Must win - all in
                 if action.type == Action.PLAY_UNIT:
-                    score += action.card.strength * 15
+                    score += action.card.strength * p['round3_behind_per_strength']
             else:
                 # Tied - must win this round
                 if action.type == Action.PLAY_UNIT:
-                    score += action.card.strength * 12
+                    score += action.card.strength * p['round3_tied_per_strength']
         
         # === OBJECTIVE 5: Special card value ===
         if action.type == Action.PLAY_SPECIAL:
@@ -226,11 +258,11 @@ class CSPAgent(BaseAgent):
                              for c in my_row_cards if c.get_current_strength() > 1)
                 
                 net_gain = opp_loss - my_loss
-                score += net_gain * 15
+                score += net_gain * p['debuff_net_gain']
                 
                 # Bonus for good timing
                 if opp_cards < my_cards and net_gain > 10:
-                    score += 100  # Opponent can't recover easily
+                    score += p['debuff_timing']  # Opponent can't recover easily
             
             elif action.card.card_type == -2:  # Scorch
                 # Calculate scorch value
@@ -247,31 +279,31 @@ class CSPAgent(BaseAgent):
                                   if pid != self.player_id and c.get_current_strength() == max_strength)
                     
                     net_gain = opp_loss - my_loss
-                    score += net_gain * 20
+                    score += net_gain * p['scorch_net_gain']
                     
                     # Bonus for high-value scorches
                     if opp_loss >= 10 and my_loss == 0:
-                        score += 150
+                        score += p['scorch_high_value']
         
         # === OBJECTIVE 6: Opponent modeling ===
         if opp_state.passed:
             # Opponent passed - be conservative
             if action.type == Action.PASS and sim_strength_diff >= 0:
-                score += 250  # Match their pass if winning
+                score += p['match_opp_pass']  # Match their pass if winning
             elif action.type == Action.PLAY_UNIT:
                 # Play minimal card to win
                 if sim_strength_diff > 0 and sim_strength_diff <= 5:
-                    score += 100
+                    score += p['minimal_win_after_opp_pass']
         
         # === OBJECTIVE 7: Card advantage ===
         card_advantage = my_cards - opp_cards
         if card_advantage > 2:
             # We have more cards - can afford to invest
-            score += 20
+            score += p['card_advantage']
         elif card_advantage < -2:
             # Opponent has more cards - be conservative
             if action.type == Action.PASS and strength_diff >= 0:
-                score += 50
+                score += p['card_disadvantage_pass']
         
         # === OBJECTIVE 8: Tiebreaker consideration ===
         if round_num == 3 and rounds_won_diff == 0:
@@ -279,21 +311,21 @@ class CSPAgent(BaseAgent):
             if my_cards > opp_cards:
                 # We'd win tiebreaker - can pass if tied
                 if action.type == Action.PASS and strength_diff == 0:
-                    score += 200
+                    score += p['tiebreak_pass']
             else:
                 # They'd win tiebreaker - must win this round
                 if action.type == Action.PLAY_UNIT:
-                    score += 50
+                    score += p['tiebreak_must_win']
         
         # === OBJECTIVE 9: Avoid desperation plays ===
         if my_cards <= 2 and round_num <= 2:
             # Low on cards early - penalty for playing
             if action.type == Action.PLAY_UNIT:
-                score -= 40
+                score -= p['desperation']
         
         # === OBJECTIVE 10: Random tiebreaking ===
         # Add small random noise to break ties
-        score += random.uniform(-1, 1)
+        score += self.rng.uniform(-1, 1)
         
         return score
     
@@ -0,0 +1,341 @@
+"""Latency histograms for agent decisions, and profiles of the slowest ones.
+
+instrument(agent, stats) wraps one agent's decide_action so every decision it completes
+is timed and filed under (agent name, round, cards in hand). Histograms have fixed
+log-spaced buckets (four per doubling, from 1 us), so they cost the same however many
+decisions they hold, merge by adding counts and give percentiles to within about 19%.
+
+With a SlowestProfiles collector attached, every decision also runs under a profiler and
+the profiles of the N slowest are kept:
+
+    'cprofile'  cProfile, dumped as .prof files (pstats, snakeviz)
+    'sample'    a thread that samples the deciding thread's stack every interval,
+                dumped as collapsed stacks (flamegraph.pl, speedscope)
+
+Profiling slows the decisions it watches, cProfile much more than sampling, so the
+latencies recorded while profiling are inflated accordingly.
+"""
+import cProfile
+import heapq
+import itertools
+import json
+import marshal
+import math
+import os
+import sys
+import threading
+import time
+
+from agents.base_agent import SearchCancelled
+
+BUCKETS_PER_DOUBLING = 4
+N_BUCKETS = 100  # 1 us up to about 33 s; slower decisions land in the last bucket
+
+
+def bucket_for(seconds):
+    micros = seconds * 1e6
+    if micros <= 1:
+        return 0
+    return min(N_BUCKETS - 1, int(math.log2(micros) * BUCKETS_PER_DOUBLING) + 1)
+
+
+def bucket_upper_seconds(bucket):
+    return 2 ** (bucket / BUCKETS_PER_DOUBLING) / 1e6
+
+
+class LatencyHistogram:
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.buckets = [0] * N_BUCKETS
+
+    def add(self, seconds):
+        self.count += 1
+        self.total += seconds
+        self.max = max(self.max, seconds)
+        self.buckets[bucket_for(seconds)] += 1
+
+    def merge(self, other):
+        self.count += other.count
+        self.total += other.total
+        self.max = max(self.max, other.max)
+        self.buckets = [a + b for a, b in zip(self.buckets, other.buckets)]
+        return self
+
+    def percentile(self, point):
+        """Upper edge of the bucket holding the point-th percentile, capped at the largest sample."""
+        if self.count == 0:
+            return 0.0
+        rank = point / 100 * self.count
+        seen = 0
+        for bucket, count in enumerate(self.buckets):
+            seen += count
+            if count and seen >= rank:
+                return min(bucket_upper_seconds(bucket), self.max)
+        return self.max
+
+    def summary(self):
+        return {
+            'count': self.count,
+            'mean_ms': self.total / self.count * 1000 if self.count else 0.0,
+            'p50_ms': self.percentile(50) * 1000,
+            'p90_ms': self.percentile(90) * 1000,
+            'p99_ms': self.percentile(99) * 1000,
+            'max_ms': self.max * 1000,
+        }
+
+    def to_dict(self):
+        return {'count': self.count, 'total': self.total, 'max': self.max, 'buckets': self.buckets}
+
+    @classmethod
+    def from_dict(cls, data):
+        histogram = cls()
+        histogram.count = data['count']
+        histogram.total = data['total']
+        histogram.max = data['max']
+        histogram.buckets = list(data['buckets'])
+        return histogram
+
+
+class DecisionStats:
+    """Histograms keyed by (agent name, round, hand size); thread-safe, mergeable, JSON-serializable."""
+
+    def __init__(self):
+        self.histograms = {}
+        self._lock = threading.Lock()
+
+    def record(self, agent_name, round_number, hand_size, seconds):
+        key = (agent_name, round_number, hand_size)
+        with self._lock:
+            histogram = self.histograms.get(key)
+            if histogram is None:
+                histogram = self.histograms[key] = LatencyHistogram()
+            histogram.add(seconds)
+
+    def merge(self, other):
+        for key, histogram in other.histograms.items():
+            self.histograms.setdefault(key, LatencyHistogram()).merge(histogram)
+        return self
+
+    def agents(self):
+        return sorted({agent_name for agent_name, _, _ in self.histograms})
+
+    def combined(self, agent_name, round_number=None, hand_size=None):
+        """One histogram over all keys of an agent matching the given round and/or hand size."""
+        result = LatencyHistogram()
+        for (name, round_key, hand_key), histogram in self.histograms.items():
+            if name == agent_name and round_number in (None, round_key) and hand_size in (None, hand_key):
+                result.merge(histogram)
+        return result
+
+    def summary(self):
+        """{agent: {'all': ..., 'rounds': {round: ...}, 'hand_sizes': {size: ...}}} of histogram summaries."""
+        result = {}
+        for agent_name in self.agents():
+            keys = [key for key in self.histograms if key[0] == agent_name]
+            result[agent_name] = {
+                'all': self.combined(agent_name).summary(),
+                'rounds': {r: self.combined(agent_name, round_number=r).summary()
+                           for r in sorted({key[1] for key in keys})},
+                'hand_sizes': {h: self.combined(agent_name, hand_size=h).summary()
+                               for h in sorted({key[2] for key in keys}, reverse=True)},
+            }
+        return result
+
+    def to_dict(self):
+        return {'histograms': [[*key, histogram.to_dict()] for key, histogram in self.histograms.items()]}
+
+    @classmethod
+    def from_dict(cls, data):
+        stats = cls()
+        for agent_name, round_number, hand_size, histogram in data['histograms']:
+            stats.histograms[(agent_name, round_number, hand_size)] = LatencyHistogram.from_dict(histogram)
+        return stats
+
+    def save(self, path):
+        with open(path, 'w') as f:
+            json.dump(self.to_dict(), f)
+
+    @classmethod
+    def load(cls, path):
+        with open(path) as f:
+            return cls.from_dict(json.load(f))
+
+
+def format_report(stats):
+    lines = []
+    header = f"    {'':14}{'count':>8}{'mean ms':>10}{'p50 ms':>10}{'p90 ms':>10}{'p99 ms':>10}{'max ms':>10}"
+
+    def row(label, summary):
+        return (f"    {label:14}{summary['count']:>8}{summary['mean_ms']:>10.2f}{summary['p50_ms']:>10.2f}"
+                f"{summary['p90_ms']:>10.2f}{summary['p99_ms']:>10.2f}{summary['max_ms']:>10.2f}")
+
+    for agent_name, summary in stats.summary().items():
+        lines.append(f"{agent_name}")
+        lines.append(header)
+        lines.append(row("all", summary['all']))
+        for round_number, round_summary in summary['rounds'].items():
+            lines.append(row(f"round {round_number}", round_summary))
+        for hand_size, hand_summary in summary['hand_sizes'].items():
+            lines.append(row(f"{hand_size} in hand", hand_summary))
+    return "\n".join(lines)
+
+
+class StackSampler:
+    """Samples one thread's Python stack every interval seconds on a background thread.
+
+    The sampler needs the GIL to look, so while it runs the interpreter's switch interval
+    is lowered to the sampling interval; otherwise a busy search thread would hold the
+    GIL for the default 5 ms at a time.
+    """
+
+    def __init__(self, thread_id, interval=0.001):
+        self.thread_id = thread_id
+        self.interval = interval
+        self.stacks = {}  # collapsed stack 'outer;...;inner' -> samples
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name='decision-sampler', daemon=True)
+        self._switch_interval = None
+
+    def start(self):
+        self._switch_interval = sys.getswitchinterval()
+        sys.setswitchinterval(min(self._switch_interval, self.interval))
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        self._thread.join()
+        sys.setswitchinterval(self._switch_interval)
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            if self._stop.is_set():
+                break  # the watched thread is in stop(), not in the decision
+            names = []
+            while frame is not None:
+                code = frame.f_code
+                names.append(f"{code.co_name} ({os.path.basename(code.co_filename)}:{frame.f_lineno})")
+                frame = frame.f_back
+            if names:
+                stack = ';'.join(reversed(names))
+                self.stacks[stack] = self.stacks.get(stack, 0) + 1
+
+
+class SlowestProfiles:
+    """Profiles every decision and keeps the profiles of the `keep` slowest."""
+
+    def __init__(self, keep=10, mode='cprofile', sample_interval=0.001):
+        if mode not in ('cprofile', 'sample'):
+            raise ValueError(f"unknown profiler mode {mode!r}")
+        self.keep = keep
+        self.mode = mode
+        self.sample_interval = sample_interval
+        self.profiles = []  # min-heap of (seconds, sequence, label, profile data)
+        self._sequence = itertools.count()
+        self._lock = threading.Lock()
+
+    def start(self):
+        if self.mode == 'cprofile':
+            profiler = cProfile.Profile()
+            profiler.enable()
+        else:
+            profiler = StackSampler(threading.get_ident(), self.sample_interval)
+            profiler.start()
+        return profiler
+
+    def discard(self, profiler):
+        if self.mode == 'cprofile':
+            profiler.disable()
+        else:
+            profiler.stop()
+
+    def stop(self, profiler, seconds, label):
+        self.discard(profiler)
+        with self._lock:
+            if len(self.profiles) >= self.keep and seconds <= self.profiles[0][0]:
+                return
+        data = self._data(profiler)
+        with self._lock:
+            entry = (seconds, next(self._sequence), label, data)
+            if len(self.profiles) < self.keep:
+                heapq.heappush(self.profiles, entry)
+            elif seconds > self.profiles[0][0]:
+                heapq.heapreplace(self.profiles, entry)
+
+    def _data(self, profiler):
+        if self.mode == 'cprofile':
+            profiler.create_stats()
+            return profiler.stats  # the dict pstats reads back; plain data, so it pickles
+        return dict(profiler.stacks)
+
+    def merge(self, other):
+        for seconds, _, label, data in other.profiles:
+            entry = (seconds, next(self._sequence), label, data)
+            if len(self.profiles) < self.keep:
+                heapq.heappush(self.profiles, entry)
+            elif seconds > self.profiles[0][0]:
+                heapq.heapreplace(self.profiles, entry)
+        return self
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        del state['_lock'], state['_sequence']
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+        self._sequence = itertools.count(len(self.profiles))
+
+    def dump(self, directory):
+        """Write the kept profiles, slowest first, to directory; returns the paths."""
+        os.makedirs(directory, exist_ok=True)
+        paths = []
+        for rank, (seconds, _, label, data) in enumerate(sorted(self.profiles, reverse=True), 1):
+            name = f"{rank:02d}_{label}_{seconds * 1000:.0f}ms"
+            if self.mode == 'cprofile':
+                path = os.path.join(directory, name + '.prof')
+                with open(path, 'wb') as f:
+                    marshal.dump(data, f)
+            else:
+                path = os.path.join(directory, name + '.folded')
+                with open(path, 'w') as f:
+                    for stack, count in sorted(data.items()):
+                        f.write(f"{stack} {count}\n")
+            paths.append(path)
+        return paths
+
+
+def agent_label(agent):
+    return type(agent).__name__.replace('Agent', '')
+
+
+def instrument(agent, stats, profiles=None):
+    """Time (and optionally profile) every decide_action of this agent instance.
+
+    Decisions abandoned with SearchCancelled are not recorded. Returns the agent.
+    """
+    decide_action = agent.decide_action
+    name = agent_label(agent)
+
+    def timed_decide_action(game_state, valid_actions):
+        round_number = game_state.round_number
+        hand_size = len(game_state.players[agent.player_id].hand)
+        profiler = profiles.start() if profiles is not None else None
+        start = time.perf_counter()
+        try:
+            action = decide_action(game_state, valid_actions)
+        except SearchCancelled:
+            if profiler is not None:
+                profiles.discard(profiler)
+            raise
+        seconds = time.perf_counter() - start
+        stats.record(name, round_number, hand_size, seconds)
+        if profiler is not None:
+            profiles.stop(profiler, seconds, f"{name}_r{round_number}_h{hand_size}")
+        return action
+
+    agent.decide_action = timed_decide_action
+    return agent
@@ -0,0 +1,223 @@
+"""MinimaxAgent's leaf evaluation over a compact encoding of the position.
+
+encode_position() reduces a GameState to the round number and twelve integers per player,
+gathered in one pass over each hand and board:
+
+    STRENGTH        board strength (debuffed cards count 1)
+    PASSED          1 if the player passed this round
+    ROUNDS_WON
+    HAND            cards in hand
+    HAND_STRENGTH   total strength of the unit cards in hand
+    HAND_HIGH       unit cards in hand of strength 7 or more
+    HAND_SCORCH     scorch cards in hand
+    HAND_DEBUFF     row debuff cards in hand
+    BOARD           cards on the board
+    BOARD_MAX       strongest current strength on the board (0 if empty)
+    BOARD_MAX_COUNT cards on the board at that strength
+    BOARD_DEBUFFED  debuffed cards on the board
+
+Every term of the heuristic is a function of these numbers. evaluate() scores one
+encoding, and evaluate_batch() scores many at once as NumPy column operations. Both give
+exactly the values of the original card-by-card evaluation. NumPy is imported only by
+evaluate_batch().
+"""
+from utils import constants
+
+STRENGTH, PASSED, ROUNDS_WON, HAND, HAND_STRENGTH, HAND_HIGH, HAND_SCORCH, HAND_DEBUFF, \
+    BOARD, BOARD_MAX, BOARD_MAX_COUNT, BOARD_DEBUFFED = range(12)
+SIDE_SIZE = 12
+ROW_SIZE = 1 + 2 * SIDE_SIZE  # a flat encoding: round number, player 0's side, player 1's side
+
+HIGH_CARD_STRENGTH = 7
+STRONG_SCORCH_TARGET = 8
+WEAK_HAND_AVERAGE = 4
+
+# (unit strength, high card, scorch, debuff) each card adds to its hand's aggregates
+_HAND_TERMS = {card_id: (strength, int(strength >= HIGH_CARD_STRENGTH), 0, 0)
+               for card_id, strength in zip(constants.CARD_POOL, constants.CARD_STRENGTHS)}
+_HAND_TERMS[-1] = (0, 0, 0, 1)
+_HAND_TERMS[-2] = (0, 0, 1, 0)
+
+
+def encode_side(player):
+    hand_strength = high = scorch = debuff = 0
+    for card in player.hand:
+        card_strength, card_high, card_scorch, card_debuff = _HAND_TERMS[card.id]
+        hand_strength += card_strength
+        high += card_high
+        scorch += card_scorch
+        debuff += card_debuff
+
+    strength = count = top = top_count = debuffed = 0
+    for cards in player.board.values():
+        for card in cards:
+            if card.is_debuffed:
+                debuffed += 1
+                value = 1
+            else:
+                value = card.strength
+            strength += value
+            count += 1
+            if value > top:
+                top = value
+                top_count = 1
+            elif value == top:
+                top_count += 1
+
+    return (strength, int(player.passed), player.rounds_won, len(player.hand), hand_strength, high,
+            scorch, debuff, count, top, top_count, debuffed)
+
+
+def encode_position(game_state):
+    """(round number, player 0's side, player 1's side)."""
+    return game_state.round_number, encode_side(game_state.players[0]), encode_side(game_state.players[1])
+
+
+def flatten(encoded):
+    round_number, side0, side1 = encoded
+    return (round_number, *side0, *side1)
+
+
+def evaluate(encoded, player_id, p):
+    """Heuristic value of an encoded position for player_id under the weights p."""
+    round_number = encoded[0]
+    me = encoded[1 + player_id]
+    opp = encoded[2 - player_id]
+    score = 0
+
+    # 1. Rounds won difference
+    rounds_diff = me[ROUNDS_WON] - opp[ROUNDS_WON]
+    if rounds_diff >= 1:
+        score += p['rounds_lead']
+    elif rounds_diff <= -1:
+        score -= p['rounds_lead']
+
+    # 2. Current round
+    strength_diff = me[STRENGTH] - opp[STRENGTH]
+    my_passed = me[PASSED]
+    if my_passed and opp[PASSED]:
+        if strength_diff > 0:
+            score += p['round_decided']
+        elif strength_diff < 0:
+            score -= p['round_decided']
+    elif my_passed:
+        if strength_diff > 0:
+            if strength_diff > 5:
+                score += p['passed_safe_lead']
+            elif strength_diff > 2:
+                score += p['passed_comfortable_lead']
+            else:
+                score += p['passed_risky_lead']
+            score += me[HAND] * p['passed_card_bonus']
+        else:
+            score -= p['passed_behind']
+            score -= abs(strength_diff) * p['passed_behind_per_point']
+    elif opp[PASSED]:
+        if strength_diff < 0:
+            if me[HAND_STRENGTH] > -strength_diff:
+                score += p['can_catch_up']
+            else:
+                score -= p['cannot_catch_up']
+        else:
+            score += p['opp_passed_ahead']
+    else:
+        score += strength_diff * p['strength_diff']
+
+    # 3. Card advantage
+    hand_diff = me[HAND] - opp[HAND]
+    if round_number == 1:
+        score += hand_diff * p['hand_diff_round1']
+    elif round_number == 2:
+        score += hand_diff * p['hand_diff_round2']
+    else:
+        score += hand_diff * p['hand_diff_round3']
+
+    # 4. Card quality
+    score += (me[HAND_STRENGTH] - opp[HAND_STRENGTH]) * p['hand_strength']
+    score += (me[HAND_HIGH] - opp[HAND_HIGH]) * p['high_cards']
+
+    # 5. Special cards
+    my_scorch = me[HAND_SCORCH]
+    opp_scorch = opp[HAND_SCORCH]
+    if my_scorch > 0 and opp[BOARD] > 0:
+        if opp[BOARD_MAX] >= STRONG_SCORCH_TARGET:
+            score += my_scorch * p['scorch_strong_target']
+        else:
+            score += my_scorch * p['scorch_weak_target']
+    score += me[HAND_DEBUFF] * p['my_debuff']
+    score -= opp_scorch * p['opp_scorch']
+    score -= opp[HAND_DEBUFF] * p['opp_debuff']
+
+    # 6. Debuffed cards on the board
+    score -= me[BOARD_DEBUFFED] * p['debuffed_card']
+    score += opp[BOARD_DEBUFFED] * p['debuffed_card']
+
+    # 7. Scorch vulnerability: my cards at the strongest strength on the whole board
+    if opp_scorch > 0 and me[BOARD] and me[BOARD_MAX] >= opp[BOARD_MAX]:
+        score -= me[BOARD_MAX_COUNT] * p['scorch_vulnerable']
+
+    # 8. Weak hand
+    if not my_passed and me[HAND] > 0:
+        if me[HAND_STRENGTH] / max(me[HAND] - my_scorch - me[HAND_DEBUFF], 1) < WEAK_HAND_AVERAGE:
+            score -= p['weak_hand']
+
+    return score
+
+
+def evaluate_batch(rows, player_id, p):
+    """Values of many positions at once.
+
+    rows is an (n, ROW_SIZE) array, or a sequence of flatten()ed encodings; returns an
+    array of n float64 values equal to evaluate() of each.
+    """
+    import numpy as np
+    rows = np.asarray(rows, dtype=np.int64).reshape(-1, ROW_SIZE)
+    round_number = rows[:, 0]
+    me = rows[:, 1 + player_id * SIDE_SIZE:1 + (player_id + 1) * SIDE_SIZE]
+    opp = rows[:, 1 + (1 - player_id) * SIDE_SIZE:1 + (2 - player_id) * SIDE_SIZE]
+    score = np.zeros(len(rows), dtype=np.float64)
+
+    rounds_diff = me[:, ROUNDS_WON] - opp[:, ROUNDS_WON]
+    score += np.sign(rounds_diff) * p['rounds_lead']
+
+    strength_diff = me[:, STRENGTH] - opp[:, STRENGTH]
+    my_passed = me[:, PASSED] != 0
+    opp_passed = opp[:, PASSED] != 0
+    lead_bonus = np.select([strength_diff > 5, strength_diff > 2],
+                           [p['passed_safe_lead'], p['passed_comfortable_lead']], p['passed_risky_lead'])
+    i_passed_value = np.where(
+        strength_diff > 0,
+        lead_bonus + me[:, HAND] * p['passed_card_bonus'],
+        -p['passed_behind'] - np.abs(strength_diff) * p['passed_behind_per_point'])
+    catch_up = np.where(me[:, HAND_STRENGTH] > -strength_diff, p['can_catch_up'], -p['cannot_catch_up'])
+    opp_passed_value = np.where(strength_diff < 0, catch_up, p['opp_passed_ahead'])
+    score += np.select(
+        [my_passed & opp_passed, my_passed, opp_passed],
+        [np.sign(strength_diff) * p['round_decided'], i_passed_value, opp_passed_value],
+        strength_diff * p['strength_diff'])
+
+    hand_diff_weight = np.select([round_number == 1, round_number == 2],
+                                 [p['hand_diff_round1'], p['hand_diff_round2']], p['hand_diff_round3'])
+    score += (me[:, HAND] - opp[:, HAND]) * hand_diff_weight
+
+    score += (me[:, HAND_STRENGTH] - opp[:, HAND_STRENGTH]) * p['hand_strength']
+    score += (me[:, HAND_HIGH] - opp[:, HAND_HIGH]) * p['high_cards']
+
+    my_scorch = me[:, HAND_SCORCH]
+    opp_scorch = opp[:, HAND_SCORCH]
+    scorch_target = np.where(opp[:, BOARD_MAX] >= STRONG_SCORCH_TARGET,
+                             p['scorch_strong_target'], p['scorch_weak_target'])
+    score += np.where((my_scorch > 0) & (opp[:, BOARD] > 0), my_scorch * scorch_target, 0)
+    score += me[:, HAND_DEBUFF] * p['my_debuff']
+    score -= opp_scorch * p['opp_scorch']
+    score -= opp[:, HAND_DEBUFF] * p['opp_debuff']
+
+    score += (opp[:, BOARD_DEBUFFED] - me[:, BOARD_DEBUFFED]) * p['debuffed_card']
+
+    vulnerable = (opp_scorch > 0) & (me[:, BOARD] > 0) & (me[:, BOARD_MAX] >= opp[:, BOARD_MAX])
+    score -= np.where(vulnerable, me[:, BOARD_MAX_COUNT] * p['scorch_vulnerable'], 0)
+
+    units = np.maximum(me[:, HAND] - my_scorch - me[:, HAND_DEBUFF], 1)
+    weak = ~my_passed & (me[:, HAND] > 0) & (me[:, HAND_STRENGTH] / units < WEAK_HAND_AVERAGE)
+    score -= np.where(weak, p['weak_hand'], 0)
+    return score
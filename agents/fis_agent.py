@@ -1,11 +1,34 @@
-import numpy as np
 from agents.base_agent import BaseAgent
 from core.action import Action
-import random
+import math
 
 class FISAgent(BaseAgent):
-    def __init__(self, player_id):
-        super().__init__(player_id)
+    # Breakpoints of the input and output membership functions (trimf: a, b, c; trapmf: a, b, c, d)
+    DEFAULT_PARAMS = {
+        'sd_losing_badly': (-100, -100, -30, -15),
+        'sd_losing': (-25, -10, 0),
+        'sd_tied': (-5, 0, 5),
+        'sd_winning': (0, 10, 25),
+        'sd_winning_big': (15, 30, 100, 100),
+        'cih_very_few': (0, 0, 1, 3),
+        'cih_few': (2, 4, 6),
+        'cih_moderate': (5, 7, 9),
+        'cih_many': (8, 10, 12, 12),
+        'oc_very_few': (0, 0, 1, 3),
+        'oc_many': (8, 10, 12, 12),
+        'out_very_defensive': (0, 0, 10, 25),
+        'out_defensive': (15, 30, 45),
+        'out_balanced': (35, 50, 65),
+        'out_aggressive': (55, 70, 85),
+        'out_very_aggressive': (75, 90, 100, 100),
+    }
+    
+    def __init__(self, player_id, params=None, rng=None):
+        super().__init__(player_id, rng)
+        self.params = dict(self.DEFAULT_PARAMS)
+        if params:
+            self.params.update(params)
+        self._output_memberships = {}
     
     def decide_action(self, game_state, valid_actions):
         if len(valid_actions) == 1:
@@ -44,18 +67,20 @@ class FISAgent(BaseAgent):
         
         # Step 1: FUZZIFICATION - Compute membership values for each input
         
+        p = self.params
+        
         # Strength Difference memberships
-        sd_losing_badly = self._trapmf(strength_diff, -100, -100, -30, -15)
-        sd_losing = self._trimf(strength_diff, -25, -10, 0)
-        sd_tied = self._trimf(strength_diff, -5, 0, 5)
-        sd_winning = self._trimf(strength_diff, 0, 10, 25)
-        sd_winning_big = self._trapmf(strength_diff, 15, 30, 100, 100)
+        sd_losing_badly = self._trapmf(strength_diff, *p['sd_losing_badly'])
+        sd_losing = self._trimf(strength_diff, *p['sd_losing'])
+        sd_tied = self._trimf(strength_diff, *p['sd_tied'])
+        sd_winning = self._trimf(strength_diff, *p['sd_winning'])
+        sd_winning_big = self._trapmf(strength_diff, *p['sd_winning_big'])
         
         # Cards in Hand memberships
-        cih_very_few = self._trapmf(cards_in_hand, 0, 0, 1, 3)
-        cih_few = self._trimf(cards_in_hand, 2, 4, 6)
-        cih_moderate = self._trimf(cards_in_hand, 5, 7, 9)
-        cih_many = self._trapmf(cards_in_hand, 8, 10, 12, 12)
+        cih_very_few = self._trapmf(cards_in_hand, *p['cih_very_few'])
+        cih_few = self._trimf(cards_in_hand, *p['cih_few'])
+        cih_moderate = self._trimf(cards_in_hand, *p['cih_moderate'])
+        cih_many = self._trapmf(cards_in_hand, *p['cih_many'])
         
         # Round Number memberships
         rn_early = self._trimf(round_num, 1, 1, 2)
@@ -68,11 +93,11 @@ class FISAgent(BaseAgent):
         rd_ahead = self._trimf(rounds_diff, 0, 1, 2)
         
         # Opponent Cards memberships
-        oc_very_few = self._trapmf(opp_cards, 0, 0, 1, 3)
+        oc_very_few = self._trapmf(opp_cards, *p['oc_very_few'])
         # Note: oc_few and oc_moderate are defined for completeness but not used in current rules
         # oc_few = self._trimf(opp_cards, 2, 4, 6)
         # oc_moderate = self._trimf(opp_cards, 5, 7, 9)
-        oc_many = self._trapmf(opp_cards, 8, 10, 12, 12)
+        oc_many = self._trapmf(opp_cards, *p['oc_many'])
         
         # Step 2: RULE EVALUATION
         # Each rule produces an activation level and maps to an output membership function
@@ -237,11 +262,11 @@ class FISAgent(BaseAgent):
         # Step 3: AGGREGATION AND DEFUZZIFICATION
         # Use centroid method (center of gravity)
         
-        # Define output universe (0 to 100)
-        output_universe = np.arange(0, 101, 1)
+        # Define output universe (0 to 100); 101 points are cheaper as plain lists than NumPy arrays
+        output_universe = range(0, 101)
         
         # Initialize aggregated membership array
-        aggregated_membership = np.zeros_like(output_universe, dtype=float)
+        aggregated_membership = [0.0] * len(output_universe)
         
         # For each rule activation, apply it to the corresponding output membership function
         for activation, output_label in rule_activations:
@@ -249,15 +274,14 @@ class FISAgent(BaseAgent):
                 # Get the membership function for this output
                 output_mf = self._get_output_membership(output_universe, output_label)
                 
-                # Apply activation level (clip the membership function)
-                clipped_mf = np.minimum(activation, output_mf)
-                
-                # Aggregate using max operator
-                aggregated_membership = np.maximum(aggregated_membership, clipped_mf)
+                # Clip the membership function at the activation level and aggregate using max
+                aggregated_membership = [max(agg, min(activation, mf))
+                                         for agg, mf in zip(aggregated_membership, output_mf)]
         
         # Defuzzification using centroid method
-        if np.sum(aggregated_membership) > 0:
-            aggression_level = np.sum(output_universe * aggregated_membership) / np.sum(aggregated_membership)
+        total_membership = math.fsum(aggregated_membership)
+        if total_membership > 0:
+            aggression_level = math.fsum(x * m for x, m in zip(output_universe, aggregated_membership)) / total_membership
         else:
             # If no rules fired, default to balanced
             aggression_level = 50
@@ -295,20 +319,14 @@ class FISAgent(BaseAgent):
             return 0.0
     
     def _get_output_membership(self, universe, label):
-        membership = np.zeros_like(universe, dtype=float)
-        
-        for i, x in enumerate(universe):
-            if label == 'very_defensive':
-                membership[i] = self._trapmf(x, 0, 0, 10, 25)
-            elif label == 'defensive':
-                membership[i] = self._trimf(x, 15, 30, 45)
-            elif label == 'balanced':
-                membership[i] = self._trimf(x, 35, 50, 65)
-            elif label == 'aggressive':
-                membership[i] = self._trimf(x, 55, 70, 85)
-            elif label == 'very_aggressive':
-                membership[i] = self._trapmf(x, 75, 90, 100, 100)
-        
+        # Output membership functions only depend on the parameters, so sample each one once
+        key = (label, universe)
+        membership = self._output_memberships.get(key)
+        if membership is None:
+            breakpoints = self.params['out_' + label]
+            mf = self._trapmf if len(breakpoints) == 4 else self._trimf
+            membership = [float(mf(x, *breakpoints)) for x in universe]
+            self._output_memberships[key] = membership
         return membership
     
     def _select_action_by_aggression(self, game_state, valid_actions, aggression_level):
@@ -337,7 +355,7 @@ class FISAgent(BaseAgent):
             if unit_actions:
                 sorted_units = sorted(unit_actions, key=lambda a: a.card.strength)
                 defensive_cards = sorted_units[:max(1, len(sorted_units) * 2 // 5)]
-                return random.choice(defensive_cards)
+                return self.rng.choice(defensive_cards)
             return pass_action[0] if pass_action else valid_actions[0]
         
         # BALANCED (40-60): Play medium cards
@@ -348,8 +366,8 @@ class FISAgent(BaseAgent):
                 mid_end = len(sorted_units) * 7 // 10
                 if mid_end > mid_start:
                     balanced_cards = sorted_units[mid_start:mid_end]
-                    return random.choice(balanced_cards)
-                return random.choice(unit_actions)
+                    return self.rng.choice(balanced_cards)
+                return self.rng.choice(unit_actions)
             return pass_action[0] if pass_action else valid_actions[0]
         
         # AGGRESSIVE (60-80): Play high cards, consider row debuff
@@ -372,7 +390,7 @@ class FISAgent(BaseAgent):
             if unit_actions:
                 sorted_units = sorted(unit_actions, key=lambda a: a.card.strength, reverse=True)
                 aggressive_cards = sorted_units[:max(1, len(sorted_units) * 2 // 5)]
-                return random.choice(aggressive_cards)
+                return self.rng.choice(aggressive_cards)
             
             return pass_action[0] if pass_action else valid_actions[0]
         
@@ -400,6 +418,6 @@ class FISAgent(BaseAgent):
                 return strongest
             
             if special_actions:
-                return random.choice(special_actions)
+                return self.rng.choice(special_actions)
             
             return pass_action[0] if pass_action else valid_actions[0]
@@ -1,13 +1,102 @@
 import math
 from agents.base_agent import BaseAgent
+from agents.evaluation import encode_position, evaluate, evaluate_batch, flatten
+from agents.proof_search import DRAW, LOSS, WIN, ProofSearch
+from agents.transposition import EXACT, LOWER, UPPER, position_key, table_key
 from core.action import Action
 from core.game_engine import GameEngine
+from core.match_log import decode_action
+
+# A bound on a value is the opposite bound on its negation
+_NEGATED_FLAG = {EXACT: EXACT, LOWER: UPPER, UPPER: LOWER}
+
+# Values of proven outcomes, on the scale of _terminal; stored in the table at the
+# deepest depth, as no search can improve on them
+_PROVEN_VALUE = {WIN: 10000, DRAW: 0, LOSS: -10000}
+PROVEN_DEPTH = 0xff
+
+
+def _play(game_state, action):
+    """The state after action, played on a clone of game_state.
+
+    The engine only moves cards it finds in the hand by identity, so the action is
+    rebuilt around the clone's own card of the same id.
+    """
+    new_state = game_state.clone()
+    if action.card is not None:
+        hand = new_state.players[new_state.current_player].hand
+        card = next(card for card in hand if card.id == action.card.id)
+        action = Action(action.type, card, action.target_row)
+    GameEngine(new_state).execute_action(action)
+    return new_state
+
 
 class MinimaxAgent(BaseAgent):
-    def __init__(self, player_id, max_depth=6):
-        super().__init__(player_id)
+    # Weights of the heuristic terms in _utility (overridable per agent, e.g. by tools/tune.py)
+    DEFAULT_PARAMS = {
+        'rounds_lead': 5000,
+        'round_decided': 2000,
+        'passed_safe_lead': 800,
+        'passed_comfortable_lead': 400,
+        'passed_risky_lead': 100,
+        'passed_card_bonus': 50,
+        'passed_behind': 1000,
+        'passed_behind_per_point': 20,
+        'can_catch_up': 300,
+        'cannot_catch_up': 200,
+        'opp_passed_ahead': 500,
+        'strength_diff': 30,
+        'hand_diff_round1': 60,
+        'hand_diff_round2': 80,
+        'hand_diff_round3': 40,
+        'hand_strength': 8,
+        'high_cards': 25,
+        'scorch_strong_target': 150,
+        'scorch_weak_target': 50,
+        'my_debuff': 60,
+        'opp_scorch': 100,
+        'opp_debuff': 60,
+        'debuffed_card': 30,
+        'scorch_vulnerable': 80,
+        'weak_hand': 50,
+    }
+    
+    def __init__(self, player_id, max_depth=6, params=None, rng=None, tt=None, book=None, batch_leaves=False,
+                 aspiration=None, proof_budget=0, proof_round=2):
+        super().__init__(player_id, rng)
         self.max_depth = max_depth
         self.nodes_explored = 0
+        self.params = dict(self.DEFAULT_PARAMS)
+        if params:
+            self.params.update(params)
+        # Optional agents.transposition.TranspositionTable, possibly shared with other agents
+        # and processes; values depend on the seat and the weights, so both go into the key
+        # (the weights only, as str hashes differ between processes)
+        self.tt = tt
+        self._tt_salt = hash((self.player_id, tuple(value for _, value in sorted(self.params.items()))))
+        # Optional agents.opening_book.OpeningBook consulted before searching
+        self.book = book
+        # Score all the leaves below a depth-1 node in one NumPy call instead of one by one;
+        # the decisions are the same, it only pays off with wide nodes
+        self.batch_leaves = batch_leaves
+        # Half-width of the aspiration window: when set, the agent deepens iteratively and
+        # searches each depth in a window around the previous depth's value
+        self.aspiration = aspiration
+        # From round proof_round on, try to solve the position exactly with df-pn (at most
+        # proof_budget expanded nodes per decision) before searching heuristically. A proven
+        # win or draw is played at once; otherwise root moves proven exactly take their
+        # outcome as value, and the others are ordered by what the proof settled about them
+        self.prover = ProofSearch(proof_budget) if proof_budget else None
+        self.proof_round = proof_round
+        self._proven = {}  # root action -> exact value proven by the last proof
+    
+    def config(self):
+        """The constructor arguments that shape the agent's decisions, picklable, to build
+        the same agent in another process (its table, book and rng are not included)."""
+        return {'max_depth': self.max_depth, 'params': dict(self.params),
+                'batch_leaves': self.batch_leaves, 'aspiration': self.aspiration,
+                'proof_budget': self.prover.node_budget if self.prover else 0,
+                'proof_round': self.proof_round}
     
     def decide_action(self, game_state, valid_actions):
         if len(valid_actions) == 1:
@@ -15,6 +104,19 @@ class MinimaxAgent(BaseAgent):
         
         self.nodes_explored = 0
         
+        if self.book is not None:
+            action = self.book.lookup(game_state, self._tt_salt, valid_actions)
+            if action is not None:
+                return action
+        
+        outcome = None
+        proving = self.prover is not None and game_state.round_number >= self.proof_round
+        if proving:
+            outcome, code = self.prover.solve(game_state, self.player_id, self.check_stop)
+            if code is not None:
+                # A proven win, or a proven draw where no win exists: no search can do better
+                return decode_action(code, valid_actions)
+        
         # Filter out PASS from initial consideration if we have other options
         non_pass_actions = [a for a in valid_actions if a.type != Action.PASS]
         
@@ -22,105 +124,218 @@ class MinimaxAgent(BaseAgent):
         if not non_pass_actions:
             return valid_actions[0]
         
+        # Simulate each action once; every iteration searches below the same children
+        children = self._order([(action, _play(game_state, action)) for action in non_pass_actions], 1)
+        
+        self._proven = {}
+        if proving and outcome != LOSS:
+            # In a proven loss every move loses, and the heuristic keeps its preference for
+            # the ones that leave the opponent room to go wrong
+            children = self._seed_proven(children)
+        
+        if self.aspiration is None:
+            _, best_action = self._search_root(children, self.max_depth, -math.inf, math.inf)
+            return best_action
+        
+        # Iterative deepening, each iteration searched in a window around the last one's
+        # value and re-searched in full if the value falls outside it
+        value, best_action = self._search_root(children, 1, -math.inf, math.inf)
+        for depth in range(2, self.max_depth + 1):
+            # The previous best move goes first, as the principal variation
+            children.sort(key=lambda child: child[0] is not best_action)
+            alpha = value - self.aspiration
+            beta = value + self.aspiration
+            value, best_action = self._search_root(children, depth, alpha, beta)
+            if value <= alpha or value >= beta:
+                value, best_action = self._search_root(children, depth, -math.inf, math.inf)
+        return best_action
+    
+    def _seed_proven(self, children):
+        """Use what the proof settled about the root moves; returns the children reordered.
+
+        A move proven exactly takes its outcome, on the scale of _terminal, as its value,
+        which also goes into the transposition table for later searches. Bounds that are
+        not exact are not values: a heuristic value clamped into them would be compared
+        on the wrong scale. They only order the moves, so the search starts with the
+        ones proven not to lose.
+        """
+        bounds = {}
+        for action, new_state in children:
+            if new_state.game_over:
+                continue
+            lower, upper = bounds[action] = self.prover.bounds(new_state, self.player_id)
+            if lower != upper:
+                continue
+            self._proven[action] = _PROVEN_VALUE[lower]
+            if self.tt is not None:
+                is_maximizing = new_state.current_player == self.player_id
+                self.tt.store(table_key(position_key(new_state), is_maximizing, self._tt_salt),
+                              PROVEN_DEPTH, EXACT, _PROVEN_VALUE[lower])
+        # Stable, so moves the proof says nothing about keep their static order
+        return sorted(children, key=lambda child: bounds.get(child[0], (LOSS, WIN)), reverse=True)
+    
+    def _search_root(self, children, depth, alpha, beta):
+        """(value, best action) of a depth-`depth` search of the root within (alpha, beta)."""
         best_action = None
         best_value = -math.inf
-        alpha = -math.inf
-        beta = math.inf
         
-        # Evaluate each possible action
-        for action in non_pass_actions:
-            # Create a copy of the game state and simulate the action
-            new_state = game_state.clone()
-            new_engine = GameEngine(new_state)
-            new_engine.execute_action(action)
-            
+        for action, new_state in children:
             # If game ended after this action, evaluate terminal state
             if new_state.game_over:
                 value = self._terminal(new_state)
+            elif action in self._proven:
+                value = self._proven[action]
+            elif best_action is None:
+                value = self._child(new_state, depth - 1, alpha, beta, True)
             else:
-                # Otherwise, use minimax to evaluate
-                value = self._minimax(new_state, self.max_depth - 1, alpha, beta, False)
+                # Principal variation search: a null window only asks whether this action
+                # beats the best so far, and a full search follows only if it does
+                value = self._child(new_state, depth - 1, alpha, alpha + 1, True)
+                if alpha < value < beta:
+                    value = self._child(new_state, depth - 1, alpha, beta, True)
             
             if value > best_value:
                 best_value = value
                 best_action = action
             
             alpha = max(alpha, value)
+            if alpha >= beta:
+                break
         
-        # If no action was selected (shouldn't happen), pass
-        if best_action is None:
-            return Action(Action.PASS)
-        
-        return best_action
+        return best_value, best_action
+    
+    def _child(self, new_state, depth, alpha, beta, is_maximizing):
+        """Value of new_state within the window (alpha, beta) of the side that moved into it
+        (this agent if is_maximizing)."""
+        if (new_state.current_player == self.player_id) == is_maximizing:
+            # The other side has passed, so the same side moves again
+            return self._minimax(new_state, depth, alpha, beta, is_maximizing)
+        return -self._minimax(new_state, depth, -beta, -alpha, not is_maximizing)
     
     def _minimax(self, game_state, depth, alpha, beta, is_maximizing):
+        """Negamax value of game_state for the side to move in the search (this agent if
+        is_maximizing, the opponent otherwise), within that side's window (alpha, beta)."""
+        tt = self.tt
+        if tt is None or depth == 0 or game_state.game_over:
+            return self._search(game_state, depth, alpha, beta, is_maximizing)
+        
+        # The table holds values from this agent's point of view, so the opponent's
+        # nodes negate them and swap lower and upper bounds
+        key = table_key(position_key(game_state), is_maximizing, self._tt_salt)
+        entry = tt.probe(key)
+        if entry is not None:
+            value, entry_depth, flag = entry
+            if entry_depth >= depth:
+                if not is_maximizing:
+                    value = -value
+                    flag = _NEGATED_FLAG[flag]
+                if flag == EXACT:
+                    return value
+                if flag == LOWER and value >= beta:
+                    return value
+                if flag == UPPER and value <= alpha:
+                    return value
+        
+        value = self._search(game_state, depth, alpha, beta, is_maximizing)
+        if value <= alpha:
+            flag = UPPER
+        elif value >= beta:
+            flag = LOWER
+        else:
+            flag = EXACT
+        if is_maximizing:
+            tt.store(key, depth, flag, value)
+        else:
+            tt.store(key, depth, _NEGATED_FLAG[flag], -value)
+        return value
+    
+    def _search(self, game_state, depth, alpha, beta, is_maximizing):
         self.nodes_explored += 1
+        self.check_stop()
+        sign = 1 if is_maximizing else -1
         
         # Terminal conditions
         if game_state.game_over:
-            return self._terminal(game_state)
+            return sign * self._terminal(game_state)
         
         if depth == 0:
-            return self._utility(game_state)
+            return sign * self._utility(game_state)
         
         engine = GameEngine(game_state)
         valid_actions = engine.get_valid_actions()
         
         # If only PASS is available, execute it and continue
         if len(valid_actions) == 1 and valid_actions[0].type == Action.PASS:
-            new_state = game_state.clone()
-            new_engine = GameEngine(new_state)
-            new_engine.execute_action(valid_actions[0])
+            new_state = _play(game_state, valid_actions[0])
             
             if new_state.game_over:
-                return self._terminal(new_state)
+                return sign * self._terminal(new_state)
             else:
-                return self._minimax(new_state, depth - 1, alpha, beta, not is_maximizing)
+                return self._child(new_state, depth - 1, alpha, beta, is_maximizing)
         
-        if is_maximizing:
-            max_eval = -math.inf
-            for action in valid_actions:
-                if action.type == Action.PASS and len(valid_actions) > 1:
-                    continue  # Skip PASS if we have other options
-                
-                new_state = game_state.clone()
-                new_engine = GameEngine(new_state)
-                new_engine.execute_action(action)
-                
-                if new_state.game_over:
-                    eval_score = self._terminal(new_state)
-                else:
-                    eval_score = self._minimax(new_state, depth - 1, alpha, beta, False)
-                
-                max_eval = max(max_eval, eval_score)
-                alpha = max(alpha, eval_score)
-                
-                if beta <= alpha:
-                    break  # Beta cutoff
-            
-            return max_eval
+        if depth == 1 and self.batch_leaves:
+            return self._search_leaves(game_state, valid_actions, sign)
+        
+        # Skip PASS if we have other options
+        actions = [action for action in valid_actions if action.type != Action.PASS or len(valid_actions) == 1]
+        if depth >= 2:
+            children = self._order([(action, _play(game_state, action)) for action in actions], sign)
         else:
-            min_eval = math.inf
-            for action in valid_actions:
-                if action.type == Action.PASS and len(valid_actions) > 1:
-                    continue  # Skip PASS if we have other options
-                
-                new_state = game_state.clone()
-                new_engine = GameEngine(new_state)
-                new_engine.execute_action(action)
-                
-                if new_state.game_over:
-                    eval_score = self._terminal(new_state)
-                else:
-                    eval_score = self._minimax(new_state, depth - 1, alpha, beta, True)
-                
-                min_eval = min(min_eval, eval_score)
-                beta = min(beta, eval_score)
-                
-                if beta <= alpha:
-                    break  # Alpha cutoff
+            # Moves into leaves are not worth ordering; they are played only until a cutoff
+            children = ((action, _play(game_state, action)) for action in actions)
+        
+        best_value = -math.inf
+        searched = False
+        for action, new_state in children:
+            if new_state.game_over:
+                value = sign * self._terminal(new_state)
+            elif not searched:
+                value = self._child(new_state, depth - 1, alpha, beta, is_maximizing)
+                searched = True
+            else:
+                # Null window first, full window only if the action beats alpha
+                value = self._child(new_state, depth - 1, alpha, alpha + 1, is_maximizing)
+                if alpha < value < beta:
+                    value = self._child(new_state, depth - 1, alpha, beta, is_maximizing)
+            
+            best_value = max(best_value, value)
+            alpha = max(alpha, value)
             
-            return min_eval
+            if alpha >= beta:
+                break  # Cutoff
+        
+        return best_value
+    
+    def _order(self, children, sign):
+        """children, (action, state) pairs, best first by their static value for the side to
+        move (sign 1 for this agent). PVS only pays off when the first move searched is best."""
+        def static_value(child):
+            new_state = child[1]
+            if new_state.game_over:
+                return sign * self._terminal(new_state)
+            return sign * self._utility(new_state)
+        return sorted(children, key=static_value, reverse=True)
+    
+    def _search_leaves(self, game_state, valid_actions, sign):
+        # Without cutoffs every child is scored; the value can only be tighter than
+        # alpha-beta's bound, so the moves chosen above do not change
+        values = []
+        leaves = []
+        for action in valid_actions:
+            if action.type == Action.PASS and len(valid_actions) > 1:
+                continue
+            
+            new_state = _play(game_state, action)
+            
+            if new_state.game_over:
+                values.append(self._terminal(new_state))
+            else:
+                leaves.append(flatten(encode_position(new_state)))
+        
+        self.nodes_explored += len(leaves)
+        if leaves:
+            values.extend(evaluate_batch(leaves, self.player_id, self.params).tolist())
+        return max(sign * value for value in values)
     
     def _terminal(self, game_state):
         if game_state.winner is None:
@@ -131,148 +346,4 @@ class MinimaxAgent(BaseAgent):
             return -10000
     
     def _utility(self, game_state):
-        my_state = game_state.players[self.player_id]
-        opp_state = game_state.players[1 - self.player_id]
-        
-        score = 0
-        
-        # 1. Rounds won difference (most important - exponential weight)
-        rounds_diff = my_state.rounds_won - opp_state.rounds_won
-        if rounds_diff >= 1:
-            score += 5000  # One round ahead is huge
-        elif rounds_diff <= -1:
-            score -= 5000  # One round behind is critical
-        
-        # 2. Current round evaluation
-        my_strength = my_state.get_board_strength()
-        opp_strength = opp_state.get_board_strength()
-        strength_diff = my_strength - opp_strength
-        
-        # Determine round status
-        both_passed = my_state.passed and opp_state.passed
-        i_passed = my_state.passed and not opp_state.passed
-        opp_passed = opp_state.passed and not my_state.passed
-        
-        if both_passed:
-            # Round is decided - this is critical
-            if strength_diff > 0:
-                score += 2000  # Winning this round
-            elif strength_diff < 0:
-                score -= 2000  # Losing this round
-            # Draw doesn't change score much
-        elif i_passed:
-            # I passed, opponent still playing
-            if strength_diff > 0:
-                # Ahead and conserving cards - good position
-                margin = strength_diff
-                if margin > 5:
-                    score += 800  # Safe lead
-                elif margin > 2:
-                    score += 400  # Comfortable lead
-                else:
-                    score += 100  # Risky lead
-                
-                # Extra bonus for card conservation
-                score += len(my_state.hand) * 50
-            else:
-                # Behind and passed - very bad
-                score -= 1000
-                score -= abs(strength_diff) * 20
-        elif opp_passed:
-            # Opponent passed, I'm still playing
-            if strength_diff < 0:
-                # Behind but can still play - opportunity to catch up
-                deficit = abs(strength_diff)
-                # Can I catch up with cards in hand?
-                my_max_potential = sum(c.strength for c in my_state.hand if c.card_type in [0, 1, 2])
-                if my_max_potential > deficit:
-                    score += 300  # Can potentially win
-                else:
-                    score -= 200  # Can't catch up, should conserve cards
-            else:
-                # Ahead and opponent passed - excellent position
-                score += 500
-        else:
-            # Both still playing - evaluate position
-            score += strength_diff * 30
-        
-        # 3. Card advantage (quality over quantity)
-        my_cards = len(my_state.hand)
-        opp_cards = len(opp_state.hand)
-        hand_diff = my_cards - opp_cards
-        
-        # Weight card advantage based on game state
-        if game_state.round_number == 1:
-            score += hand_diff * 60  # Cards very valuable early
-        elif game_state.round_number == 2:
-            score += hand_diff * 80  # Most critical in round 2
-        else:  # Round 3
-            score += hand_diff * 40  # Less important in final round
-        
-        # 4. Card quality evaluation
-        my_total_strength = sum(c.strength for c in my_state.hand if c.card_type in [0, 1, 2])
-        opp_total_strength = sum(c.strength for c in opp_state.hand if c.card_type in [0, 1, 2])
-        score += (my_total_strength - opp_total_strength) * 8
-        
-        # High-value cards (7+) are more flexible
-        my_high_cards = sum(1 for c in my_state.hand if c.card_type in [0, 1, 2] and c.strength >= 7)
-        opp_high_cards = sum(1 for c in opp_state.hand if c.card_type in [0, 1, 2] and c.strength >= 7)
-        score += (my_high_cards - opp_high_cards) * 25
-        
-        # 5. Special cards evaluation
-        my_scorch = sum(1 for c in my_state.hand if c.card_type == -2)
-        opp_scorch = sum(1 for c in opp_state.hand if c.card_type == -2)
-        my_debuff = sum(1 for c in my_state.hand if c.card_type == -1)
-        opp_debuff = sum(1 for c in opp_state.hand if c.card_type == -1)
-        
-        # Scorch is powerful when opponent has high cards on board
-        if my_scorch > 0:
-            opp_board_cards = sum(len(opp_state.board[row]) for row in ['melee', 'ranged', 'siege'])
-            if opp_board_cards > 0:
-                opp_max_strength = max(
-                    (c.get_current_strength() for row in ['melee', 'ranged', 'siege'] 
-                     for c in opp_state.board[row]),
-                    default=0
-                )
-                if opp_max_strength >= 8:
-                    score += my_scorch * 150  # Very valuable
-                else:
-                    score += my_scorch * 50
-        
-        # Debuff cards are valuable
-        score += my_debuff * 60
-        
-        # Opponent having special cards is a threat
-        score -= opp_scorch * 100
-        score -= opp_debuff * 60
-        
-        # 6. Board state analysis - check for debuffs
-        my_debuffed = sum(1 for row in ['melee', 'ranged', 'siege'] 
-                         for c in my_state.board[row] if c.is_debuffed)
-        opp_debuffed = sum(1 for row in ['melee', 'ranged', 'siege'] 
-                          for c in opp_state.board[row] if c.is_debuffed)
-        
-        score -= my_debuffed * 30  # Penalty for having debuffed cards
-        score += opp_debuffed * 30  # Bonus for opponent having debuffed cards
-        
-        # 7. Scorch vulnerability - penalty for having highest card on board
-        all_cards_on_board = []
-        for row in ['melee', 'ranged', 'siege']:
-            all_cards_on_board.extend(my_state.board[row])
-            all_cards_on_board.extend(opp_state.board[row])
-        
-        if all_cards_on_board and opp_scorch > 0:
-            max_strength = max(c.get_current_strength() for c in all_cards_on_board)
-            my_max_cards = [c for c in all_cards_on_board 
-                           if c in sum([my_state.board[r] for r in ['melee', 'ranged', 'siege']], [])
-                           and c.get_current_strength() == max_strength]
-            if my_max_cards:
-                score -= len(my_max_cards) * 80  # Vulnerable to scorch
-        
-        # 8. Strategic depth - penalize being forced to play weak cards
-        if not my_state.passed and my_cards > 0:
-            avg_card_strength = my_total_strength / max(my_cards - my_scorch - my_debuff, 1)
-            if avg_card_strength < 4:
-                score -= 50  # Stuck with weak cards
-        
-        return score
+        return evaluate(encode_position(game_state), self.player_id, self.params)
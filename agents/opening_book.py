@@ -0,0 +1,114 @@
+"""Opening book: MinimaxAgent's decisions for the first plies of round 1, precomputed per deal.
+
+Round 1 starts from one of only 3003 positions (the deal, with player 0 to move), and
+full hands make its first decisions the slowest of the game. tools/build_book.py walks
+every deal's first plies - every valid action of both players - searches each position
+where a decision is needed, and writes the chosen actions to a book file. An agent given
+the book plays a book move without searching.
+
+Entries are keyed by table_key(position_key(state), salt), where salt is the agent's
+transposition salt (its seat and weights), so an agent with other weights simply finds
+no entries. Book layout (little endian), entries sorted by key:
+
+    header   magic b'NGOB', version u16, key version u16, search depth u8, plies u8,
+             2 bytes zero, entry count u32, 4 bytes zero
+    entries  key u64, action code u8 (core.match_log.encode_action)
+"""
+import os
+import struct
+
+from agents.search_cache import KEY_VERSION
+from agents.transposition import position_key, table_key
+from core.action import Action
+from core.game_engine import GameEngine
+from core.game_state import GameState
+from core.match_log import decode_action, encode_action
+from core.replay import settle
+
+MAGIC = b'NGOB'
+VERSION = 2  # books up to version 1 hold moves of a search that played no cards
+_HEADER = struct.Struct('<4sHHBB2xI4x')
+_ENTRY = struct.Struct('<QB')
+
+
+def book_key(game_state, salt):
+    return table_key(position_key(game_state), salt)
+
+
+def book_positions(deal, plies):
+    """Every distinct position within `plies` actions of the start of a deal where the
+    player to move has a choice (dealt cards in any order give the same positions)."""
+    game_state = GameState()
+    game_state.initialize(deal)
+    frontier = [game_state]
+    seen = set()
+    for ply in range(plies):
+        next_frontier = []
+        for state in frontier:
+            game_engine = GameEngine(state)
+            settle(game_engine)
+            if state.game_over:
+                continue
+            key = position_key(state)
+            if key in seen:
+                continue
+            seen.add(key)
+            valid_actions = game_engine.get_valid_actions()
+            if len(valid_actions) > 1 and any(action.type != Action.PASS for action in valid_actions):
+                yield state
+            if ply + 1 < plies:
+                for action in valid_actions:
+                    child = state.clone()
+                    child_engine = GameEngine(child)
+                    # The action has to name the clone's own card objects to move them
+                    child_engine.execute_action(decode_action(encode_action(action), child_engine.get_valid_actions()))
+                    next_frontier.append(child)
+        frontier = next_frontier
+
+
+class OpeningBook:
+    def __init__(self, entries=None, depth=0, plies=0):
+        self.entries = entries if entries is not None else {}  # key -> action code
+        self.depth = depth
+        self.plies = plies
+        self.hits = 0
+
+    def __len__(self):
+        return len(self.entries)
+
+    def lookup(self, game_state, salt, valid_actions):
+        """The book action for this position among valid_actions, or None."""
+        code = self.entries.get(book_key(game_state, salt))
+        if code is None:
+            return None
+        try:
+            action = decode_action(code, valid_actions)
+        except ValueError:
+            return None  # a hash collision with a position the book does not cover
+        self.hits += 1
+        return action
+
+    def save(self, path):
+        tmp_path = path + '.tmp'
+        with open(tmp_path, 'wb') as f:
+            f.write(_HEADER.pack(MAGIC, VERSION, KEY_VERSION, self.depth, self.plies, len(self.entries)))
+            for key in sorted(self.entries):
+                f.write(_ENTRY.pack(key, self.entries[key]))
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path):
+        with open(path, 'rb') as f:
+            data = f.read()
+        try:
+            magic, version, key_version, depth, plies, count = _HEADER.unpack_from(data, 0)
+        except struct.error:
+            raise ValueError(f"{path} is not an opening book") from None
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"{path} is not a version {VERSION} opening book")
+        if key_version != KEY_VERSION:
+            raise ValueError(f"{path} was built with position key version {key_version}, not {KEY_VERSION}")
+        if len(data) != _HEADER.size + count * _ENTRY.size:
+            raise ValueError(f"{path} should hold {count} entries but is {len(data)} bytes")
+        entries = dict(_ENTRY.iter_unpack(memoryview(data)[_HEADER.size:]))
+        return cls(entries, depth, plies)
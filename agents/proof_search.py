@@ -0,0 +1,212 @@
+"""Depth-first proof-number search (df-pn) for exact endgame outcomes.
+
+ProofSearch answers whether a player can force a win, or at least a draw, from a
+position. It plays the real game: every valid action of both players, with round ends
+resolved as the game loop does. Alpha-beta has to search every reply to bound a move.
+df-pn instead always expands the node that is cheapest to prove or disprove: the one
+with the fewest unresolved leaves standing between it and an answer. A forced win
+usually needs one good move per turn, so the proof touches a small part of the tree.
+
+Each question is a separate proof: "the player wins" first, and "the player does not
+lose" only if the win is disproved. Together they give WIN, DRAW or LOSS, and the
+search stops with no answer once the call's node budget is spent. Proof and disproof
+numbers stay in a table across calls, so later positions of a game reuse earlier work.
+"""
+from core.game_engine import GameEngine
+from core.match_log import decode_action, encode_action
+from agents.transposition import position_key
+
+WIN = 1
+DRAW = 0
+LOSS = -1
+
+INFINITY = 1 << 30
+MAX_TABLE_SIZE = 1 << 20
+EPSILON = 1.25
+MAX_EXPANDED = 1 << 18  # positions whose children are remembered for re-expansion
+
+
+class BudgetExhausted(Exception):
+    pass
+
+
+def _play(game_state, code):
+    """The state after the action with this code, pending round ends resolved."""
+    child = game_state.clone()
+    child_engine = GameEngine(child)
+    # The action has to name the clone's own card objects to move them
+    child_engine.execute_action(decode_action(code, child_engine.get_valid_actions()))
+    while not child.game_over and child_engine.check_auto_end_round():
+        pass
+    return child
+
+
+def _children(game_state):
+    """(action code, resulting state) for every valid action."""
+    codes = [encode_action(action) for action in GameEngine(game_state).get_valid_actions()]
+    return [(code, _play(game_state, code)) for code in codes]
+
+
+def _move_count(game_state):
+    player = game_state.players[game_state.current_player]
+    if player.passed:
+        return 1
+    # Pass, one move per unit card or scorch, three per row debuff
+    return 1 + sum(3 if card.card_type == -1 else 1 for card in player.hand)
+
+
+class ProofSearch:
+    def __init__(self, node_budget=5000):
+        self.node_budget = node_budget
+        self.nodes = 0
+        self.table = {}  # (position key, player, goal) -> (proof number, disproof number)
+        self._check_stop = None
+        self._expanded = {}  # position key -> children (action codes and keys)
+
+    def solve(self, game_state, player_id, check_stop=None):
+        """(outcome, action code) for player_id to move in game_state.
+
+        outcome is WIN, DRAW or LOSS, or None if the budget ran out first. The action code
+        (core.match_log.encode_action) reaches a WIN or DRAW; it is None otherwise.
+        """
+        self._check_stop = check_stop
+        self.nodes = 0
+        if len(self.table) > MAX_TABLE_SIZE:
+            self.table.clear()
+        if len(self._expanded) >= MAX_EXPANDED:
+            self._expanded.clear()
+        win = self._prove(game_state, player_id, WIN)
+        if win is None:
+            return None, None
+        if win[0]:
+            return WIN, win[1]
+        draw = self._prove(game_state, player_id, DRAW)
+        if draw is None:
+            return None, None
+        if draw[0]:
+            return DRAW, draw[1]
+        return LOSS, None
+
+    def bounds(self, game_state, player_id):
+        """(lowest, highest) outcome for player_id in game_state that the table allows.
+
+        After solve() this covers what its proofs settled about the children, even when
+        the budget ran out before the root was decided: a child disproved as a win is at
+        most a draw.
+        """
+        lower, upper = LOSS, WIN
+        win = self._lookup(game_state, player_id, WIN)
+        if win[0] == 0:
+            lower = WIN
+        elif win[1] == 0:
+            upper = DRAW
+        draw = self._lookup(game_state, player_id, DRAW)
+        if draw[0] == 0:
+            lower = max(lower, DRAW)
+        elif draw[1] == 0:
+            upper = LOSS
+        return lower, upper
+
+    def _prove(self, game_state, player_id, goal):
+        """(True, action code) if player_id can force an outcome of at least goal, (False,
+        None) if not, or None if the node budget ran out."""
+        try:
+            proof, _ = self._mid(game_state, position_key(game_state), player_id, goal, INFINITY, INFINITY)
+        except BudgetExhausted:
+            return None
+        if proof != 0:
+            return False, None
+        for code, child in _children(game_state):
+            if self._lookup(child, player_id, goal)[0] == 0:
+                return True, code
+        return True, None
+
+    def _outcome(self, winner, player_id, goal):
+        """Numbers of a finished game."""
+        if winner is None:
+            reached = goal == DRAW
+        else:
+            reached = winner == player_id
+        return (0, INFINITY) if reached else (INFINITY, 0)
+
+    def _lookup(self, game_state, player_id, goal):
+        if game_state.game_over:
+            return self._outcome(game_state.winner, player_id, goal)
+        return self.table.get((position_key(game_state), player_id, goal), (1, 1))
+
+    def _expand(self, game_state, key, player_id, goal):
+        """Children as (position key, numbers before the child is searched, action code).
+
+        A finished game's key is None and its numbers are final. Otherwise they start from
+        the child's move count: the more moves the side to move has, the more work it takes
+        to refute all of them, and the less to find one that works. Only codes and keys are
+        kept for positions expanded before, and the child searched next is played again.
+        """
+        children = self._expanded.get(key)
+        if children is None:
+            children = []
+            for code, child in _children(game_state):
+                if child.game_over:
+                    children.append((code, None, child.winner, 0))
+                else:
+                    children.append((code, position_key(child), child.current_player, _move_count(child)))
+            self._expanded[key] = children
+        expanded = []
+        for code, child_key, player, moves in children:
+            if child_key is None:
+                expanded.append((None, self._outcome(player, player_id, goal), code))
+            elif player == player_id:
+                expanded.append((child_key, (1, moves), code))
+            else:
+                expanded.append((child_key, (moves, 1), code))
+        return expanded
+
+    def _mid(self, game_state, key, player_id, goal, proof_threshold, disproof_threshold):
+        """Expand game_state until its proof number reaches proof_threshold or its
+        disproof number reaches disproof_threshold; returns both numbers."""
+        self.nodes += 1
+        if self.nodes > self.node_budget:
+            raise BudgetExhausted()
+        if self._check_stop is not None:
+            self._check_stop()
+
+        children = self._expand(game_state, key, player_id, goal)
+        table = self.table
+        or_node = game_state.current_player == player_id
+        while True:
+            numbers = [initial if child_key is None else table.get((child_key, player_id, goal), initial)
+                       for child_key, initial, _ in children]
+            if or_node:
+                # The player needs one child proved, the opponent must disprove them all
+                proof = min(p for p, _ in numbers)
+                disproof = min(INFINITY, sum(d for _, d in numbers))
+            else:
+                proof = min(INFINITY, sum(p for p, _ in numbers))
+                disproof = min(d for _, d in numbers)
+            if proof >= proof_threshold or disproof >= disproof_threshold:
+                table[key, player_id, goal] = (proof, disproof)
+                return proof, disproof
+
+            # Descend into the most promising child, with thresholds that bring the search
+            # back up as soon as a sibling becomes more promising
+            side = 0 if or_node else 1
+            best = second = None
+            for index, pair in enumerate(numbers):
+                if best is None or pair[side] < numbers[best][side]:
+                    second = best
+                    best = index
+                elif second is None or pair[side] < numbers[second][side]:
+                    second = index
+            second_number = numbers[second][side] if second is not None else INFINITY
+            # The 1 + epsilon trick: stay in the child a little past the point where the
+            # sibling catches up, instead of switching back and forth between them
+            second_number = int(second_number * EPSILON) + 1
+            if or_node:
+                child_proof = min(proof_threshold, second_number)
+                child_disproof = disproof_threshold - disproof + numbers[best][1]
+            else:
+                child_proof = proof_threshold - proof + numbers[best][0]
+                child_disproof = min(disproof_threshold, second_number)
+            child_key, _, code = children[best]
+            self._mid(_play(game_state, code), child_key, player_id, goal,
+                      min(child_proof, INFINITY), min(child_disproof, INFINITY))
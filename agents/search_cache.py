@@ -0,0 +1,122 @@
+"""Persistent warm-start cache of search results.
+
+SearchCache has the probe/store interface of agents.transposition.TranspositionTable, so
+it can be given to MinimaxAgent(tt=...), but it is an LRU dictionary that outlives the
+agents: the game hands the same cache to every MinimaxAgent it creates, and snapshots it
+to a file on exit that the next start reloads. Positions from repeated deals and common
+openings are then found in the cache instead of being searched again.
+
+Snapshot layout (little endian), written and read through a memory map:
+
+    header   magic b'NGSC', version u16, key version u16, entry count u32, 4 bytes zero
+    entries  key u64, value f64, meta u64 (depth | flag << 8), least recently used first
+
+KEY_VERSION must be bumped whenever position keys, evaluation or search results change
+meaning, so old snapshots are ignored instead of answering with stale values (version 3:
+the search plays the cards it searches; before, no card moved below the root).
+"""
+import mmap
+import os
+import struct
+import threading
+from collections import OrderedDict
+
+MAGIC = b'NGSC'
+VERSION = 1
+KEY_VERSION = 3
+_HEADER = struct.Struct('<4sHHI4x')
+_ENTRY = struct.Struct('<QdQ')
+
+
+class SearchCache:
+    def __init__(self, capacity=1 << 18):
+        self.capacity = capacity
+        self.entries = OrderedDict()  # key -> (value, depth, flag), most recently used last
+        self._lock = threading.Lock()  # the GUI searches on a worker thread and saves on the main one
+        self.probes = 0
+        self.hits = 0
+        self.stores = 0
+
+    def probe(self, key):
+        """(value, depth, flag) stored for key, or None; a hit makes the entry most recently used."""
+        with self._lock:
+            self.probes += 1
+            entry = self.entries.get(key)
+            if entry is not None:
+                self.hits += 1
+                self.entries.move_to_end(key)
+            return entry
+
+    def store(self, key, depth, flag, value):
+        with self._lock:
+            self.stores += 1
+            entries = self.entries
+            old = entries.get(key)
+            if old is not None and old[1] > depth:
+                entries.move_to_end(key)  # keep the deeper result
+                return
+            entries[key] = (value, depth, flag)
+            entries.move_to_end(key)
+            if len(entries) > self.capacity:
+                entries.popitem(last=False)
+
+    def __len__(self):
+        return len(self.entries)
+
+    def __getstate__(self):
+        # A pickled cache is a copy of the entries at that moment (see agents.speculation)
+        with self._lock:
+            state = self.__dict__.copy()
+            state['entries'] = OrderedDict(self.entries)
+        del state['_lock']
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    def save(self, path):
+        """Snapshot every entry to path (through a temporary file, so a crash leaves the old one)."""
+        with self._lock:
+            items = list(self.entries.items())
+        size = _HEADER.size + len(items) * _ENTRY.size
+        tmp_path = path + '.tmp'
+        with open(tmp_path, 'w+b') as f:
+            f.truncate(size)
+            with mmap.mmap(f.fileno(), size) as data:
+                _HEADER.pack_into(data, 0, MAGIC, VERSION, KEY_VERSION, len(items))
+                offset = _HEADER.size
+                for key, (value, depth, flag) in items:
+                    _ENTRY.pack_into(data, offset, key, value, depth | flag << 8)
+                    offset += _ENTRY.size
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path, capacity=1 << 18):
+        """A cache filled from a snapshot, or an empty one if the file is missing, unreadable or stale."""
+        cache = cls(capacity)
+        try:
+            with open(path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                magic, version, key_version, count = _HEADER.unpack_from(data, 0)
+                if magic != MAGIC or version != VERSION or key_version != KEY_VERSION:
+                    return cache
+                if len(data) < _HEADER.size + count * _ENTRY.size:
+                    return cache
+                # Only the most recently used entries fit if the capacity shrank
+                first = max(0, count - capacity)
+                entries = cache.entries
+                for key, value, meta in _ENTRY.iter_unpack(
+                        data[_HEADER.size + first * _ENTRY.size:_HEADER.size + count * _ENTRY.size]):
+                    entries[key] = (value, meta & 0xff, meta >> 8)
+        except (OSError, ValueError, struct.error):
+            return cls(capacity)
+        return cache
+
+
+def make_agent(agent_class, player_id, search_cache=None, book=None):
+    """agent_class(player_id), given search_cache and the opening book if it is a search
+    agent that can use them."""
+    from agents.minimax_agent import MinimaxAgent
+    if issubclass(agent_class, MinimaxAgent):
+        return agent_class(player_id, tt=search_cache, book=book)
+    return agent_class(player_id)
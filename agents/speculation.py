@@ -0,0 +1,169 @@
+"""Speculative replies: the AI's answer to each of the human's moves, computed while the human thinks.
+
+In a human vs AI game the CPU sits idle while the human decides. Speculator.start() takes
+the position the human is to move in, plays each of their valid actions on a copy and,
+wherever the AI moves next, has a pool of worker processes decide the AI's reply. Moves
+are submitted most likely first, as ranked by the Minimax evaluation of the result from
+the human's side. When the human commits, claim() returns the reply for the position
+reached (finished, or still being searched) and cancels the others.
+
+Only Minimax agents are speculated for; the rule-based agents decide faster than a reply
+could be handed over, and CSP keeps per-game history a worker would not have. Workers build
+their own agent of the live agent's class and MinimaxAgent.config(), with the game's opening
+book, so a reply is the decision the live agent would make (up to random tie-breaks). Each
+worker searches with its own copy of the game's search cache, taken when
+the worker starts; what the workers learn is not written back to the game's cache or its
+snapshot file.
+"""
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+from agents.base_agent import SearchCancelled
+from agents.evaluation import encode_position, evaluate
+from agents.minimax_agent import MinimaxAgent
+from agents.search_cache import SearchCache
+from agents.transposition import position_key
+from core.game_engine import GameEngine
+from core.match_log import decode_action, encode_action
+from core.replay import settle
+
+MAX_REPLIES = 64  # replies speculated per human position, least likely moves dropped first
+
+# Set in each worker process by _init_worker
+_generation = None
+_cancelled = None
+_book = None
+_search_cache = None
+_agents = {}  # (agent class, player id, config key) -> agent, kept across replies for its search cache
+
+
+def _init_worker(generation, cancelled, book, search_cache):
+    global _generation, _cancelled, _book, _search_cache
+    _generation = generation
+    _cancelled = cancelled
+    _book = book
+    _search_cache = search_cache if search_cache is not None else SearchCache()
+
+
+class _Stop:
+    """Stands in for an agent's stop_event: set once the reply's position is superseded
+    or the human played another move."""
+
+    def __init__(self, generation, slot):
+        self.generation = generation
+        self.slot = slot
+
+    def is_set(self):
+        return _generation.value != self.generation or _cancelled[self.slot]
+
+
+def _config_key(config):
+    return repr(sorted((name, sorted(value.items()) if isinstance(value, dict) else value)
+                       for name, value in config.items()))
+
+
+def _reply(agent_class, player_id, config, game_state, generation, slot):
+    """Action code (core.match_log.encode_action) of the decision of agent_class(player_id,
+    **config), or None if cancelled."""
+    key = (agent_class, player_id, _config_key(config))
+    agent = _agents.get(key)
+    if agent is None:
+        agent = _agents[key] = agent_class(player_id, tt=_search_cache, book=_book, **config)
+    agent.stop_event = _Stop(generation, slot)
+    if agent.stop_event.is_set():
+        return None  # cancelled while queued
+    try:
+        action = agent.decide_action(game_state, GameEngine(game_state).get_valid_actions())
+    except SearchCancelled:
+        return None
+    return encode_action(action)
+
+
+class Speculator:
+    def __init__(self, workers=None, book=None, search_cache=None):
+        self.workers = workers or max(1, (os.cpu_count() or 2) - 1)
+        # Spawned, not forked: the game runs threads (asset loading, the agent worker)
+        context = multiprocessing.get_context('spawn')
+        # Workers poll these instead of a stop event: a reply stops when the generation
+        # moves on or its slot is flagged
+        self._generation = context.RawValue('i', 0)
+        self._cancelled = context.RawArray('b', MAX_REPLIES)
+        self._executor = ProcessPoolExecutor(max_workers=self.workers, mp_context=context,
+                                             initializer=_init_worker,
+                                             initargs=(self._generation, self._cancelled, book, search_cache))
+        self._root = None  # (position key of the human's position, agent's config key) speculated on
+        self._replies = {}  # position key after a human move -> (slot, future of the action code)
+        self.hits = 0
+        self.misses = 0
+
+    def start(self, agent, game_state):
+        """Speculate agent's replies to the moves of the human to move in game_state.
+
+        Called every frame of the human's turn; does nothing while the position and the
+        agent's configuration are unchanged, or if agent is not a Minimax agent.
+        """
+        if not isinstance(agent, MinimaxAgent):
+            return
+        config = agent.config()
+        root = (position_key(game_state), _config_key(config))
+        if root == self._root:
+            return
+        self.cancel()
+        self._root = root
+        self._cancelled[:] = bytes(MAX_REPLIES)
+
+        human = game_state.current_player
+        candidates = []
+        seen = set()
+        for code in {encode_action(action) for action in GameEngine(game_state).get_valid_actions()}:
+            child = game_state.clone()
+            child_engine = GameEngine(child)
+            # The action has to name the clone's own card objects to move them
+            child_engine.execute_action(decode_action(code, child_engine.get_valid_actions()))
+            settle(child_engine)
+            if child.game_over or child.current_player != agent.player_id:
+                continue  # nothing to reply to, or the human moves again
+            key = position_key(child)
+            if key in seen:
+                continue
+            seen.add(key)
+            likelihood = evaluate(encode_position(child), human, MinimaxAgent.DEFAULT_PARAMS)
+            candidates.append((likelihood, code, key, child))
+
+        candidates.sort(key=lambda candidate: candidate[:2], reverse=True)
+        generation = self._generation.value
+        for slot, (_, _, key, child) in enumerate(candidates[:MAX_REPLIES]):
+            future = self._executor.submit(_reply, type(agent), agent.player_id, config, child, generation, slot)
+            self._replies[key] = (slot, future)
+
+    def claim(self, game_state):
+        """Future of the speculated reply for game_state, the AI to move, or None.
+
+        Every other reply is cancelled; the claimed one keeps running if it is not done.
+        """
+        if self._root is None:
+            return None
+        reply = self._replies.pop(position_key(game_state), None)
+        for slot, future in self._replies.values():
+            future.cancel()
+            self._cancelled[slot] = 1
+        self._replies.clear()
+        self._root = None
+        if reply is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return reply[1]
+
+    def cancel(self):
+        """Drop every reply, including one claimed and still running."""
+        self._generation.value += 1
+        for _, future in self._replies.values():
+            future.cancel()
+        self._replies.clear()
+        self._root = None
+
+    def shutdown(self):
+        self.cancel()
+        self._executor.shutdown(wait=False, cancel_futures=True)
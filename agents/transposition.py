@@ -0,0 +1,163 @@
+"""Fixed-size transposition table that search processes on one host can share.
+
+The table is a NumPy array of entries, either private to a process or placed in
+multiprocessing.shared_memory so that every MinimaxAgent in every worker process reads
+and writes the same entries. Each entry is three 64-bit words:
+
+    check   key ^ value bits ^ meta
+    value   the search value as a float64
+    meta    depth | flag << 8
+
+There are no locks. Writers store the three words one after another and a reader only
+accepts an entry whose check word matches key ^ value ^ meta, so an entry torn by two
+processes writing at once, or by a reader racing a writer, reads as a miss instead of a
+wrong value. Entries sit in buckets of two slots: the first keeps the deepest search
+seen for its bucket, the second always takes the latest.
+
+Probes and stores index a memoryview over the same memory, which returns plain Python
+ints and is several times faster per access than indexing the NumPy array. NumPy and
+shared_memory are imported only when a table is made, so MinimaxAgent can import the
+key helpers without slowing down game startup.
+"""
+import struct
+
+EXACT = 1
+LOWER = 2  # the value is a lower bound (the search failed high)
+UPPER = 3  # the value is an upper bound (the search failed low)
+
+WORDS_PER_ENTRY = 3
+SLOTS_PER_BUCKET = 2
+ENTRY_SIZE = 24
+KEY_MASK = (1 << 64) - 1
+
+_DOUBLE = struct.Struct('<d')
+_QWORD = struct.Struct('<Q')
+
+
+def position_key(game_state):
+    """Hash of everything the search value depends on; the order of cards in a hand or row does not matter."""
+    parts = [game_state.round_number, game_state.current_player]
+    for player in (game_state.players[0], game_state.players[1]):
+        # Cards as bit masks (ids shifted past the specials' -1 and -2), not tuples of ids:
+        # hash(-1) == hash(-2), so tuples of ids collide for the two special cards
+        hand = 0
+        for card in player.hand:
+            hand |= 1 << (card.id + 2)
+        parts += (player.passed, player.rounds_won, hand)
+        board = player.board
+        for row in ('melee', 'ranged', 'siege'):
+            cards = 0
+            for card in board[row]:
+                cards |= 1 << (card.id * 2 + card.is_debuffed + 4)
+            parts.append(cards)
+    # Hashes of ints and tuples of ints are the same in every process, unlike str hashes
+    return hash(tuple(parts))
+
+
+def table_key(*parts):
+    """Non-zero 64-bit key from hashable, process-independent parts (zero marks an empty slot)."""
+    return (hash(parts) & KEY_MASK) or 1
+
+
+def entry_dtype():
+    import numpy as np
+    return np.dtype([('check', '<u8'), ('value', '<f8'), ('meta', '<u8')])
+
+
+def _bucket_count(entries):
+    buckets = 1
+    while buckets * SLOTS_PER_BUCKET < entries:
+        buckets *= 2
+    return buckets
+
+
+class TranspositionTable:
+    def __init__(self, entries=1 << 16, _shm=None):
+        """A private table of at least `entries` entries (rounded up to a power of two)."""
+        import numpy as np
+        self.n_buckets = _bucket_count(entries)
+        self.mask = self.n_buckets - 1
+        self.shm = _shm
+        shape = (self.n_buckets * SLOTS_PER_BUCKET,)
+        if _shm is None:
+            self.entries = np.zeros(shape, dtype=entry_dtype())
+        else:
+            self.entries = np.ndarray(shape, dtype=entry_dtype(), buffer=_shm.buf)
+        self._words = memoryview(self.entries.view(np.uint64)).cast('B').cast('Q')
+        self.probes = 0
+        self.hits = 0
+        self.stores = 0
+
+    @classmethod
+    def create_shared(cls, entries=1 << 20):
+        """A new table in shared memory. Pass it to other processes (it pickles by name);
+        the creating process should call unlink() when every user is done."""
+        from multiprocessing import shared_memory
+        nbytes = _bucket_count(entries) * SLOTS_PER_BUCKET * ENTRY_SIZE
+        shm = shared_memory.SharedMemory(create=True, size=nbytes)
+        table = cls(entries, shm)
+        table.entries[:] = 0
+        return table
+
+    @classmethod
+    def attach(cls, name, entries):
+        """Open a table another process created with create_shared()."""
+        from multiprocessing import shared_memory
+        # Worker processes share their parent's resource tracker, so attaching does not
+        # hand ownership of the segment to the worker; the creator still unlinks it
+        return cls(entries, shared_memory.SharedMemory(name=name))
+
+    def __reduce__(self):
+        if self.shm is None:
+            raise TypeError("only tables made with create_shared() can be sent to other processes")
+        return TranspositionTable.attach, (self.shm.name, self.n_buckets * SLOTS_PER_BUCKET)
+
+    def probe(self, key):
+        """(value, depth, flag) stored for key, or None."""
+        self.probes += 1
+        words = self._words
+        slot = (key & self.mask) * SLOTS_PER_BUCKET * WORDS_PER_ENTRY
+        for _ in range(SLOTS_PER_BUCKET):
+            value_bits = words[slot + 1]
+            meta = words[slot + 2]
+            if words[slot] ^ value_bits ^ meta == key:
+                self.hits += 1
+                return _DOUBLE.unpack(_QWORD.pack(value_bits))[0], meta & 0xff, meta >> 8
+            slot += WORDS_PER_ENTRY
+        return None
+
+    def store(self, key, depth, flag, value):
+        self.stores += 1
+        words = self._words
+        value_bits = _QWORD.unpack(_DOUBLE.pack(value))[0]
+        meta = min(depth, 0xff) | flag << 8
+
+        slot = (key & self.mask) * SLOTS_PER_BUCKET * WORDS_PER_ENTRY
+        # The first slot is replaced only by an equal or deeper search (or the same position)
+        first_meta = words[slot + 2]
+        same_key = words[slot] ^ words[slot + 1] ^ first_meta == key
+        if not same_key and (first_meta & 0xff) > depth:
+            slot += WORDS_PER_ENTRY
+
+        words[slot + 1] = value_bits
+        words[slot + 2] = meta
+        words[slot] = key ^ value_bits ^ meta
+
+    def clear(self):
+        self.entries[:] = 0
+
+    def occupancy(self):
+        return int((self.entries['check'] != 0).sum()) / len(self.entries)
+
+    def close(self):
+        if self.shm is not None:
+            self._words.release()
+            self.entries = None
+            self.shm.close()
+
+    def unlink(self):
+        """Close and free the shared memory (call once, in the creating process)."""
+        if self.shm is not None:
+            shm = self.shm
+            self.close()
+            shm.unlink()
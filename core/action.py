@@ -8,6 +8,10 @@ class Action:
         self.card = card
         self.target_row = target_row
     
+    def key(self):
+        """Identify the action by value, so it can be matched across cloned game states."""
+        return (self.type, self.card.id if self.card else None, self.target_row)
+    
     def __repr__(self):
         if self.type == Action.PASS:
             return "Action(PASS)"
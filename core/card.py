@@ -22,6 +22,14 @@ class Card:
     def remove_debuff(self):
         self.is_debuffed = False
     
+    def clone(self):
+        new_card = Card.__new__(Card)
+        new_card.id = self.id
+        new_card.card_type = self.card_type
+        new_card.is_debuffed = self.is_debuffed
+        new_card.strength = self.strength
+        return new_card
+    
     def __repr__(self):
         type_names = {0: "Melee", 1: "Ranged", 2: "Siege", -1: "RowDebuff", -2: "Scorch"}
         return f"Card(id={self.id}, type={type_names.get(self.card_type, 'Unknown')}, strength={self.get_current_strength()})"
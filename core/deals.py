@@ -0,0 +1,91 @@
+"""Deals: enumerating them, drawing them reproducibly and storing fixed sets of them.
+
+A deal is the tuple of the 10 unit card ids both players are given, in hand order (the
+two special cards are always added by GameState.initialize). There are C(15, 10) = 3003
+different sets of cards; the order only changes how the hand is laid out and which of
+two equal choices an agent tries first.
+
+A deal-set file stores a fixed list of deals so that benchmarks and tournaments play
+exactly the same games. Layout (little endian):
+
+    header  magic b'NGDS', version u16, deal size u16 (10), deal count u32, 4 bytes zero
+    deals   10 bytes per deal, the card ids in hand order
+"""
+import itertools
+import os
+import random
+import struct
+
+from utils import constants
+
+DEAL_SIZE = 10
+MAGIC = b'NGDS'
+VERSION = 1
+_HEADER = struct.Struct('<4sHHI4x')
+
+# Every set of cards that can be dealt, in lexicographic order
+ALL_DEALS = tuple(itertools.combinations(constants.CARD_POOL, DEAL_SIZE))
+
+
+def deal_mask(deal):
+    """15-bit mask of the cards in a deal; equal for every ordering of the same cards."""
+    return sum(1 << (card_id - 1) for card_id in deal)
+
+
+_DEAL_INDEX = {deal_mask(deal): index for index, deal in enumerate(ALL_DEALS)}
+
+
+def deal_index(deal):
+    """Index in ALL_DEALS of the set of cards in deal."""
+    index = _DEAL_INDEX.get(deal_mask(deal)) if len(set(deal)) == len(deal) else None
+    if index is None:
+        raise ValueError(f"{deal} is not a deal of {DEAL_SIZE} different cards from the pool")
+    return index
+
+
+def game_rng(seed, game, stream):
+    """Independent random.Random for one part of one game, e.g. game_rng(seed, 12, 'deal').
+
+    Seeding from (seed, game, stream) rather than sharing one generator keeps every game
+    the same whichever worker plays it and whatever ran before it.
+    """
+    return random.Random(f"{seed}:{game}:{stream}")
+
+
+def random_deals(count, seed=0):
+    """count deals drawn with a random.Random(seed), in the order GameState.initialize draws them."""
+    rng = random.Random(seed)
+    return [tuple(rng.sample(constants.CARD_POOL, DEAL_SIZE)) for _ in range(count)]
+
+
+def write_deal_set(path, deals):
+    deals = [tuple(deal) for deal in deals]
+    for deal in deals:
+        deal_index(deal)  # validates
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'wb') as f:
+        f.write(_HEADER.pack(MAGIC, VERSION, DEAL_SIZE, len(deals)))
+        for deal in deals:
+            f.write(bytes(deal))
+    os.replace(tmp_path, path)
+
+
+def read_deal_set(path):
+    """Return the list of deals (tuples of card ids) stored in a deal-set file."""
+    with open(path, 'rb') as f:
+        data = f.read()
+    try:
+        magic, version, deal_size, count = _HEADER.unpack_from(data, 0)
+    except struct.error:
+        raise ValueError(f"{path} is not a deal set") from None
+    if magic != MAGIC or version != VERSION or deal_size != DEAL_SIZE:
+        raise ValueError(f"{path} is not a version {VERSION} deal set")
+    if len(data) != _HEADER.size + count * DEAL_SIZE:
+        raise ValueError(f"{path} should hold {count} deals but is {len(data)} bytes")
+
+    deals = []
+    for offset in range(_HEADER.size, len(data), DEAL_SIZE):
+        deal = tuple(data[offset:offset + DEAL_SIZE])
+        deal_index(deal)
+        deals.append(deal)
+    return deals
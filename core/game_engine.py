@@ -1,10 +1,14 @@
 from core.action import Action
 
 class GameEngine:
-    def __init__(self, game_state):
+    def __init__(self, game_state, recorder=None):
         self.game_state = game_state
+        self.recorder = recorder  # e.g. a core.match_log.MatchRecorder
     
     def execute_action(self, action):
+        if self.recorder is not None:
+            self.recorder.record_action(action)
+        
         if action.type == Action.PASS:
             self.game_state.player().passed = True
         
@@ -31,6 +35,12 @@ class GameEngine:
         else:
             self.game_state.switch_player()
             self._skip_passed_players()
+        
+        self._check_finished()
+    
+    def _check_finished(self):
+        if self.recorder is not None and self.game_state.game_over:
+            self.recorder.finish(self.game_state)
     
     def _apply_scorch(self):
         all_cards = []
@@ -76,10 +86,12 @@ class GameEngine:
             self.game_state.players[0].passed = True
             self.game_state.players[1].passed = True
             self.game_state.resolve_round()
+            self._check_finished()
             return True
         
         if self.game_state.check_round_end():
             self.game_state.resolve_round()
+            self._check_finished()
             return True
         
         return False
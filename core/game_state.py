@@ -1,4 +1,3 @@
-import copy
 import random
 from core.card import Card
 from core.player_state import PlayerState
@@ -17,9 +16,14 @@ class GameState:
         self.winner = None
         self.round_scores = []  # List of (p0_score, p1_score) tuples for each round
     
-    def initialize(self):
-        card_pool = constants.CARD_POOL.copy()
-        selected_ids = random.sample(card_pool, 10)
+    def initialize(self, card_ids=None, rng=None):
+        if card_ids is None:
+            # rng: a random.Random for a reproducible deal (see core/deals.py)
+            card_pool = constants.CARD_POOL.copy()
+            selected_ids = (rng or random).sample(card_pool, 10)
+        else:
+            # Fixed deal, e.g. for reproducible self-play
+            selected_ids = list(card_ids)
         
         self.initial_hand = []
         for card_id in selected_ids:
@@ -48,7 +52,16 @@ class GameState:
         return self.players[1 - self.current_player]
     
     def clone(self):
-        return copy.deepcopy(self)
+        # Hand-written instead of copy.deepcopy: search agents clone on every node
+        new_state = GameState.__new__(GameState)
+        new_state.initial_hand = [card.clone() for card in self.initial_hand]
+        new_state.round_number = self.round_number
+        new_state.current_player = self.current_player
+        new_state.players = {0: self.players[0].clone(), 1: self.players[1].clone()}
+        new_state.game_over = self.game_over
+        new_state.winner = self.winner
+        new_state.round_scores = list(self.round_scores)
+        return new_state
     
     def switch_player(self):
         self.current_player = 1 - self.current_player
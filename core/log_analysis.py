@@ -0,0 +1,235 @@
+"""Streaming statistics over match logs (see core/match_log.py).
+
+Logs are read through the memory map in fixed-size chunks, and every statistic is a
+fixed-size counter array, so memory use does not grow with the number of games.
+LogStats objects from different shards merge by adding their counters, which is how
+analyze() spreads large logs over a process pool.
+"""
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from core.deals import ALL_DEALS, deal_mask
+from core.match_log import HEADER_SIZE, MAX_ACTIONS, MAX_ROUNDS, RECORD_SIZE, read_log
+from utils import constants
+
+CHUNK_RECORDS = 1 << 16
+N_CODES = 20       # action byte values in use (0 pass, 1-15 units, 16 scorch, 17-19 debuffs)
+N_AGENT_CODES = 256
+MAX_SCORE = 256
+
+# Lookup from the 15-bit mask of a deal to its index in ALL_DEALS, for whole columns at once
+DEALS = ALL_DEALS
+_DEAL_INDEX = np.full(1 << len(constants.CARD_POOL), -1, dtype=np.int32)
+for _index, _deal in enumerate(DEALS):
+    _DEAL_INDEX[deal_mask(_deal)] = _index
+
+
+def deal_indices(deals):
+    """Map an (n, 10) array of dealt card ids to indices into DEALS (order does not matter)."""
+    masks = np.bitwise_or.reduce(np.left_shift(1, deals.astype(np.int32) - 1), axis=1)
+    return _DEAL_INDEX[masks]
+
+
+def action_actors(records):
+    """Work out which player made every logged action, and in which round.
+
+    Replays only the turn order (passes, hands running out, round changes) for the
+    whole chunk at once. Returns two (n, MAX_ACTIONS) int8 arrays, -1 past n_actions.
+    """
+    n = len(records)
+    rows = np.arange(n)
+    current = np.zeros(n, dtype=np.int8)
+    round_number = np.ones(n, dtype=np.int8)
+    passed = np.zeros((n, 2), dtype=bool)
+    hand = np.full((n, 2), 12, dtype=np.int8)
+    actors = np.full((n, MAX_ACTIONS), -1, dtype=np.int8)
+    rounds = np.full((n, MAX_ACTIONS), -1, dtype=np.int8)
+    n_actions = records['n_actions']
+
+    def start_next_round(mask):
+        round_number[mask] += 1
+        current[mask] = (round_number[mask] - 1) % 2
+        passed[mask] = hand[mask] == 0
+
+    for ply in range(MAX_ACTIONS):
+        live = n_actions > ply
+        if not live.any():
+            break
+
+        # GameEngine.check_auto_end_round, run before every move
+        ended = live & (((hand[:, 0] == 0) & (hand[:, 1] == 0)) | (passed[:, 0] & passed[:, 1]))
+        start_next_round(ended)
+
+        actor = current.copy()
+        actors[live, ply] = actor[live]
+        rounds[live, ply] = round_number[live]
+
+        code = records['actions'][:, ply]
+        is_pass = live & (code == 0)
+        is_play = live & (code != 0)
+        passed[rows[is_pass], actor[is_pass]] = True
+        hand[rows[is_play], actor[is_play]] -= 1
+
+        # GameEngine.execute_action: resolve the round or hand the turn over, skipping a passed player
+        both_passed = live & passed[:, 0] & passed[:, 1]
+        start_next_round(both_passed)
+        switch = live & ~both_passed
+        current[switch] = 1 - current[switch]
+        skip = switch & passed[rows, current]
+        current[skip] = 1 - current[skip]
+
+    return actors, rounds
+
+
+class LogStats:
+    """Counters accumulated over any number of records; all arrays have a fixed size."""
+
+    def __init__(self):
+        self.games = 0
+        # [agent code, seat, outcome]: outcome 0 win, 1 loss, 2 draw
+        self.agent_results = np.zeros((N_AGENT_CODES, 2, 3), dtype=np.int64)
+        # [agent code of player 0, agent code of player 1, winner (0, 1, 2 = draw)]
+        self.matchups = np.zeros((N_AGENT_CODES, N_AGENT_CODES, 3), dtype=np.int64)
+        # [deal index, winner (0, 1, 2 = draw)]
+        self.deal_results = np.zeros((len(DEALS), 3), dtype=np.int64)
+        # [round, winner (0, 1, 2 = tie)]: the player who opens round r is (r - 1) % 2
+        self.round_results = np.zeros((MAX_ROUNDS, 3), dtype=np.int64)
+        # [round, seat, score]
+        self.score_histogram = np.zeros((MAX_ROUNDS, 2, MAX_SCORE), dtype=np.int64)
+        # [round, player 0 score - player 1 score + MAX_SCORE]
+        self.margin_histogram = np.zeros((MAX_ROUNDS, 2 * MAX_SCORE), dtype=np.int64)
+        # [agent code, round, action code]
+        self.moves = np.zeros((N_AGENT_CODES, MAX_ROUNDS, N_CODES), dtype=np.int64)
+        self.game_length = np.zeros(MAX_ACTIONS + 1, dtype=np.int64)
+
+    def update(self, records):
+        n = len(records)
+        if n == 0:
+            return
+        self.games += n
+
+        agents = records['agents'].astype(np.int64)
+        winner = records['winner'].astype(np.int64)
+        outcome = np.where(winner < 0, 2, winner)  # 0 / 1 / 2 = draw
+        for seat in (0, 1):
+            seat_outcome = np.where(outcome == 2, 2, np.where(outcome == seat, 0, 1))
+            np.add.at(self.agent_results, (agents[:, seat], seat, seat_outcome), 1)
+        np.add.at(self.matchups, (agents[:, 0], agents[:, 1], outcome), 1)
+        np.add.at(self.deal_results, (deal_indices(records['deal']), outcome), 1)
+
+        n_rounds = records['n_rounds']
+        scores = records['round_scores'].astype(np.int64)
+        for r in range(MAX_ROUNDS):
+            played = n_rounds > r
+            p0, p1 = scores[played, r, 0], scores[played, r, 1]
+            round_winner = np.where(p0 > p1, 0, np.where(p1 > p0, 1, 2))
+            self.round_results[r] += np.bincount(round_winner, minlength=3)
+            self.score_histogram[r, 0] += np.bincount(p0, minlength=MAX_SCORE)
+            self.score_histogram[r, 1] += np.bincount(p1, minlength=MAX_SCORE)
+            self.margin_histogram[r] += np.bincount(p0 - p1 + MAX_SCORE, minlength=2 * MAX_SCORE)
+
+        actors, rounds = action_actors(records)
+        made = actors >= 0
+        game_rows = np.nonzero(made)[0]
+        actor_agents = agents[game_rows, actors[made].astype(np.int64)]
+        np.add.at(self.moves, (actor_agents, rounds[made].astype(np.int64) - 1,
+                               records['actions'][made].astype(np.int64)), 1)
+        self.game_length += np.bincount(records['n_actions'], minlength=MAX_ACTIONS + 1)
+
+    def merge(self, other):
+        self.games += other.games
+        for name in ('agent_results', 'matchups', 'deal_results', 'round_results',
+                     'score_histogram', 'margin_histogram', 'moves', 'game_length'):
+            getattr(self, name).__iadd__(getattr(other, name))
+        return self
+
+    def agent_win_rates(self):
+        """{agent code: (games, win rate, draw rate)} over both seats; draws count as half a win."""
+        rates = {}
+        totals = self.agent_results.sum(axis=1)
+        for code in np.nonzero(totals.sum(axis=1))[0]:
+            wins, losses, draws = totals[code]
+            games = wins + losses + draws
+            rates[int(code)] = (int(games), (wins + 0.5 * draws) / games, draws / games)
+        return rates
+
+    def first_mover_advantage(self):
+        """Player 0 (who opens round 1) game win rate, and the opener's win rate in each round."""
+        games = self.matchups.sum(axis=(0, 1))
+        total = games.sum()
+        game_rate = (games[0] + 0.5 * games[2]) / total if total else float('nan')
+        round_rates = []
+        for r in range(MAX_ROUNDS):
+            opener = r % 2
+            wins, losses, ties = self.round_results[r, opener], self.round_results[r, 1 - opener], self.round_results[r, 2]
+            played = wins + losses + ties
+            round_rates.append((wins + 0.5 * ties) / played if played else float('nan'))
+        return game_rate, round_rates
+
+    def deal_win_rates(self, min_games=1):
+        """(deal, games, player 0 win rate) for every deal seen at least min_games times."""
+        results = []
+        games = self.deal_results.sum(axis=1)
+        for index in np.nonzero(games >= max(min_games, 1))[0]:
+            p0, _, draws = self.deal_results[index]
+            results.append((DEALS[index], int(games[index]), (p0 + 0.5 * draws) / games[index]))
+        return results
+
+    def score_summary(self, round_index, seat):
+        """(mean, 10th, 50th and 90th percentile) of a seat's score in a round, from the histogram."""
+        return _histogram_summary(self.score_histogram[round_index, seat], offset=0)
+
+    def margin_summary(self, round_index):
+        return _histogram_summary(self.margin_histogram[round_index], offset=MAX_SCORE)
+
+
+def _histogram_summary(counts, offset):
+    total = counts.sum()
+    if total == 0:
+        return None
+    values = np.arange(len(counts)) - offset
+    cumulative = np.cumsum(counts)
+    quantiles = [int(values[np.searchsorted(cumulative, q * total)]) for q in (0.1, 0.5, 0.9)]
+    return (float((values * counts).sum() / total), *quantiles)
+
+
+def iter_chunks(path, start=0, stop=None, chunk_records=CHUNK_RECORDS):
+    """Yield consecutive slices of a log's records, copied out of the memory map one chunk at a time."""
+    log = read_log(path)
+    stop = len(log) if stop is None else min(stop, len(log))
+    for first in range(start, stop, chunk_records):
+        yield np.array(log[first:min(first + chunk_records, stop)])
+
+
+def make_shards(paths, shard_records):
+    """Split logs into (path, start, stop) ranges of at most shard_records games."""
+    shards = []
+    for path in paths:
+        count = (os.path.getsize(path) - HEADER_SIZE) // RECORD_SIZE
+        for start in range(0, count, shard_records):
+            shards.append((path, start, min(start + shard_records, count)))
+    return shards
+
+
+def analyze_shard(shard):
+    path, start, stop = shard
+    stats = LogStats()
+    for chunk in iter_chunks(path, start, stop):
+        stats.update(chunk)
+    return stats
+
+
+def analyze(paths, workers=1, shard_records=1 << 22):
+    """Compute LogStats over all the logs, on a process pool when workers > 1."""
+    shards = make_shards(paths, shard_records)
+    total = LogStats()
+    if workers > 1 and len(shards) > 1:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            for stats in executor.map(analyze_shard, shards):
+                total.merge(stats)
+    else:
+        for shard in shards:
+            total.merge(analyze_shard(shard))
+    return total
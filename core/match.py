@@ -0,0 +1,29 @@
+from core.game_state import GameState
+from core.game_engine import GameEngine
+
+
+def agent_name(agent):
+    return type(agent).__name__.replace('Agent', '')
+
+
+def play_match(agent0, agent1, card_ids=None, log=None, rng=None):
+    """Play a full game between two agents without the GUI and return the final state.
+
+    log is an optional core.match_log.MatchLogWriter to append the game to. Without
+    card_ids the deal is drawn from rng (a random.Random), or the global random module.
+    """
+    game_state = GameState()
+    game_state.initialize(card_ids, rng)
+    recorder = log.recorder((agent_name(agent0), agent_name(agent1))) if log is not None else None
+    game_engine = GameEngine(game_state, recorder)
+    agents = {0: agent0, 1: agent1}
+
+    while not game_state.game_over:
+        if game_engine.check_auto_end_round():
+            continue
+
+        valid_actions = game_engine.get_valid_actions()
+        action = agents[game_state.current_player].decide_action(game_state, valid_actions)
+        game_engine.execute_action(action)
+
+    return game_state
@@ -0,0 +1,181 @@
+"""Compact binary log of finished games.
+
+A log file is a 16-byte header followed by fixed-width 64-byte records, one per game:
+
+    deal          u1[10]   the 10 unit card ids dealt to both players, in deal order
+    agents        u1[2]    AGENT_CODES of player 0 and player 1
+    n_actions     u1       number of entries used in actions
+    actions       u1[32]   every executed action as one byte (see encode_action)
+    n_rounds      u1       number of rounds played
+    round_scores  u1[3,2]  board strength of (player 0, player 1) at the end of each round
+    winner        i1       0, 1 or -1 for a draw
+    reserved      11 bytes zero
+
+Who acts next follows from the rules, so a record is enough to replay the whole game.
+Records are written with struct; read_log() maps the file as a NumPy structured array
+without copying, so very large logs can be scanned column by column.
+"""
+import os
+import struct
+
+from core.action import Action
+
+MAGIC = b'NGML'
+VERSION = 1
+HEADER_SIZE = 16
+RECORD_SIZE = 64
+MAX_ACTIONS = 32
+MAX_ROUNDS = 3
+
+_HEADER = struct.Struct('<4sHH8x')
+_RECORD = struct.Struct('<10s2sB32sB6sb11x')
+
+AGENT_CODES = {'Human': 0, 'FIS': 1, 'CSP': 2, 'Minimax': 3}
+AGENT_NAMES = {code: name for name, code in AGENT_CODES.items()}
+UNKNOWN_AGENT = 255
+
+# One byte per action: 0 pass, 1-15 the unit card played, then the special cards
+PASS_CODE = 0
+SCORCH_CODE = 16
+DEBUFF_CODES = {'melee': 17, 'ranged': 18, 'siege': 19}
+
+
+def encode_action(action):
+    if action.type == Action.PASS:
+        return PASS_CODE
+    if action.type == Action.PLAY_UNIT:
+        return action.card.id
+    if action.card.card_type == -2:
+        return SCORCH_CODE
+    return DEBUFF_CODES[action.target_row]
+
+
+def decode_action(code, valid_actions):
+    """Return the action in valid_actions that code stands for."""
+    for action in valid_actions:
+        if encode_action(action) == code:
+            return action
+    raise ValueError(f"action code {code} is not valid here: {valid_actions}")
+
+
+def agent_code(name):
+    return AGENT_CODES.get(name, UNKNOWN_AGENT)
+
+
+def pack_record(deal, agents, actions, round_scores, winner):
+    """Pack one game into a RECORD_SIZE-byte record."""
+    if len(actions) > MAX_ACTIONS:
+        raise ValueError(f"game has {len(actions)} actions, the log format holds {MAX_ACTIONS}")
+    scores = [min(score, 255) for round_score in round_scores for score in round_score]
+    return _RECORD.pack(
+        bytes(deal),
+        bytes(agent_code(name) for name in agents),
+        len(actions),
+        bytes(actions),
+        len(round_scores),
+        bytes(scores),
+        -1 if winner is None else winner,
+    )
+
+
+def unpack_record(data):
+    """Inverse of pack_record; returns (deal, agent codes, actions, round_scores, winner)."""
+    deal, agents, n_actions, actions, n_rounds, scores, winner = _RECORD.unpack(data)
+    round_scores = [(scores[2 * i], scores[2 * i + 1]) for i in range(n_rounds)]
+    return list(deal), list(agents), list(actions[:n_actions]), round_scores, None if winner < 0 else winner
+
+
+class MatchRecorder:
+    """Collects one game's actions as it is played; pass to GameEngine(recorder=...)."""
+
+    def __init__(self, log, agents):
+        self.log = log
+        self.agents = agents  # names of player 0 and player 1 agents, e.g. ('FIS', 'Human')
+        self.actions = []
+        self.finished = False
+
+    def record_action(self, action):
+        self.actions.append(encode_action(action))
+
+    def finish(self, game_state):
+        if self.finished:
+            return
+        self.finished = True
+        deal = [card.id for card in game_state.initial_hand[:10]]
+        self.log.write(pack_record(deal, self.agents, self.actions, game_state.round_scores, game_state.winner))
+
+
+class MatchLogWriter:
+    """Appends records to a log file, writing the header if the file is new."""
+
+    def __init__(self, path):
+        self.path = path
+        new_file = not os.path.exists(path) or os.path.getsize(path) == 0
+        self.file = open(path, 'ab')
+        if new_file:
+            self.file.write(_HEADER.pack(MAGIC, VERSION, RECORD_SIZE))
+        else:
+            _check_header(path)
+
+    def recorder(self, agents):
+        return MatchRecorder(self, agents)
+
+    def write(self, record):
+        self.file.write(record)
+
+    def flush(self):
+        self.file.flush()
+
+    def close(self):
+        self.file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def _check_header(path):
+    with open(path, 'rb') as f:
+        magic, version, record_size = _HEADER.unpack(f.read(HEADER_SIZE))
+    if magic != MAGIC or version != VERSION or record_size != RECORD_SIZE:
+        raise ValueError(f"{path} is not a version {VERSION} match log")
+
+
+def record_dtype():
+    import numpy as np
+    return np.dtype([
+        ('deal', 'u1', (10,)),
+        ('agents', 'u1', (2,)),
+        ('n_actions', 'u1'),
+        ('actions', 'u1', (MAX_ACTIONS,)),
+        ('n_rounds', 'u1'),
+        ('round_scores', 'u1', (MAX_ROUNDS, 2)),
+        ('winner', 'i1'),
+        ('reserved', 'V11'),
+    ])
+
+
+def read_log(path):
+    """Memory-map a log as a read-only NumPy structured array (one element per game)."""
+    import numpy as np
+    _check_header(path)
+    count = (os.path.getsize(path) - HEADER_SIZE) // RECORD_SIZE
+    if count == 0:
+        return np.zeros(0, dtype=record_dtype())
+    return np.memmap(path, dtype=record_dtype(), mode='r', offset=HEADER_SIZE, shape=(count,))
+
+
+def iter_records(path, start=0, stop=None):
+    """Yield unpacked records without NumPy, for small logs or tools that replay games."""
+    _check_header(path)
+    with open(path, 'rb') as f:
+        f.seek(HEADER_SIZE + start * RECORD_SIZE)
+        index = start
+        while stop is None or index < stop:
+            data = f.read(RECORD_SIZE)
+            if len(data) < RECORD_SIZE:
+                break
+            yield unpack_record(data)
+            index += 1
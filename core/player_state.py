@@ -12,6 +12,15 @@ class PlayerState:
         for card in self.hand:
             card.remove_debuff()
     
+    def clone(self):
+        new_player = PlayerState.__new__(PlayerState)
+        new_player.id = self.id
+        new_player.hand = [card.clone() for card in self.hand]
+        new_player.board = {row: [card.clone() for card in cards] for row, cards in self.board.items()}
+        new_player.passed = self.passed
+        new_player.rounds_won = self.rounds_won
+        return new_player
+    
     def get_board_strength(self):
         total = 0
         for row in ['melee', 'ranged', 'siege']:
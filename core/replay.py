@@ -0,0 +1,104 @@
+"""Replay logged games by re-executing their action bytes through GameEngine.
+
+A Replay plays its game through once and keeps a snapshot of the state at the start of
+every round, so the position before any move can be rebuilt by replaying at most one
+round's worth of actions from the nearest keyframe.
+
+Positions are numbered 0..n_actions: position k is the state in which the k-th action
+(counting from 0) is about to be played, with any pending round end already resolved,
+and position n_actions is the finished game.
+"""
+import bisect
+
+from core.game_engine import GameEngine
+from core.game_state import GameState
+from core.match_log import decode_action, iter_records
+
+
+def settle(game_engine):
+    """Resolve round ends that need no move (both passed, both hands empty), as the game loop does."""
+    while not game_engine.game_state.game_over and game_engine.check_auto_end_round():
+        pass
+
+
+class Replay:
+    def __init__(self, deal, actions, agents=None):
+        self.deal = list(deal)
+        self.actions = list(actions)
+        self.agents = agents  # agent codes of player 0 and player 1, if known
+
+        self.actors = []         # player who made each action
+        self.action_rounds = []  # round each action was made in
+        self.keyframes = []      # (position, GameState) at the start of every round
+
+        game_state = GameState()
+        game_state.initialize(self.deal)
+        game_engine = GameEngine(game_state)
+        for position, code in enumerate(self.actions):
+            settle(game_engine)
+            if game_state.game_over:
+                raise ValueError(f"game is over after {position} of {len(self.actions)} actions")
+            if not self.keyframes or self.keyframes[-1][1].round_number != game_state.round_number:
+                self.keyframes.append((position, game_state.clone()))
+            self.actors.append(game_state.current_player)
+            self.action_rounds.append(game_state.round_number)
+            game_engine.execute_action(decode_action(code, game_engine.get_valid_actions()))
+        settle(game_engine)
+        if not self.keyframes:
+            self.keyframes.append((0, game_state.clone()))
+        self.final_state = game_state
+        self._keyframe_positions = [position for position, _ in self.keyframes]
+
+    @classmethod
+    def from_record(cls, record):
+        """Build from an unpacked log record and check that it replays to the logged result."""
+        deal, agents, actions, round_scores, winner = record
+        replay = cls(deal, actions, agents)
+        final = replay.final_state
+        replayed_scores = [(min(p0, 255), min(p1, 255)) for p0, p1 in final.round_scores]
+        if not final.game_over or replayed_scores != round_scores or final.winner != winner:
+            raise ValueError(f"replay ends with scores {replayed_scores}, winner {final.winner}; "
+                             f"the log says {round_scores}, winner {winner}")
+        return replay
+
+    @classmethod
+    def load(cls, path, index):
+        """Replay game number index (from 0) of a match log."""
+        for record in iter_records(path, index, index + 1):
+            return cls.from_record(record)
+        raise IndexError(f"{path} has no game {index}")
+
+    def __len__(self):
+        return len(self.actions)
+
+    def round_start(self, round_number):
+        """Position of the first action of a round (rounds count from 1)."""
+        for position, state in self.keyframes:
+            if state.round_number == round_number:
+                return position
+        raise ValueError(f"round {round_number} was not played")
+
+    def state_at(self, position):
+        """A new GameState at position, rebuilt from the keyframe of its round."""
+        if not 0 <= position <= len(self.actions):
+            raise IndexError(f"position {position} out of range 0..{len(self.actions)}")
+        if position == len(self.actions):
+            return self.final_state.clone()
+
+        position_index = bisect.bisect_right(self._keyframe_positions, position) - 1
+        start, keyframe = self.keyframes[position_index]
+        game_engine = GameEngine(keyframe.clone())
+        for code in self.actions[start:position]:
+            self.play(game_engine, code)
+        return game_engine.game_state
+
+    def action_at(self, game_state, position):
+        """The Action object for the action at position, valid in game_state (which must be that position)."""
+        return decode_action(self.actions[position], GameEngine(game_state).get_valid_actions())
+
+    @staticmethod
+    def play(game_engine, code):
+        """Execute one logged action and resolve any round end that follows."""
+        settle(game_engine)
+        game_engine.execute_action(decode_action(code, game_engine.get_valid_actions()))
+        settle(game_engine)
@@ -0,0 +1,74 @@
+def linear(t):
+    return t
+
+def ease_out_cubic(t):
+    return 1 - (1 - t) ** 3
+
+def ease_in_out_quad(t):
+    if t < 0.5:
+        return 2 * t * t
+    return 1 - (-2 * t + 2) ** 2 / 2
+
+
+class CardAnimation:
+    """Moves one card sprite from start to end over duration ms of (scaled) real time."""
+
+    def __init__(self, card, start, end, duration=250, easing=ease_out_cubic):
+        self.card = card
+        self.start_x, self.start_y = start
+        self.end_x, self.end_y = end
+        self.duration = max(1, duration)
+        self.easing = easing
+        self.elapsed = 0
+        self.current_x, self.current_y = start
+        self.active = True
+
+    def update(self, dt):
+        """Advance by dt milliseconds; return False once the card has arrived."""
+        self.elapsed = min(self.elapsed + dt, self.duration)
+        progress = self.easing(self.elapsed / self.duration)
+        self.current_x = self.start_x + (self.end_x - self.start_x) * progress
+        self.current_y = self.start_y + (self.end_y - self.start_y) * progress
+        self.active = self.elapsed < self.duration
+        return self.active
+
+
+class AnimationScheduler:
+    """Runs card animations against the wall clock, so they look the same at any frame rate.
+
+    speed scales time (2.0 plays everything twice as fast); skip_all() jumps to the end.
+    """
+
+    def __init__(self, speed=1.0):
+        self.speed = speed
+        self.animations = []
+        self.last_tick = None
+
+    def add(self, animation):
+        # A card can only be in one place: a new move replaces the running one
+        self.animations = [anim for anim in self.animations if anim.card is not animation.card]
+        self.animations.append(animation)
+
+    def update(self, now):
+        """Advance all animations to time now (ms, e.g. pygame.time.get_ticks())."""
+        if not self.animations:
+            self.last_tick = None
+            return
+        if self.last_tick is None:
+            self.last_tick = now  # first frame of a new batch starts from zero
+        dt = (now - self.last_tick) * self.speed
+        self.last_tick = now
+        self.animations = [anim for anim in self.animations if anim.update(dt)]
+
+    def fast_forward(self, ms):
+        self.animations = [anim for anim in self.animations if anim.update(ms)]
+
+    def skip_all(self):
+        self.animations = []
+        self.last_tick = None
+
+    def __iter__(self):
+        return iter(self.animations)
+
+    def __len__(self):
+        return len(self.animations)
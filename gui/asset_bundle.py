@@ -0,0 +1,128 @@
+"""Single-file bundle of pre-scaled images, built by tools/build_assets.py.
+
+Layout (little endian):
+
+    header   magic b'NGAB', version u16, entry count u32
+    index    per entry: name length u16, name (utf-8), width u16, height u16,
+             data offset u32, data length u32, source size u64, source mtime_ns i64
+    data     raw RGBA pixels of every entry, already at display size
+
+The whole file is read once (or memory-mapped) and surfaces are built straight from
+the pixel bytes, so no PNG decoding or scaling happens at runtime. Each entry
+remembers the size and mtime of the file it was built from; if that file has changed
+since, the entry is ignored and the caller falls back to the loose file.
+"""
+import mmap
+import os
+import struct
+
+import pygame
+
+BUNDLE_PATH = os.path.join('assets', 'bundle.bin')
+
+MAGIC = b'NGAB'
+VERSION = 1
+_HEADER = struct.Struct('<4sHI')
+_NAME_LENGTH = struct.Struct('<H')
+_ENTRY = struct.Struct('<HHIIQq')
+
+
+def card_key(card_id):
+    return f'card/{card_id}'
+
+
+def icon_key(name, size=None):
+    return f'icon/{name}' if size is None else f'icon/{name}@{size}'
+
+
+def write_bundle(path, entries):
+    """Write entries, a list of (key, surface, source path), as a bundle file."""
+    index = []
+    blobs = []
+    for key, surface, source in entries:
+        stat = os.stat(source)
+        pixels = pygame.image.tobytes(surface, 'RGBA')
+        index.append((key.encode('utf-8'), surface.get_width(), surface.get_height(),
+                      len(pixels), stat.st_size, stat.st_mtime_ns))
+        blobs.append(pixels)
+
+    offset = _HEADER.size + sum(_NAME_LENGTH.size + len(name) + _ENTRY.size for name, *_ in index)
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'wb') as f:
+        f.write(_HEADER.pack(MAGIC, VERSION, len(index)))
+        for name, width, height, length, source_size, source_mtime in index:
+            f.write(_NAME_LENGTH.pack(len(name)))
+            f.write(name)
+            f.write(_ENTRY.pack(width, height, offset, length, source_size, source_mtime))
+            offset += length
+        for pixels in blobs:
+            f.write(pixels)
+    os.replace(tmp_path, path)
+
+
+class AssetBundle:
+    def __init__(self, data, entries, sources):
+        self._data = data  # bytes or mmap; the surfaces are copied out of it
+        self._entries = entries
+        self._sources = sources
+        self._checked = {}
+
+    @classmethod
+    def open(cls, path=BUNDLE_PATH, use_mmap=False, sources=None):
+        """Load a bundle with one read (or a memory map); None if it is missing or unreadable.
+
+        sources maps each key to the loose file it was built from, used to detect stale entries.
+        """
+        try:
+            with open(path, 'rb') as f:
+                if use_mmap:
+                    data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+                else:
+                    data = f.read()
+
+            magic, version, count = _HEADER.unpack_from(data, 0)
+            if magic != MAGIC or version != VERSION:
+                return None
+
+            entries = {}
+            position = _HEADER.size
+            for _ in range(count):
+                (name_length,) = _NAME_LENGTH.unpack_from(data, position)
+                position += _NAME_LENGTH.size
+                name = bytes(data[position:position + name_length]).decode('utf-8')
+                position += name_length
+                entries[name] = _ENTRY.unpack_from(data, position)
+                position += _ENTRY.size
+        except (OSError, struct.error, UnicodeDecodeError, ValueError):
+            return None
+
+        return cls(data, entries, sources or {})
+
+    def __contains__(self, key):
+        return key in self._entries
+
+    def _is_fresh(self, key, entry):
+        source = self._sources.get(key)
+        if source is None:
+            return True
+        fresh = self._checked.get(key)
+        if fresh is None:
+            try:
+                stat = os.stat(source)
+                fresh = (stat.st_size, stat.st_mtime_ns) == entry[4:]
+            except OSError:
+                fresh = True  # loose file gone: the bundle is all there is
+            self._checked[key] = fresh
+        return fresh
+
+    def get(self, key):
+        """Return a new Surface for key, or None if the bundle has no up-to-date copy of it."""
+        entry = self._entries.get(key)
+        if entry is None or not self._is_fresh(key, entry):
+            return None
+
+        width, height, offset, length = entry[:4]
+        surface = pygame.image.frombuffer(memoryview(self._data)[offset:offset + length], (width, height), 'RGBA')
+        # Copy out of the shared buffer; conversion to the display format is left to the
+        # caller, which may be a loading thread that must not touch the display
+        return surface.copy()
@@ -2,6 +2,9 @@ import pygame
 from gui.config import *
 
 class CardSprite(pygame.sprite.Sprite):
+    # Backdrop behind the strength number, shared by all sprites
+    strength_bg = None
+    
     def __init__(self, card, x, y):
         super().__init__()
         self.card = card
@@ -19,18 +22,19 @@ class CardSprite(pygame.sprite.Sprite):
         screen.blit(self.image, self.rect)
         
         if self.card.is_debuffed:
-            pygame.draw.rect(screen, RED, self.rect, 3)
+            draw_border(screen, RED, self.rect, 3)
         
         if self.selected:
-            pygame.draw.rect(screen, GOLD, self.rect, 4)
+            draw_border(screen, GOLD, self.rect, 4)
         elif self.hovered:
-            pygame.draw.rect(screen, GREEN, self.rect, 2)
+            draw_border(screen, GREEN, self.rect, 2)
         
-        strength_text = FONT_SMALL.render(str(self.card.get_current_strength()), True, WHITE)
-        strength_bg = pygame.Surface((25, 20))
-        strength_bg.fill(BLACK)
-        strength_bg.set_alpha(180)
-        screen.blit(strength_bg, (self.rect.x + 2, self.rect.y + 2))
+        strength_text = render_text(FONT_SMALL, str(self.card.get_current_strength()), WHITE)
+        if CardSprite.strength_bg is None:
+            CardSprite.strength_bg = pygame.Surface((25, 20))
+            CardSprite.strength_bg.fill(BLACK)
+            CardSprite.strength_bg.set_alpha(180)
+        screen.blit(CardSprite.strength_bg, (self.rect.x + 2, self.rect.y + 2))
         screen.blit(strength_text, (self.rect.x + 5, self.rect.y + 3))
 
 class Button:
@@ -46,9 +50,9 @@ class Button:
     def draw(self, screen):
         color = tuple(min(c + 30, 255) for c in self.color) if self.hovered else self.color
         pygame.draw.rect(screen, color, self.rect)
-        pygame.draw.rect(screen, WHITE, self.rect, 2)
+        draw_border(screen, WHITE, self.rect, 2)
         
-        text_surface = FONT_MEDIUM.render(self.text, True, WHITE)
+        text_surface = render_text(FONT_MEDIUM, self.text, WHITE)
         text_rect = text_surface.get_rect(center=self.rect.center)
         screen.blit(text_surface, text_rect)
     
@@ -1,7 +1,9 @@
 import pygame
 import os
-
-pygame.init()
+import threading
+from collections import OrderedDict
+from gui.asset_bundle import AssetBundle, BUNDLE_PATH, card_key, icon_key
+from utils import constants
 
 SCREEN_WIDTH = 1200
 SCREEN_HEIGHT = 800
@@ -19,10 +21,28 @@ CARD_WIDTH = 60
 CARD_HEIGHT = 85
 CARD_SPACING = 10
 
-FONT_SMALL = pygame.font.Font(None, 20)
-FONT_MEDIUM = pygame.font.Font(None, 28)
-FONT_LARGE = pygame.font.Font(None, 36)
-FONT_TITLE = pygame.font.Font(None, 48)
+class LazyFont:
+    """A pygame Font created on first use, so importing this module does not initialize pygame."""
+    
+    def __init__(self, name, size):
+        self._name = name
+        self._points = size
+        self._font = None
+    
+    def __getattr__(self, attr):
+        if self._font is None:
+            if not pygame.font.get_init():
+                pygame.font.init()
+            self._font = pygame.font.Font(self._name, self._points)
+        return getattr(self._font, attr)
+
+FONT_SMALL = LazyFont(None, 20)
+FONT_MEDIUM = LazyFont(None, 28)
+FONT_LARGE = LazyFont(None, 36)
+FONT_TITLE = LazyFont(None, 48)
+
+# Posted (from the worker thread) when an agent has finished deciding
+AI_DONE_EVENT = pygame.USEREVENT + 1
 
 COLORS = {
     'background': (30, 30, 40),
@@ -43,7 +63,110 @@ FONTS = {
     'title': FONT_TITLE
 }
 
+def draw_border(surface, color, rect, width):
+    """Outline rect like pygame.draw.rect(..., width), but exact under a clip rect.
+
+    pygame's thick rect outlines leave stray pixels when the surface clip cuts through
+    them, which shows up as artifacts with dirty-rectangle redraws.
+    """
+    rect = pygame.Rect(rect)
+    surface.fill(color, (rect.x, rect.y, rect.width, width))
+    surface.fill(color, (rect.x, rect.bottom - width, rect.width, width))
+    surface.fill(color, (rect.x, rect.y, width, rect.height))
+    surface.fill(color, (rect.right - width, rect.y, width, rect.height))
+
+def wait_for_events(timeout=None):
+    """Block until an event arrives (or timeout ms pass) and return all pending events.
+
+    Used instead of clock.tick() while nothing is animating, so an idle window
+    sleeps instead of spinning at 60 FPS.
+    """
+    if timeout is None:
+        event = pygame.event.wait()
+    else:
+        event = pygame.event.wait(max(1, int(timeout)))
+    
+    events = [] if event.type == pygame.NOEVENT else [event]
+    events.extend(pygame.event.get())
+    return events
+
+# Rendered text surfaces keyed by (font, text, color), least recently used evicted first
+TEXT_CACHE_SIZE = 512
+_text_cache = OrderedDict()
+
+def render_text(font, text, color):
+    key = (font, text, color)
+    surface = _text_cache.get(key)
+    if surface is None:
+        surface = font.render(text, True, color)
+        _text_cache[key] = surface
+        if len(_text_cache) > TEXT_CACHE_SIZE:
+            _text_cache.popitem(last=False)
+    else:
+        _text_cache.move_to_end(key)
+    return surface
+
+# Every image the game shows, with the size it is drawn at (None: as is)
+BOARD_ICONS = [('melee.png', 24), ('ranged.png', 24), ('siege.png', 24), ('star.png', 28)]
+WINDOW_ICON = 'icon.webp'
+
+def bundled_assets():
+    """(bundle key, loose file, display size or None) for everything tools/build_assets.py packs."""
+    images = os.path.join('assets', 'images')
+    assets = []
+    for card_id in constants.CARD_POOL + [-1, -2]:
+        assets.append((card_key(card_id), os.path.join(images, f'{card_id}.png'), (CARD_WIDTH, CARD_HEIGHT)))
+    for name, size in BOARD_ICONS:
+        assets.append((icon_key(name, size), os.path.join(images, name), (size, size)))
+    assets.append((icon_key(WINDOW_ICON), os.path.join(images, WINDOW_ICON), None))
+    return assets
+
+# Pre-scaled images packed by tools/build_assets.py, opened on first use (None without a bundle)
+_bundle = None
+_bundle_opened = False
+
+def get_bundle():
+    global _bundle, _bundle_opened
+    if not _bundle_opened:
+        _bundle = AssetBundle.open(BUNDLE_PATH, sources={key: path for key, path, _ in bundled_assets()})
+        _bundle_opened = True
+    return _bundle
+
+def _from_bundle(key):
+    bundle = get_bundle()
+    return bundle.get(key) if bundle is not None else None
+
+# Surfaces decoded by the preload thread, keyed like the bundle, not yet in the display format
+_decoded = {}
+
+def _for_display(surface):
+    """surface in the display's pixel format, so blits don't convert every frame.
+
+    Main thread only: SDL does not make surface operations against the display safe from
+    other threads.
+    """
+    if pygame.display.get_surface() is not None:
+        return surface.convert_alpha()
+    return surface
+
+# Card surfaces in the display format, shared by every CardSprite in the process
+_card_image_cache = {}
+
 def load_card_image(card_id):
+    image = _card_image_cache.get(card_id)
+    if image is None:
+        image = _decoded.pop(card_key(card_id), None)
+        if image is None:
+            image = _decode_card_image(card_id)
+        image = _for_display(image)
+        _card_image_cache[card_id] = image
+    return image
+
+def _decode_card_image(card_id):
+    img = _from_bundle(card_key(card_id))
+    if img is not None:
+        return img
+    
     path = os.path.join('assets', 'images', f'{card_id}.png')
     if os.path.exists(path):
         img = pygame.image.load(path)
@@ -52,3 +175,69 @@ def load_card_image(card_id):
         surface = pygame.Surface((CARD_WIDTH, CARD_HEIGHT))
         surface.fill(GRAY)
         return surface
+
+def preload_card_images():
+    """Decode and scale every card image once; call after the display mode is set."""
+    for card_id in constants.CARD_POOL + [-1, -2]:
+        load_card_image(card_id)
+
+# Small board icons, loaded and scaled once per process
+_icon_cache = {}
+
+def load_icon(name, size):
+    """Return assets/images/<name> scaled to size x size; raises if the file can't be loaded."""
+    key = (name, size)
+    icon = _icon_cache.get(key)
+    if icon is None:
+        icon = _decoded.pop(icon_key(name, size), None)
+        if icon is None:
+            icon = _decode_icon(name, size)
+        icon = _for_display(icon)
+        _icon_cache[key] = icon
+    return icon
+
+def _decode_icon(name, size):
+    icon = _from_bundle(icon_key(name, size))
+    if icon is None:
+        icon = pygame.transform.scale(pygame.image.load(os.path.join('assets', 'images', name)), (size, size))
+    return icon
+
+def load_window_icon():
+    icon = _from_bundle(icon_key(WINDOW_ICON))
+    if icon is None:
+        icon = pygame.image.load(os.path.join('assets', 'images', WINDOW_ICON))
+    return icon
+
+def preload_assets():
+    preload_card_images()
+    for name, size in BOARD_ICONS:
+        load_icon(name, size)
+
+def decode_assets():
+    """Decode and scale the game's images ahead of use, without touching the display.
+
+    Safe off the main thread; load_card_image and load_icon convert the results to the
+    display format when they are first used.
+    """
+    for card_id in constants.CARD_POOL + [-1, -2]:
+        if card_id not in _card_image_cache:
+            _decoded[card_key(card_id)] = _decode_card_image(card_id)
+    for name, size in BOARD_ICONS:
+        if (name, size) not in _icon_cache:
+            _decoded[icon_key(name, size)] = _decode_icon(name, size)
+
+def preload_assets_in_background():
+    """Decode the game's images on a daemon thread while the menu is up.
+
+    Anything needed before the thread gets to it is simply loaded on demand; a surface
+    decoded twice is harmless.
+    """
+    thread = threading.Thread(target=_preload_quietly, name='asset-preload', daemon=True)
+    thread.start()
+    return thread
+
+def _preload_quietly():
+    try:
+        decode_assets()
+    except Exception as e:
+        print(f"Warning: Could not preload assets: {e}")
@@ -1,20 +1,37 @@
 import pygame
 from gui.config import *
 from gui.components import CardSprite, Button
+from gui.animation import AnimationScheduler, CardAnimation
 from core.action import Action
 class GameGUI:
+    ROUND_END_BANNER_MS = 2000
+    ROUND_START_BANNER_MS = 1500
+    THINKING_DOT_MS = 400
+    HOVER_BOB_MS = 60  # per pixel of the hovered hand card's bob
+    CARD_MOVE_MS = 250
+    
     def __init__(self, screen, player0_type="Human", player1_type="Human"):
         self.screen = screen
         self.selected_card = None
         self.selected_row = None
         self.card_sprites = []
-        self.animations = []
+        self.animations = AnimationScheduler()
+        self.speed = 1.0  # banner and card-move playback speed, None = instant
+        self.card_positions = {}  # card -> top-left where it was last laid out
         
         self.player0_type = player0_type  # "Human", "FIS", "CSP", "Minimax"
         self.player1_type = player1_type
         
         self.board_rect = pygame.Rect(320, 120, 850, 530)
         
+        # Baseline y of every board row, as drawn by _draw_boards
+        row_height = self.board_rect.height // 6
+        self.row_y = {}
+        for idx, row_name in enumerate(['siege', 'ranged', 'melee']):
+            self.row_y[(1, row_name)] = self.board_rect.y + idx * row_height + 15
+        for idx, row_name in enumerate(['melee', 'ranged', 'siege']):
+            self.row_y[(0, row_name)] = self.board_rect.centery + idx * row_height + 15
+        
         # Player 1 (bottom) controls
         self.pass_button = Button(210, 700, 80, 40, "PASS", RED)
         self.row_buttons = {
@@ -31,24 +48,19 @@ class GameGUI:
             'melee': Button(180, 250, 100, 40, "Melee", BLUE)
         }
         
-        self.hover_offset = 0
-        self.hover_speed = 3
+        self.hovered_card = None  # card of the current player's hand under the mouse
+        self.bobbing = False  # a hovered hand card is drawn, so the screen animates
         
         self.row_icons = {}
         try:
-            self.row_icons['melee'] = pygame.image.load('assets/images/melee.png')
-            self.row_icons['ranged'] = pygame.image.load('assets/images/ranged.png')
-            self.row_icons['siege'] = pygame.image.load('assets/images/siege.png')
-            
-            for row_name in self.row_icons:
-                self.row_icons[row_name] = pygame.transform.scale(self.row_icons[row_name], (24, 24))
+            for row_name in ['melee', 'ranged', 'siege']:
+                self.row_icons[row_name] = load_icon(f'{row_name}.png', 24)
         except Exception as e:
             print(f"Warning: Could not load row icons: {e}")
             self.row_icons = None
         
         try:
-            self.star_icon = pygame.image.load('assets/images/star.png')
-            self.star_icon = pygame.transform.scale(self.star_icon, (28, 28))
+            self.star_icon = load_icon('star.png', 28)
         except Exception as e:
             print(f"Warning: Could not load star icon: {e}")
             self.star_icon = None
@@ -69,10 +81,93 @@ class GameGUI:
         self.banner_state = None  # None, 'round_end', or 'round_start'
         self.banner_start_time = 0
         self.round_winner = None
+        self.thinking_player = None  # player whose agent is deciding in the background
+        
+        # Dirty-rectangle bookkeeping: last signature drawn for each screen region
+        self.region_signatures = {}
+        self.animation_rects = []
+        
+        self.background = self._build_background()
+        
+        # Semi-transparent panels, created once and reused every frame
+        self.hand_bg_p1 = self._make_panel((900, 130), (30, 20, 10), 180)
+        self.hand_bg_p2 = self._make_panel((1000, 100), (30, 20, 10), 180)
+        self.row_strength_bg = self._make_panel((60, 50), (50, 40, 25), 230)
+        self.banner_overlay = self._make_panel((SCREEN_WIDTH, SCREEN_HEIGHT), (0, 0, 0), 200)
+        self.announcement_box = self._make_panel((500, 200), (40, 30, 20))
+        self.game_over_overlay = self._make_panel((SCREEN_WIDTH, SCREEN_HEIGHT), (10, 5, 0), 220)
+        self.result_box = self._make_panel((700, 450), (40, 30, 20))
+        
+        # Persistent sprite per card object, repositioned instead of recreated each frame
+        self.sprites = {}
     
-    def render(self, game_state):
-        self.screen.fill((20, 15, 10))
+    def _make_panel(self, size, color, alpha=None):
+        panel = pygame.Surface(size)
+        panel.fill(color)
+        if alpha is not None:
+            panel.set_alpha(alpha)
+        return panel
+    
+    def _sprite_for(self, card, x, y):
+        sprite = self.sprites.get(card)
+        if sprite is None:
+            sprite = CardSprite(card, x, y)
+            self.sprites[card] = sprite
+        else:
+            sprite.rect.x = x
+            sprite.rect.y = y
+        sprite.selected = False
+        sprite.hovered = False
+        return sprite
+    
+    def _prune_sprites(self, game_state):
+        live_cards = set()
+        for player in game_state.players.values():
+            live_cards.update(player.hand)
+            for cards in player.board.values():
+                live_cards.update(cards)
+        live_cards.update(anim.card for anim in self.animations)
+        self.sprites = {card: sprite for card, sprite in self.sprites.items() if card in live_cards}
+    
+    def _build_background(self):
+        """Draw the parts of the screen that never change once, to blit under every redraw."""
+        background = pygame.Surface(self.screen.get_size()).convert(self.screen)
+        background.fill((20, 15, 10))
+        
+        pygame.draw.rect(background, (60, 45, 30), self.board_rect)
+        pygame.draw.rect(background, (120, 90, 60), self.board_rect, 3)
+        
+        pygame.draw.line(background, (120, 90, 60), 
+                        (self.board_rect.x, self.board_rect.centery),
+                        (self.board_rect.right, self.board_rect.centery), 5)
+        
+        row_height = self.board_rect.height // 6
+        
+        for i in range(1, 3):
+            y_top = self.board_rect.y + i * row_height
+            pygame.draw.line(background, (80, 60, 40),
+                           (self.board_rect.x + 10, y_top),
+                           (self.board_rect.right - 10, y_top), 2)
+            
+            y_bottom = self.board_rect.centery + i * row_height
+            pygame.draw.line(background, (80, 60, 40),
+                           (self.board_rect.x + 10, y_bottom),
+                           (self.board_rect.right - 10, y_bottom), 2)
+        
+        info_bg = pygame.Surface((160, 50))
+        info_bg.fill((40, 30, 20))
+        info_bg.set_alpha(220)
+        background.blit(info_bg, (10, 10))
+        pygame.draw.rect(background, GOLD, (10, 10, 160, 50), 3)
+        
+        title = render_text(FONT_MEDIUM, "NANO GWENT", GOLD)
+        title_rect = title.get_rect(center=(90, 35))
+        background.blit(title, title_rect)
         
+        return background
+    
+    def render(self, game_state):
+        """Redraw the regions whose state changed and return their rects for display.update()."""
         current_time = pygame.time.get_ticks()
         
         if game_state.round_number != self.last_round_number:
@@ -99,44 +194,37 @@ class GameGUI:
         
         # Handle banner state transitions
         if self.banner_state == 'round_end':
-            if current_time - self.banner_start_time >= 2000:
+            if current_time - self.banner_start_time >= self._scaled(self.ROUND_END_BANNER_MS):
                 # End banner finished, show start banner
                 self.banner_state = 'round_start'
                 self.banner_start_time = current_time
         elif self.banner_state == 'round_start':
-            if current_time - self.banner_start_time >= 1500:
+            if current_time - self.banner_start_time >= self._scaled(self.ROUND_START_BANNER_MS):
                 # Start banner finished
                 self.banner_state = None
         
-        pygame.draw.rect(self.screen, (60, 45, 30), self.board_rect)
-        pygame.draw.rect(self.screen, (120, 90, 60), self.board_rect, 3)
+        self._start_card_animations(game_state)
+        self.animations.update(current_time)
         
-        pygame.draw.line(self.screen, (120, 90, 60), 
-                        (self.board_rect.x, self.board_rect.centery),
-                        (self.board_rect.right, self.board_rect.centery), 5)
+        dirty_rects = self._collect_dirty_rects(game_state)
+        if not dirty_rects:
+            return []
         
-        row_height = self.board_rect.height // 6
+        # Cards leave play (scorch, round end) only when something changed
+        if len(self.sprites) > 24:
+            self._prune_sprites(game_state)
         
-        for i in range(1, 3):
-            y_top = self.board_rect.y + i * row_height
-            pygame.draw.line(self.screen, (80, 60, 40),
-                           (self.board_rect.x + 10, y_top),
-                           (self.board_rect.right - 10, y_top), 2)
-            
-            y_bottom = self.board_rect.centery + i * row_height
-            pygame.draw.line(self.screen, (80, 60, 40),
-                           (self.board_rect.x + 10, y_bottom),
-                           (self.board_rect.right - 10, y_bottom), 2)
+        # Every draw routine runs, but only pixels inside the dirty area are touched
+        self.screen.set_clip(dirty_rects[0].unionall(dirty_rects[1:]))
+        self.screen.blit(self.background, (0, 0))
         
         self._draw_round_info(game_state)
         self._draw_boards(game_state)
         self._draw_hands(game_state)
         self._draw_score(game_state)
         
-        dt = 16
-        self.animations = [anim for anim in self.animations if anim.update(dt)]
         for anim in self.animations:
-            sprite = CardSprite(anim.card, int(anim.current_x), int(anim.current_y))
+            sprite = self._sprite_for(anim.card, int(anim.current_x), int(anim.current_y))
             sprite.draw(self.screen)
         
         # Player 1 (bottom) controls
@@ -197,22 +285,143 @@ class GameGUI:
         elif self.banner_state == 'round_start':
             self._draw_round_start_announcement(game_state)
         
-        self.hover_offset = (self.hover_offset + self.hover_speed) % 20
+        if game_state.game_over:
+            self.show_game_over(game_state)
+        
+        self.screen.set_clip(None)
+        return dirty_rects
     
-    def _draw_round_info(self, game_state):
-        info_bg = pygame.Surface((160, 50))
-        info_bg.fill((40, 30, 20))
-        info_bg.set_alpha(220)
-        self.screen.blit(info_bg, (10, 10))
-        pygame.draw.rect(self.screen, GOLD, (10, 10, 160, 50), 3)
-
-        # Title
-        title = FONT_MEDIUM.render("NANO GWENT", True, GOLD)
-        title_rect = title.get_rect(center=(90, 35))
-        self.screen.blit(title, title_rect)
+    def _start_card_animations(self, game_state):
+        """Animate every board card whose laid-out position changed since the last frame."""
+        positions = {}
+        board_cards = []
+        for player_id, hand_y in ((0, 680), (1, 20)):
+            player = game_state.players[player_id]
+            for i, card in enumerate(player.hand):
+                positions[card] = (350 + i * (CARD_WIDTH + 5), hand_y)
+            for row_name in ['melee', 'ranged', 'siege']:
+                for i, card in enumerate(player.board[row_name]):
+                    positions[card] = (self.board_rect.x + 60 + i * (CARD_WIDTH + 5), self.row_y[(player_id, row_name)] - 12)
+                    board_cards.append(card)
+        
+        running = {anim.card: anim for anim in self.animations}
+        for card in board_cards:
+            old = self.card_positions.get(card)
+            new = positions[card]
+            if old is not None and old != new and self.speed is not None:
+                anim = running.get(card)
+                start = (anim.current_x, anim.current_y) if anim else old
+                self.animations.add(CardAnimation(card, start, new, self.CARD_MOVE_MS))
+        
+        self.card_positions = positions
+    
+    def skip_animations(self):
+        self.animations.skip_all()
+    
+    def set_speed(self, speed):
+        """Play banners and card moves speed times faster; None shows every change instantly."""
+        self.speed = speed
+        if speed is None:
+            self.animations.skip_all()
+        else:
+            self.animations.speed = speed
+    
+    def _scaled(self, ms):
+        return 0 if self.speed is None else ms / self.speed
+    
+    def reset(self):
+        """Forget the previous game so this GUI can show a new one."""
+        self.selected_card = None
+        self.last_round_number = 0
+        self.banner_state = None
+        self.round_winner = None
+        self.thinking_player = None
+        self.card_positions = {}
+        self.sprites = {}
+        self.animations.skip_all()
+        self.invalidate()
+    
+    def invalidate(self):
+        """Force a full redraw on the next render, e.g. after the window was exposed."""
+        self.region_signatures = {}
+    
+    def next_update_delay(self):
+        """Milliseconds until the screen changes by itself, or None if it is static."""
+        if self.animations:
+            return 0
+        
+        current_time = pygame.time.get_ticks()
+        delays = []
+        if self.banner_state == 'round_end':
+            delays.append(self.banner_start_time + self._scaled(self.ROUND_END_BANNER_MS) - current_time)
+        elif self.banner_state == 'round_start':
+            delays.append(self.banner_start_time + self._scaled(self.ROUND_START_BANNER_MS) - current_time)
+        if self.thinking_player is not None:
+            delays.append(self.THINKING_DOT_MS - current_time % self.THINKING_DOT_MS)
+        if self.bobbing:
+            delays.append(self.HOVER_BOB_MS - current_time % self.HOVER_BOB_MS)
+        
+        if not delays:
+            return None
+        return max(0, min(delays))
+    
+    def _collect_dirty_rects(self, game_state):
+        screen_rect = self.screen.get_rect()
+        p0 = game_state.players[0]
+        p1 = game_state.players[1]
+        selected = id(self.selected_card) if self.selected_card else None
+        turn = (game_state.current_player, game_state.game_over, p0.passed, p1.passed)
+        thinking = (self.thinking_player, self._thinking_phase()) if self.thinking_player is not None else None
+        hovered = self._hovered_hand_card(game_state)
+        self.bobbing = hovered is not None
+        hover = (id(hovered), self._hover_bob()) if hovered is not None else None
+        
+        # region name -> (rect, signature of everything drawn inside it)
+        regions = {
+            'overlay': (screen_rect, (self.banner_state, self.round_winner, game_state.game_over)),
+            'side': (pygame.Rect(0, 0, 300, SCREEN_HEIGHT),
+                     (game_state.round_number, turn, p0.get_board_strength(), p1.get_board_strength(),
+                      p0.rounds_won, p1.rounds_won, self.pass_button.hovered, self.pass_button_p2.hovered,
+                      thinking)),
+            'hand_p0': (pygame.Rect(300, 660, 900, 140), (self._cards_signature(p0.hand), selected, hover)),
+            'hand_p1': (pygame.Rect(300, 10, 900, 100), (self._cards_signature(p1.hand), selected, hover)),
+            'controls_p0': (pygame.Rect(300, 530, 900, 130),
+                            (selected, turn, tuple(b.hovered for b in self.row_buttons.values()))),
+            'controls_p1': (pygame.Rect(300, 110, 900, 130),
+                            (selected, turn, tuple(b.hovered for b in self.row_buttons_p2.values()))),
+        }
         
+        animating_cards = [anim.card for anim in self.animations if anim.active]
+        for (player_id, row_name), y in self.row_y.items():
+            cards = [c for c in game_state.players[player_id].board[row_name] if c not in animating_cards]
+            regions[f'row_{player_id}_{row_name}'] = (
+                pygame.Rect(self.board_rect.x - 20, y - 12, self.board_rect.width + 20, CARD_HEIGHT + 2),
+                self._cards_signature(cards)
+            )
+        
+        dirty_rects = []
+        for name, (rect, signature) in regions.items():
+            if self.region_signatures.get(name) != signature:
+                dirty_rects.append(rect)
+                self.region_signatures[name] = signature
+        
+        # Animated cards: clear where they were, draw where they are
+        animation_rects = [pygame.Rect(int(anim.current_x), int(anim.current_y), CARD_WIDTH, CARD_HEIGHT)
+                           for anim in self.animations]
+        dirty_rects.extend(self.animation_rects)
+        dirty_rects.extend(animation_rects)
+        self.animation_rects = animation_rects
+        
+        if screen_rect in dirty_rects:
+            return [screen_rect]
+        return dirty_rects
+    
+    def _cards_signature(self, cards):
+        return tuple((card.id, card.get_current_strength()) for card in cards)
+    
+    def _draw_round_info(self, game_state):
         # Round number
-        round_text = FONT_TITLE.render(f"ROUND {game_state.round_number}/3", True, WHITE)
+        round_text = render_text(FONT_TITLE, f"ROUND {game_state.round_number}/3", WHITE)
         round_rect = round_text.get_rect(center=(150, 390))
         self.screen.blit(round_text, round_rect)
     
@@ -254,21 +463,18 @@ class GameGUI:
         for i, card in enumerate(cards):
             if card not in animating_cards:
                 x = card_start_x + i * (CARD_WIDTH + 5)
-                sprite = CardSprite(card, x, y - 12)
+                sprite = self._sprite_for(card, x, y - 12)
                 sprite.draw(self.screen)
         
         row_strength = sum(c.get_current_strength() for c in cards)
         
-        strength_bg = pygame.Surface((60, 50))
-        strength_bg.fill((50, 40, 25))
-        strength_bg.set_alpha(230)
         strength_x = self.board_rect.right - 75
         strength_y = y + 10
-        self.screen.blit(strength_bg, (strength_x, strength_y))
-        pygame.draw.rect(self.screen, (120, 90, 60), (strength_x, strength_y, 60, 50), 2)
+        self.screen.blit(self.row_strength_bg, (strength_x, strength_y))
+        draw_border(self.screen, (120, 90, 60), (strength_x, strength_y, 60, 50), 2)
         
         strength_color = GOLD if row_strength > 0 else GRAY
-        strength_text = FONT_LARGE.render(str(row_strength), True, strength_color)
+        strength_text = render_text(FONT_LARGE, str(row_strength), strength_color)
         text_rect = strength_text.get_rect(center=(strength_x + 30, strength_y + 25))
         self.screen.blit(strength_text, text_rect)
     
@@ -279,53 +485,30 @@ class GameGUI:
         hand_y_p1 = 680
         hand_y_p2 = 20
 
-        hand_bg_p1 = pygame.Surface((900, 130))
-        hand_bg_p1.fill((30, 20, 10))
-        hand_bg_p1.set_alpha(180)
-        self.screen.blit(hand_bg_p1, (300, hand_y_p1 - 20))
+        self.screen.blit(self.hand_bg_p1, (300, hand_y_p1 - 20))
+        self.screen.blit(self.hand_bg_p2, (300, hand_y_p2 - 10))
         
-        hand_bg_p2 = pygame.Surface((1000, 100))
-        hand_bg_p2.fill((30, 20, 10))
-        hand_bg_p2.set_alpha(180)
-        self.screen.blit(hand_bg_p2, (300, hand_y_p2 - 10))
+        self.card_sprites.clear()
         
-        self.card_sprites = []
-        
-        # Draw Player 1 (bottom) hand
-        for i, card in enumerate(p1_hand):
-            x = 350 + i * (CARD_WIDTH + 5)
-            y_offset = 0
-            
-            sprite = CardSprite(card, x, hand_y_p1 + y_offset)
-            
-            if self.selected_card == card:
-                sprite.selected = True
-                y_offset = -10
-                sprite.y = hand_y_p1 + y_offset
-            elif sprite.rect.collidepoint(pygame.mouse.get_pos()):
-                hover_amount = abs(10 - (self.hover_offset % 20)) / 2
-                sprite.y = hand_y_p1 - hover_amount
-            
-            self.card_sprites.append(sprite)
-            sprite.draw(self.screen)
-            
-        # Draw Player 2 (top) hand
-        for i, card in enumerate(p2_hand):
-            x = 350 + i * (CARD_WIDTH + 5)
-            y_offset = 0
-            
-            sprite = CardSprite(card, x, hand_y_p2 + y_offset)
-            
-            if self.selected_card == card:
-                sprite.selected = True
-                y_offset = -10
-                sprite.y = hand_y_p2 + y_offset
-            elif sprite.rect.collidepoint(pygame.mouse.get_pos()):
-                hover_amount = abs(10 - (self.hover_offset % 20)) / 2
-                sprite.y = hand_y_p2 + hover_amount
-            
-            self.card_sprites.append(sprite)
-            sprite.draw(self.screen)
+        hovered = self._hovered_hand_card(game_state)
+        for hand, hand_y, bob_direction in ((p1_hand, hand_y_p1, -1), (p2_hand, hand_y_p2, 1)):
+            for i, card in enumerate(hand):
+                x = 350 + i * (CARD_WIDTH + 5)
+                sprite = self._sprite_for(card, x, hand_y)
+                
+                y_offset = 0
+                if self.selected_card == card:
+                    sprite.selected = True
+                    y_offset = -10
+                elif card is hovered:
+                    # The hovered card bobs towards the board
+                    sprite.hovered = True
+                    y_offset = bob_direction * self._hover_bob()
+                
+                self.card_sprites.append(sprite)
+                sprite.rect.y = hand_y + y_offset
+                sprite.draw(self.screen)
+                sprite.rect.y = hand_y  # hit tests use the laid-out position
     
     def _draw_score(self, game_state):
         p1_strength = game_state.players[0].get_board_strength()
@@ -333,7 +516,7 @@ class GameGUI:
         
         # Player 2 score
         p2_color = (255, 100, 100) if p2_strength > p1_strength else WHITE
-        p2_text = FONT_LARGE.render(f"{p2_strength}", True, p2_color)
+        p2_text = render_text(FONT_LARGE, f"{p2_strength}", p2_color)
         
         p2_center = (250, 255)
         pygame.draw.circle(self.screen, p2_color, p2_center, 30, 3)
@@ -341,25 +524,25 @@ class GameGUI:
         self.screen.blit(p2_text, p2_text_rect)
         
         # Player 2 label
-        p2_label = FONT_LARGE.render("Player 2", True, WHITE)
+        p2_label = render_text(FONT_LARGE, "Player 2", WHITE)
         p2_label_rect = p2_label.get_rect(midleft=(105, 225))
         
         # Draw border if it's player 2's turn
         if game_state.current_player == 1:
             border_rect = pygame.Rect(p2_label_rect.x - 5, p2_label_rect.y - 5, 
                                     p2_label_rect.width + 10, p2_label_rect.height + 10)
-            pygame.draw.rect(self.screen, (255, 100, 100), border_rect, 2)
+            draw_border(self.screen, (255, 100, 100), border_rect, 2)
         
         self.screen.blit(p2_label, p2_label_rect)
         
         # Player 2 agent type
-        p2_agent_text = FONT_SMALL.render(f"({self.player1_type})", True, (200, 200, 200))
+        p2_agent_text = render_text(FONT_SMALL, f"({self.player1_type})", (200, 200, 200))
         p2_agent_rect = p2_agent_text.get_rect(center=(150, 252))
         self.screen.blit(p2_agent_text, p2_agent_rect)
 
         # Player 2 pass status
         if game_state.players[1].passed:
-            p2_pass = FONT_SMALL.render("PASSED", True, (150, 150, 150))
+            p2_pass = render_text(FONT_SMALL, "PASSED", (150, 150, 150))
             self.screen.blit(p2_pass, (225, 305))
             
         p2_lost = game_state.players[0].rounds_won
@@ -375,7 +558,7 @@ class GameGUI:
         
         # Player 1 score
         p1_color = (100, 255, 100) if p1_strength > p2_strength else WHITE
-        p1_text = FONT_LARGE.render(f"{p1_strength}", True, p1_color)
+        p1_text = render_text(FONT_LARGE, f"{p1_strength}", p1_color)
         
         p1_center = (250, 520)
         pygame.draw.circle(self.screen, p1_color, p1_center, 30, 3)
@@ -383,25 +566,25 @@ class GameGUI:
         self.screen.blit(p1_text, p1_text_rect)
         
         # Player 1 label
-        p1_label = FONT_LARGE.render("Player 1", True, WHITE)
+        p1_label = render_text(FONT_LARGE, "Player 1", WHITE)
         p1_label_rect = p1_label.get_rect(midleft=(105, 495))
         
         # Draw border if it's player 1's turn
         if game_state.current_player == 0:
             border_rect = pygame.Rect(p1_label_rect.x - 5, p1_label_rect.y - 5, 
                                     p1_label_rect.width + 10, p1_label_rect.height + 10)
-            pygame.draw.rect(self.screen, (100, 255, 100), border_rect, 2)
+            draw_border(self.screen, (100, 255, 100), border_rect, 2)
         
         self.screen.blit(p1_label, p1_label_rect)
         
         # Player 1 agent type
-        p1_agent_text = FONT_SMALL.render(f"({self.player0_type})", True, (200, 200, 200))
+        p1_agent_text = render_text(FONT_SMALL, f"({self.player0_type})", (200, 200, 200))
         p1_agent_rect = p1_agent_text.get_rect(center=(150, 522))
         self.screen.blit(p1_agent_text, p1_agent_rect)
         
         # Player 1 pass status
         if game_state.players[0].passed:
-            p1_pass = FONT_SMALL.render("PASSED", True, (150, 150, 150))
+            p1_pass = render_text(FONT_SMALL, "PASSED", (150, 150, 150))
             self.screen.blit(p1_pass, (225, 570))
             
         p1_lost = game_state.players[1].rounds_won
@@ -414,7 +597,52 @@ class GameGUI:
             else:
                 if self.gray_star_icon:
                     self.screen.blit(self.gray_star_icon, (star_x + i * 32, 530))
+        
+        if self.thinking_player is not None:
+            self._draw_thinking_indicator()
+    
+    def _hovered_hand_card(self, game_state):
+        """The hovered card if it is still in the hand of the player to move, else None."""
+        if self.hovered_card is None or game_state.game_over:
+            return None
+        if self.hovered_card not in game_state.players[game_state.current_player].hand:
+            return None
+        return self.hovered_card
+    
+    def _hover_bob(self):
+        """Pixels the hovered hand card is lifted, 0 to 5 and back."""
+        return abs(5 - (pygame.time.get_ticks() // self.HOVER_BOB_MS) % 10)
+    
+    def _thinking_phase(self):
+        return (pygame.time.get_ticks() // self.THINKING_DOT_MS) % 4
+    
+    def _draw_thinking_indicator(self):
+        center = (150, 330) if self.thinking_player == 1 else (150, 600)
+        text = render_text(FONT_MEDIUM, "Thinking" + "." * self._thinking_phase(), GOLD)
+        text_rect = text.get_rect(midleft=(center[0] - 50, center[1]))
+        self.screen.blit(text, text_rect)
 
+    def update_hover(self, game_state, mouse_pos):
+        """Update what the mouse is over for the player to move; True if that changed.
+        
+        Hover flags are drawn by the next render, so a change has to keep the game loop
+        from going idle before that render.
+        """
+        if game_state.current_player == 0:
+            buttons = [self.pass_button, *self.row_buttons.values()]
+        else:
+            buttons = [self.pass_button_p2, *self.row_buttons_p2.values()]
+        before = ([button.hovered for button in buttons], self.hovered_card)
+        
+        for button in buttons:
+            button.update(mouse_pos)
+        # card_sprites keep the rects the hand was laid out at, without the hover bob
+        hand = game_state.players[game_state.current_player].hand
+        self.hovered_card = next((sprite.card for sprite in self.card_sprites
+                                  if sprite.card in hand and sprite.rect.collidepoint(mouse_pos)), None)
+        
+        return ([button.hovered for button in buttons], self.hovered_card) != before
+    
     def handle_input(self, game_state):
         current_player = game_state.players[game_state.current_player]
         current_player_id = game_state.current_player
@@ -425,17 +653,7 @@ class GameGUI:
         mouse_pos = pygame.mouse.get_pos()
         mouse_pressed = pygame.mouse.get_pressed()
         
-        if current_player_id == 0:
-            self.pass_button.update(mouse_pos)
-            for button in self.row_buttons.values():
-                button.update(mouse_pos)
-        else:
-            self.pass_button_p2.update(mouse_pos)
-            for button in self.row_buttons_p2.values():
-                button.update(mouse_pos)
-        
-        for sprite in self.card_sprites:
-            sprite.update(mouse_pos)
+        self.update_hover(game_state, mouse_pos)
         
         if mouse_pressed[0]:
             if current_player_id == 0:
@@ -445,14 +663,12 @@ class GameGUI:
                 if self.pass_button_p2.is_clicked(mouse_pos, mouse_pressed):
                     return Action(Action.PASS)
             
-            for sprite in self.card_sprites:
-                if sprite.hovered and sprite.card in current_player.hand:
-                    if self.selected_card == sprite.card:
-                        self.selected_card = None
-                    else:
-                        self.selected_card = sprite.card
-                    pygame.time.wait(100)
-                    break
+            if self.hovered_card is not None:
+                if self.selected_card == self.hovered_card:
+                    self.selected_card = None
+                else:
+                    self.selected_card = self.hovered_card
+                pygame.time.wait(100)
             
             if self.selected_card:
                 if self.selected_card.card_type in [0, 1, 2]:
@@ -482,29 +698,24 @@ class GameGUI:
     
     def show_game_over(self, game_state):
         winner = game_state.winner
-        overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
-        overlay.set_alpha(220)
-        overlay.fill((10, 5, 0))
-        self.screen.blit(overlay, (0, 0))
-        
-        result_box = pygame.Surface((700, 450))
-        result_box.fill((40, 30, 20))
-        result_box_rect = result_box.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2))
-        self.screen.blit(result_box, result_box_rect)
-        pygame.draw.rect(self.screen, GOLD, result_box_rect, 4)
-        
-        text = FONT_TITLE.render("Match Over!", True, (100, 255, 100))
+        self.screen.blit(self.game_over_overlay, (0, 0))
+        
+        result_box_rect = self.result_box.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2))
+        self.screen.blit(self.result_box, result_box_rect)
+        draw_border(self.screen, GOLD, result_box_rect, 4)
+        
+        text = render_text(FONT_TITLE, "Match Over!", (100, 255, 100))
 
         text_rect = text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 - 180))
         self.screen.blit(text, text_rect)
         
         table_y = SCREEN_HEIGHT // 2 - 120
-        score_title = FONT_LARGE.render("MATCH SUMMARY", True, GOLD)
+        score_title = render_text(FONT_LARGE, "MATCH SUMMARY", GOLD)
         score_title_rect = score_title.get_rect(center=(SCREEN_WIDTH // 2, table_y))
         self.screen.blit(score_title, score_title_rect)
         
         table_y += 45
-        round_headers = FONT_MEDIUM.render("           ROUND 1         ROUND 2         ROUND 3", True, WHITE)
+        round_headers = render_text(FONT_MEDIUM, "           ROUND 1         ROUND 2         ROUND 3", WHITE)
         round_headers_rect = round_headers.get_rect(center=(SCREEN_WIDTH // 2, table_y))
         self.screen.blit(round_headers, round_headers_rect)
         
@@ -519,7 +730,7 @@ class GameGUI:
             else:
                 round_displays.append(("-", "-", 0, 0))
 
-        p1_label = FONT_MEDIUM.render("Player 1:", True, (100, 255, 100))
+        p1_label = render_text(FONT_MEDIUM, "Player 1:", (100, 255, 100))
         p1_label_rect = p1_label.get_rect()
         p1_label_rect.midleft = (SCREEN_WIDTH // 2 - 250, table_y)
         self.screen.blit(p1_label, p1_label_rect)
@@ -535,13 +746,13 @@ class GameGUI:
             else:
                 color = (200, 200, 200)
 
-            score_text = FONT_MEDIUM.render(p0_str, True, color)
+            score_text = render_text(FONT_MEDIUM, p0_str, color)
             score_rect = score_text.get_rect(center=(x_offset + i * 150, table_y))
             self.screen.blit(score_text, score_rect)
         
         table_y += 40
 
-        p2_label = FONT_MEDIUM.render("Player 2:", True, (255, 100, 100))
+        p2_label = render_text(FONT_MEDIUM, "Player 2:", (255, 100, 100))
         p2_label_rect = p2_label.get_rect()
         p2_label_rect.midleft = (SCREEN_WIDTH // 2 - 250, table_y)
         self.screen.blit(p2_label, p2_label_rect)
@@ -557,68 +768,58 @@ class GameGUI:
             else:
                 color = (200, 200, 200)
 
-            score_text = FONT_MEDIUM.render(p1_str, True, color)
+            score_text = render_text(FONT_MEDIUM, p1_str, color)
             score_rect = score_text.get_rect(center=(x_offset + i * 150, table_y))
             self.screen.blit(score_text, score_rect)
         
         table_y += 60
         if winner is not None:
             if winner == 0:
-                subtext = FONT_LARGE.render("Player 1 Won the Match!", True, GOLD)
+                subtext = render_text(FONT_LARGE, "Player 1 Won the Match!", GOLD)
             else:
-                subtext = FONT_LARGE.render("Player 2 Won the Match!", True, GRAY)
+                subtext = render_text(FONT_LARGE, "Player 2 Won the Match!", GRAY)
         else:
-            subtext = FONT_LARGE.render("Match Ended in a Tie", True, GRAY)
+            subtext = render_text(FONT_LARGE, "Match Ended in a Tie", GRAY)
         
         subtext_rect = subtext.get_rect(center=(SCREEN_WIDTH // 2, table_y))
         self.screen.blit(subtext, subtext_rect)
         
-        continue_text = FONT_MEDIUM.render("Press SPACE to return to menu", True, WHITE)
+        continue_text = render_text(FONT_MEDIUM, "Press SPACE to return to menu", WHITE)
         continue_rect = continue_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 180))
         self.screen.blit(continue_text, continue_rect)
 
     def _draw_round_start_announcement(self, game_state):
-        overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
-        overlay.set_alpha(200)
-        overlay.fill((0, 0, 0))
-        self.screen.blit(overlay, (0, 0))
-        
-        announcement_box = pygame.Surface((500, 200))
-        announcement_box.fill((40, 30, 20))
-        announcement_box_rect = announcement_box.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2))
-        self.screen.blit(announcement_box, announcement_box_rect)
-        pygame.draw.rect(self.screen, GOLD, announcement_box_rect, 4)
-        
-        title = FONT_TITLE.render(f"ROUND {game_state.round_number}", True, GOLD)
+        self.screen.blit(self.banner_overlay, (0, 0))
+        
+        announcement_box_rect = self.announcement_box.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2))
+        self.screen.blit(self.announcement_box, announcement_box_rect)
+        draw_border(self.screen, GOLD, announcement_box_rect, 4)
+        
+        title = render_text(FONT_TITLE, f"ROUND {game_state.round_number}", GOLD)
         title_rect = title.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 - 30))
         self.screen.blit(title, title_rect)
         
-        subtitle = FONT_LARGE.render("Battle Begins!", True, WHITE)
+        subtitle = render_text(FONT_LARGE, "Battle Begins!", WHITE)
         subtitle_rect = subtitle.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 30))
         self.screen.blit(subtitle, subtitle_rect)
 
     def _draw_round_end_announcement(self):
-        overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
-        overlay.set_alpha(200)
-        overlay.fill((0, 0, 0))
-        self.screen.blit(overlay, (0, 0))
-        
-        announcement_box = pygame.Surface((500, 200))
-        announcement_box.fill((40, 30, 20))
-        announcement_box_rect = announcement_box.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2))
-        self.screen.blit(announcement_box, announcement_box_rect)
-        pygame.draw.rect(self.screen, GOLD, announcement_box_rect, 4)
-        
-        title = FONT_TITLE.render("ROUND END", True, GOLD)
+        self.screen.blit(self.banner_overlay, (0, 0))
+        
+        announcement_box_rect = self.announcement_box.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2))
+        self.screen.blit(self.announcement_box, announcement_box_rect)
+        draw_border(self.screen, GOLD, announcement_box_rect, 4)
+        
+        title = render_text(FONT_TITLE, "ROUND END", GOLD)
         title_rect = title.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 - 30))
         self.screen.blit(title, title_rect)
         
         if self.round_winner == 0:
-            subtitle = FONT_LARGE.render("Player 1 Won This Round!", True, (100, 255, 100))
+            subtitle = render_text(FONT_LARGE, "Player 1 Won This Round!", (100, 255, 100))
         elif self.round_winner == 1:
-            subtitle = FONT_LARGE.render("Player 2 Won This Round!", True, (255, 100, 100))
+            subtitle = render_text(FONT_LARGE, "Player 2 Won This Round!", (255, 100, 100))
         else:
-            subtitle = FONT_LARGE.render("Round Draw!", True, WHITE)
+            subtitle = render_text(FONT_LARGE, "Round Draw!", WHITE)
         
         subtitle_rect = subtitle.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 30))
         self.screen.blit(subtitle, subtitle_rect)
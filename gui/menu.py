@@ -1,5 +1,6 @@
 import pygame
-from gui.config import COLORS
+from gui.config import COLORS, render_text, wait_for_events
+from gui.spectator import SPEEDS, BOARD_COUNTS, speed_label
 
 class Button:
     def __init__(self, x, y, width, height, text, font):
@@ -13,7 +14,7 @@ class Button:
         pygame.draw.rect(screen, color, self.rect, border_radius=8)
         pygame.draw.rect(screen, COLORS['text'], self.rect, 2, border_radius=8)
         
-        text_surface = self.font.render(self.text, True, COLORS['text'])
+        text_surface = render_text(self.font, self.text, COLORS['text'])
         text_rect = text_surface.get_rect(center=self.rect.center)
         screen.blit(text_surface, text_rect)
     
@@ -38,6 +39,8 @@ class GameMenu:
         self.state = "main"
         self.selected_ai_0 = None
         self.selected_ai_1 = None
+        self.speed_index = 0
+        self.boards_index = 0
         
         button_width = 300
         button_height = 60
@@ -80,6 +83,11 @@ class GameMenu:
             Button(right_x, ai_start_y + ai_spacing * 2, ai_button_width, ai_button_height, "Minimax Agent", self.button_font)
         ]
         
+        # Spectator options: each click cycles to the next value
+        self.speed_button = Button(self.width // 2 - 260, 470, 250, 50, "", self.button_font)
+        self.boards_button = Button(self.width // 2 + 10, 470, 250, 50, "", self.button_font)
+        self._update_option_labels()
+        
         self.start_button = Button((self.width - 200) // 2, 550, 200, 50, "Start Game", self.button_font)
         self.back_button = Button((self.width - 200) // 2, 620, 200, 50, "Back", self.button_font)
     
@@ -98,15 +106,22 @@ class GameMenu:
         self.selected_ai_0 = None
         self.selected_ai_1 = None
         
-        clock = pygame.time.Clock()
+        last_signature = None
         
         while True:
-            clock.tick(60)
+            signature = self._view_signature()
+            if signature != last_signature:
+                last_signature = signature
+                self._draw()
             
-            for event in pygame.event.get():
+            # The menu only changes on input, so sleep until the next event
+            for event in wait_for_events():
                 if event.type == pygame.QUIT:
                     return None
                 
+                if event.type in (pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED):
+                    last_signature = None
+                
                 if self.state == "main":
                     for i, button in enumerate(self.main_buttons):
                         if button.handle_event(event):
@@ -139,36 +154,59 @@ class GameMenu:
                         if button.handle_event(event):
                             self.selected_ai_1 = button.text
                     
+                    if self.speed_button.handle_event(event):
+                        self.speed_index = (self.speed_index + 1) % len(SPEEDS)
+                        self._update_option_labels()
+                    
+                    if self.boards_button.handle_event(event):
+                        self.boards_index = (self.boards_index + 1) % len(BOARD_COUNTS)
+                        self._update_option_labels()
+                    
                     if self.selected_ai_0 and self.selected_ai_1:
                         if self.start_button.handle_event(event):
                             return {
                                 'mode': 'ai_vs_ai',
                                 'ai_agent_0': agent_map[self.selected_ai_0],
-                                'ai_agent_1': agent_map[self.selected_ai_1]
+                                'ai_agent_1': agent_map[self.selected_ai_1],
+                                'speed': SPEEDS[self.speed_index],
+                                'boards': BOARD_COUNTS[self.boards_index]
                             }
                     
                     if self.back_button.handle_event(event):
                         self.state = "main"
                         self.selected_ai_0 = None
                         self.selected_ai_1 = None
-            
-            self.screen.fill(COLORS['background'])
-            
-            if self.state == "main":
-                self._draw_main_menu()
-            elif self.state == "select_ai":
-                self._draw_ai_selection()
-            elif self.state == "select_ai_vs_ai":
-                self._draw_ai_vs_ai_selection()
-            
-            pygame.display.flip()
+    
+    def _draw(self):
+        self.screen.fill(COLORS['background'])
+        
+        if self.state == "main":
+            self._draw_main_menu()
+        elif self.state == "select_ai":
+            self._draw_ai_selection()
+        elif self.state == "select_ai_vs_ai":
+            self._draw_ai_vs_ai_selection()
+        
+        pygame.display.flip()
+    
+    def _view_signature(self):
+        """Everything the current menu screen shows; redraw only when it changes."""
+        buttons = (self.main_buttons + self.ai_buttons + self.ai_vs_ai_buttons_left +
+                   self.ai_vs_ai_buttons_right +
+                   [self.speed_button, self.boards_button, self.start_button, self.back_button])
+        return (self.state, self.selected_ai_0, self.selected_ai_1, self.speed_index, self.boards_index,
+                tuple(b.hovered for b in buttons))
+    
+    def _update_option_labels(self):
+        self.speed_button.text = f"Speed: {speed_label(SPEEDS[self.speed_index])}"
+        self.boards_button.text = f"Boards: {BOARD_COUNTS[self.boards_index]}"
     
     def _draw_main_menu(self):
-        title = self.title_font.render("Nano Gwent", True, COLORS['text'])
+        title = render_text(self.title_font, "Nano Gwent", COLORS['text'])
         title_rect = title.get_rect(center=(self.width // 2, 150))
         self.screen.blit(title, title_rect)
         
-        subtitle = self.small_font.render("Select Game Mode", True, COLORS['text'])
+        subtitle = render_text(self.small_font, "Select Game Mode", COLORS['text'])
         subtitle_rect = subtitle.get_rect(center=(self.width // 2, 220))
         self.screen.blit(subtitle, subtitle_rect)
         
@@ -176,7 +214,7 @@ class GameMenu:
             button.draw(self.screen)
     
     def _draw_ai_selection(self):
-        title = self.title_font.render("Select AI Opponent", True, COLORS['text'])
+        title = render_text(self.title_font, "Select AI Opponent", COLORS['text'])
         title_rect = title.get_rect(center=(self.width // 2, 120))
         self.screen.blit(title, title_rect)
         
@@ -184,15 +222,15 @@ class GameMenu:
             button.draw(self.screen)
     
     def _draw_ai_vs_ai_selection(self):
-        title = self.title_font.render("Select AI Agents", True, COLORS['text'])
+        title = render_text(self.title_font, "Select AI Agents", COLORS['text'])
         title_rect = title.get_rect(center=(self.width // 2, 80))
         self.screen.blit(title, title_rect)
         
-        left_label = self.button_font.render("Player 1 (Bottom)", True, COLORS['text'])
+        left_label = render_text(self.button_font, "Player 1 (Bottom)", COLORS['text'])
         left_rect = left_label.get_rect(center=(self.width // 4, 180))
         self.screen.blit(left_label, left_rect)
         
-        right_label = self.button_font.render("Player 2 (Top)", True, COLORS['text'])
+        right_label = render_text(self.button_font, "Player 2 (Top)", COLORS['text'])
         right_rect = right_label.get_rect(center=(3 * self.width // 4, 180))
         self.screen.blit(right_label, right_rect)
         
@@ -206,6 +244,9 @@ class GameMenu:
                 pygame.draw.rect(self.screen, (0, 255, 0), button.rect.inflate(10, 10), 3, border_radius=8)
             button.draw(self.screen)
         
+        self.speed_button.draw(self.screen)
+        self.boards_button.draw(self.screen)
+        
         if self.selected_ai_0 and self.selected_ai_1:
             self.start_button.draw(self.screen)
         
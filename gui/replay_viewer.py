@@ -0,0 +1,137 @@
+import pygame
+from core.game_engine import GameEngine
+from core.match_log import AGENT_NAMES
+from core.replay import Replay
+from gui.game_gui import GameGUI
+from gui.spectator import MOVE_DELAY_MS
+
+MIN_SPEED = 1 / 16
+MAX_SPEED = 256
+
+
+def _agent_name(code):
+    return AGENT_NAMES.get(code, "?")
+
+
+class ReplayViewer:
+    """Plays a logged game back in the game window at any speed, with stepping and seeking.
+
+    Keys: SPACE pause/resume, LEFT/RIGHT one move back/forward, PAGE UP/PAGE DOWN previous/next
+    round, HOME/END start/end, +/- double/halve the speed, TAB skip animations, ESC quit.
+    Playing forward executes the logged actions on a live GameState so the board animates
+    as in a real game; every jump backwards or across rounds is rebuilt from a keyframe.
+    """
+
+    def __init__(self, screen, replay, speed=1.0, position=0, title="Replay"):
+        self.screen = screen
+        self.replay = replay
+        self.speed = speed
+        self.title = title
+        self.paused = False
+        agents = replay.agents or (None, None)
+        self.gui = GameGUI(screen, _agent_name(agents[0]), _agent_name(agents[1]))
+        self.gui.set_speed(speed)
+        self.seek(position)
+
+    def seek(self, position):
+        self.position = max(0, min(position, len(self.replay)))
+        self.game_state = self.replay.state_at(self.position)
+        self.game_engine = GameEngine(self.game_state)
+        self.gui.reset()
+        # No round banner for a position we jumped to
+        self.gui.last_round_number = self.game_state.round_number
+        self.next_move_time = pygame.time.get_ticks() + MOVE_DELAY_MS / self.speed
+
+    def step_forward(self):
+        if self.position >= len(self.replay):
+            return False
+        Replay.play(self.game_engine, self.replay.actions[self.position])
+        self.position += 1
+        return True
+
+    def set_speed(self, speed):
+        self.speed = max(MIN_SPEED, min(speed, MAX_SPEED))
+        self.gui.set_speed(self.speed)
+        self.next_move_time = min(self.next_move_time, pygame.time.get_ticks() + MOVE_DELAY_MS / self.speed)
+
+    def _seek_round(self, direction):
+        current_round = self.game_state.round_number
+        starts = [position for position, _ in self.replay.keyframes]
+        if direction < 0:
+            # Back to the start of this round, or of the previous one if already there
+            earlier = [start for start in starts if start < self.position]
+            self.seek(earlier[-1] if earlier else 0)
+        else:
+            later = [position for position, state in self.replay.keyframes if state.round_number > current_round]
+            self.seek(later[0] if later else len(self.replay))
+
+    def handle_key(self, key):
+        if key == pygame.K_SPACE:
+            self.paused = not self.paused
+            self.next_move_time = pygame.time.get_ticks() + MOVE_DELAY_MS / self.speed
+        elif key == pygame.K_RIGHT:
+            self.paused = True
+            self.step_forward()
+        elif key == pygame.K_LEFT:
+            self.paused = True
+            self.seek(self.position - 1)
+        elif key == pygame.K_PAGEUP:
+            self._seek_round(-1)
+        elif key == pygame.K_PAGEDOWN:
+            self._seek_round(1)
+        elif key == pygame.K_HOME:
+            self.seek(0)
+        elif key == pygame.K_END:
+            self.seek(len(self.replay))
+        elif key in (pygame.K_PLUS, pygame.K_EQUALS, pygame.K_KP_PLUS):
+            self.set_speed(self.speed * 2)
+        elif key in (pygame.K_MINUS, pygame.K_KP_MINUS):
+            self.set_speed(self.speed / 2)
+        elif key == pygame.K_TAB:
+            self.gui.skip_animations()
+
+    def update(self, now):
+        """Play the next move if one is due; return True if the position changed."""
+        if self.paused or self.position >= len(self.replay):
+            return False
+        if self.gui.banner_state is not None or now < self.next_move_time:
+            return False
+        self.step_forward()
+        self.next_move_time = now + MOVE_DELAY_MS / self.speed
+        return True
+
+    def run(self):
+        """Play until ESC or the window is closed."""
+        clock = pygame.time.Clock()
+        caption = None
+        while True:
+            for event in pygame.event.get():
+                if event.type == pygame.QUIT:
+                    return
+                if event.type == pygame.KEYDOWN:
+                    if event.key == pygame.K_ESCAPE:
+                        return
+                    self.handle_key(event.key)
+                if event.type in (pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED):
+                    self.gui.invalidate()
+
+            self.update(pygame.time.get_ticks())
+            dirty_rects = self.gui.render(self.game_state)
+            if dirty_rects:
+                pygame.display.update(dirty_rects)
+
+            new_caption = self.caption()
+            if new_caption != caption:
+                pygame.display.set_caption(new_caption)
+                caption = new_caption
+            clock.tick(60)
+
+    def caption(self):
+        state = "paused" if self.paused else f"{self.speed:g}x"
+        if self.position < len(self.replay):
+            player = self.replay.actors[self.position] + 1
+            move = f"move {self.position + 1}/{len(self.replay)} (P{player} to play)"
+        else:
+            move = f"end of game after {len(self.replay)} moves"
+        return (f"Nano Gwent - {self.title} | round {self.game_state.round_number}, {move} | {state} | "
+                f"SPACE pause, arrows step, PGUP/PGDN rounds, +/- speed")
@@ -0,0 +1,282 @@
+import math
+import threading
+import pygame
+from core.game_state import GameState
+from core.game_engine import GameEngine
+from agents.agent_worker import AgentWorker
+from agents.minimax_agent import MinimaxAgent
+from agents.search_cache import make_agent
+from gui.config import SCREEN_WIDTH, SCREEN_HEIGHT
+from gui.game_gui import GameGUI
+
+# Speed multipliers offered by the menu; None runs the agents back to back
+SPEEDS = [1, 2, 4, 16, None]
+BOARD_COUNTS = [1, 4, 9]
+
+# Pace of a 1x game: time between AI moves, and how long a finished board stays up
+MOVE_DELAY_MS = 500
+GAME_OVER_HOLD_MS = 3000
+
+
+def speed_label(speed):
+    return "Max" if speed is None else f"{speed}x"
+
+
+class SpectatorMatch:
+    """One board of the spectator view: an AI vs AI game that restarts with a new deal when over.
+
+    Search agents decide on an AgentWorker thread, so a long search never holds up the frame.
+    Uncapped, the other agents decide inline: they take about a millisecond, less than
+    handing the decision to a thread and waiting for it.
+    """
+
+    def __init__(self, agent0_class, agent1_class, surface, speed, match_log=None, search_cache=None,
+                 book=None, on_decided=None):
+        self.agent_classes = (agent0_class, agent1_class)
+        self.worker = AgentWorker(on_done=on_decided)
+        self.thinking = False
+        self.search_cache = search_cache
+        self.book = book
+        self.names = (agent0_class.__name__.replace('Agent', ''), agent1_class.__name__.replace('Agent', ''))
+        self.match_log = match_log
+        self.gui = GameGUI(surface, *self.names)
+        self.gui.set_speed(speed)
+        self.speed = speed
+        self.results = {0: 0, 1: 0, None: 0}  # games won by seat, None = draw
+        self.states_since_render = 0
+        self.new_game(0)
+
+    def new_game(self, now):
+        self.game_state = GameState()
+        self.game_state.initialize()
+        recorder = self.match_log.recorder(self.names) if self.match_log else None
+        self.game_engine = GameEngine(self.game_state, recorder)
+        self.agents = {seat: make_agent(self.agent_classes[seat], seat, self.search_cache, self.book) for seat in (0, 1)}
+        self.worker.cancel()
+        self.thinking = False
+        self.gui.reset()
+        self.next_move_time = now + self._scaled(MOVE_DELAY_MS)
+        self.finished_time = None
+
+    def set_speed(self, speed, now):
+        self.speed = speed
+        self.gui.set_speed(speed)
+        self.next_move_time = min(self.next_move_time, now + self._scaled(MOVE_DELAY_MS))
+
+    def _scaled(self, ms):
+        return 0 if self.speed is None else ms / self.speed
+
+    def stop(self):
+        """Abandon a decision that is still being computed."""
+        self.worker.cancel()
+        self.thinking = False
+
+    def step(self, now):
+        """Advance by one state if one is due and decided; return True if the game state changed."""
+        game_state = self.game_state
+
+        if game_state.game_over:
+            if now - self.finished_time < self._scaled(GAME_OVER_HOLD_MS):
+                return False
+            self.new_game(now)
+            return True
+
+        if not self.thinking and self.game_engine.check_auto_end_round():
+            self._check_finished(now)
+            return True
+
+        agent = self.agents[game_state.current_player]
+        if self.speed is None and not isinstance(agent, MinimaxAgent):
+            self._play(agent.decide_action(game_state, self.game_engine.get_valid_actions()), now)
+            return True
+
+        # The agent starts thinking right away, during the banners and the move delay
+        if not self.thinking:
+            self.worker.start(agent, game_state, self.game_engine.get_valid_actions())
+            self.thinking = True
+
+        # Paced games wait for the round banners and the move delay, uncapped ones never do
+        if self.speed is not None and (self.gui.banner_state is not None or now < self.next_move_time):
+            return False
+
+        action = self.worker.poll()
+        if action is None:
+            return False
+        self.thinking = False
+        self._play(action, now)
+        return True
+
+    def _play(self, action, now):
+        self.game_engine.execute_action(action)
+        self.next_move_time = now + self._scaled(MOVE_DELAY_MS)
+        self._check_finished(now)
+
+    def _check_finished(self, now):
+        if self.game_state.game_over:
+            self.finished_time = now
+            self.results[self.game_state.winner] += 1
+
+
+class Spectator:
+    """Fast-forward AI vs AI: several boards in a grid, played at a speed multiplier.
+
+    At a finite speed every board makes at most one move per frame, paced like the normal
+    AI vs AI mode but speed times faster. Uncapped, the boards are stepped back to back for
+    one display frame's worth of time and only the resulting states are drawn, so the
+    agents run as fast as they can; render_every additionally stops a board after that many
+    states per frame so every Nth state is shown. A board whose agent is still deciding
+    is skipped, and when every board is, the frame waits for the first decision or its end.
+    """
+
+    def __init__(self, screen, agent0_class, agent1_class, boards=1, speed=1,
+                 target_fps=30, render_every=None, match_log=None, search_cache=None, book=None):
+        self.screen = screen
+        self.speed = speed
+        self.target_fps = target_fps
+        self.render_every = render_every
+        self.names = (agent0_class.__name__.replace('Agent', ''), agent1_class.__name__.replace('Agent', ''))
+
+        # Boards are shrunk by a whole factor, so every cell pixel covers the same block of board pixels
+        cols = math.ceil(math.sqrt(boards))
+        self.shrink = cols
+        cell_width = SCREEN_WIDTH // cols
+        cell_height = SCREEN_HEIGHT // cols
+
+        self.decided = threading.Event()  # set by the boards' workers when a decision is ready
+        self.matches = []
+        self.cells = []  # (match, full-size board surface or None, screen rect it is shown in)
+        for index in range(boards):
+            if boards == 1:
+                board_surface = None
+                cell_rect = screen.get_rect()
+            else:
+                # Each board renders at full size off screen and is scaled into its cell
+                board_surface = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT)).convert(screen)
+                cell_rect = pygame.Rect((index % cols) * cell_width, (index // cols) * cell_height,
+                                        cell_width, cell_height)
+            surface = screen if board_surface is None else board_surface
+            match = SpectatorMatch(agent0_class, agent1_class, surface, speed, match_log, search_cache, book,
+                                   on_decided=self.decided.set)
+            self.matches.append(match)
+            self.cells.append((match, board_surface, cell_rect))
+
+        self.start_time = 0
+        self.caption_time = 0
+
+    def run(self):
+        """Play until ESC (returns True, back to the menu) or the window is closed (returns False)."""
+        clock = pygame.time.Clock()
+        self.screen.fill((0, 0, 0))
+        pygame.display.flip()
+        self.start_time = pygame.time.get_ticks()
+
+        while True:
+            for event in pygame.event.get():
+                if event.type == pygame.QUIT:
+                    self._stop()
+                    return False
+                if event.type == pygame.KEYDOWN:
+                    if event.key == pygame.K_ESCAPE:
+                        self._stop()
+                        pygame.display.set_caption("Nano Gwent")
+                        return True
+                    if event.key in (pygame.K_PLUS, pygame.K_EQUALS, pygame.K_KP_PLUS):
+                        self._change_speed(1)
+                    elif event.key in (pygame.K_MINUS, pygame.K_KP_MINUS):
+                        self._change_speed(-1)
+                    elif event.key == pygame.K_TAB:
+                        for match in self.matches:
+                            match.gui.skip_animations()
+                if event.type in (pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED):
+                    for match in self.matches:
+                        match.gui.invalidate()
+
+            if self.speed is None:
+                self._step_uncapped()
+            else:
+                now = pygame.time.get_ticks()
+                for match in self.matches:
+                    if match.step(now):
+                        match.states_since_render += 1
+
+            dirty_rects = self._render()
+            if dirty_rects:
+                pygame.display.update(dirty_rects)
+            self._update_caption()
+
+            clock.tick(self.target_fps if self.speed is None else 60)
+
+    def _stop(self):
+        for match in self.matches:
+            match.stop()
+
+    def _step_uncapped(self):
+        frame_end = pygame.time.get_ticks() + 1000 / self.target_fps
+        active = list(self.matches)
+        while active and pygame.time.get_ticks() < frame_end:
+            self.decided.clear()
+            now = pygame.time.get_ticks()
+            advanced = False
+            for match in list(active):
+                if not match.step(now):
+                    continue  # its agent is still deciding
+                advanced = True
+                match.states_since_render += 1
+                if self.render_every and match.states_since_render >= self.render_every:
+                    active.remove(match)
+            if not advanced:
+                # Sleep until a worker finishes rather than spin against the agents' threads
+                self.decided.wait(max(0, frame_end - pygame.time.get_ticks()) / 1000)
+
+    def _render(self):
+        dirty_rects = []
+        for match, board_surface, cell_rect in self.cells:
+            rects = match.gui.render(match.game_state)
+            match.states_since_render = 0
+            if not rects:
+                continue
+            if board_surface is None:
+                dirty_rects.extend(rects)
+            else:
+                # Only the changed parts of the board are scaled into the cell
+                for rect in rects:
+                    dirty_rects.append(self._scale_region(board_surface, rect, cell_rect))
+        return dirty_rects
+
+    def _scale_region(self, board_surface, rect, cell_rect):
+        """Scale one dirty area of a board into its place in the cell; return the screen rect."""
+        k = self.shrink
+        left, top = rect.left // k, rect.top // k
+        right = min(-(-rect.right // k), cell_rect.width)
+        bottom = min(-(-rect.bottom // k), cell_rect.height)
+
+        # Whole k x k blocks, so the result matches scaling the full board
+        source = pygame.Rect(left * k, top * k, (right - left) * k, (bottom - top) * k)
+        dest = pygame.Rect(cell_rect.x + left, cell_rect.y + top, right - left, bottom - top)
+        pygame.transform.smoothscale(board_surface.subsurface(source), dest.size, self.screen.subsurface(dest))
+        return dest
+
+    def _change_speed(self, direction):
+        index = SPEEDS.index(self.speed) + direction
+        if 0 <= index < len(SPEEDS):
+            self.speed = SPEEDS[index]
+            now = pygame.time.get_ticks()
+            for match in self.matches:
+                match.set_speed(self.speed, now)
+
+    def _update_caption(self):
+        now = pygame.time.get_ticks()
+        if now - self.caption_time < 1000:
+            return
+        self.caption_time = now
+
+        wins0 = sum(match.results[0] for match in self.matches)
+        wins1 = sum(match.results[1] for match in self.matches)
+        draws = sum(match.results[None] for match in self.matches)
+        games = wins0 + wins1 + draws
+        minutes = max(now - self.start_time, 1) / 60000
+        pygame.display.set_caption(
+            f"Nano Gwent - {len(self.matches)} board(s) at {speed_label(self.speed)} (+/- to change) | "
+            f"P1 {self.names[0]} {wins0} - {wins1} {self.names[1]} P2, {draws} draws | "
+            f"{games} games, {games / minutes:.1f}/min"
+        )
@@ -1,28 +1,87 @@
 import pygame
+import os
 import sys
 from core.game_state import GameState
 from core.game_engine import GameEngine
+from core.match_log import MatchLogWriter
+from agents.agent_worker import AgentWorker
+from agents.decision_stats import DecisionStats, instrument
+from agents.minimax_agent import MinimaxAgent
+from agents.opening_book import OpeningBook
+from agents.search_cache import SearchCache, make_agent
+from agents.speculation import Speculator
 from gui.game_gui import GameGUI
 from gui.menu import GameMenu
-from gui.config import SCREEN_WIDTH, SCREEN_HEIGHT
+from gui.spectator import Spectator
+from gui.config import SCREEN_WIDTH, SCREEN_HEIGHT, AI_DONE_EVENT, load_window_icon, preload_assets_in_background, wait_for_events
 
-def main():
+# Minimum time an AI turn takes on screen, so moves stay readable
+AI_MOVE_DELAY = 500
+
+# Set to a file path to append every finished game to a binary match log
+MATCH_LOG_ENV = 'NANO_GWENT_MATCH_LOG'
+
+# Set to a JSON file path to collect AI decision latency histograms across sessions
+# (print them with python -m tools.decision_report <file>)
+DECISION_STATS_ENV = 'NANO_GWENT_DECISION_STATS'
+
+# Set to a file path to keep Minimax search results across games and restarts: the cache
+# is loaded from the file at startup and written back on exit
+SEARCH_CACHE_ENV = 'NANO_GWENT_SEARCH_CACHE'
+
+# Set to an opening book built by python -m tools.build_book; Minimax agents play its
+# round 1 moves without searching
+OPENING_BOOK_ENV = 'NANO_GWENT_OPENING_BOOK'
+
+# Number of worker processes that work out the AI's replies to the human's moves while the
+# human thinks (human vs AI games); one less than the CPU count by default, 0 turns it off
+SPECULATION_WORKERS_ENV = 'NANO_GWENT_SPECULATION_WORKERS'
+
+def create_window():
+    """Open the game window; card images and icons keep loading in the background."""
     pygame.init()
     screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
     pygame.display.set_caption("Nano Gwent")
     
-    icon = pygame.image.load('assets/images/icon.webp')
-    pygame.display.set_icon(icon)
+    pygame.display.set_icon(load_window_icon())
+    
+    preload_assets_in_background()
+    return screen
+
+def main():
+    screen = create_window()
     
     menu = GameMenu(screen)
     clock = pygame.time.Clock()
     
+    match_log_path = os.environ.get(MATCH_LOG_ENV)
+    match_log = MatchLogWriter(match_log_path) if match_log_path else None
+    decision_stats_path = os.environ.get(DECISION_STATS_ENV)
+    decision_stats = _load_decision_stats(decision_stats_path) if decision_stats_path else None
+    search_cache_path = os.environ.get(SEARCH_CACHE_ENV)
+    search_cache = SearchCache.load(search_cache_path) if search_cache_path else None
+    opening_book_path = os.environ.get(OPENING_BOOK_ENV)
+    opening_book = _load_opening_book(opening_book_path) if opening_book_path else None
+    speculation_workers = os.environ.get(SPECULATION_WORKERS_ENV)
+    speculation_workers = int(speculation_workers) if speculation_workers else None
+    speculator = None  # started with the first human vs AI game
+    
     while True:
         game_config = menu.run()
         
         if game_config is None:
             break
         
+        if game_config['mode'] == 'ai_vs_ai' and (game_config['speed'] != 1 or game_config['boards'] > 1):
+            # Fast-forward and multi-board games run synchronously in the spectator view
+            spectator = Spectator(screen, game_config['ai_agent_0'], game_config['ai_agent_1'],
+                                  boards=game_config['boards'], speed=game_config['speed'],
+                                  match_log=match_log, search_cache=search_cache,
+                                  book=opening_book)
+            if not spectator.run():
+                break
+            continue
+        
         game_state = GameState()
         game_state.initialize()
         game_engine = GameEngine(game_state)
@@ -36,16 +95,31 @@ def main():
             pass
         elif game_config['mode'] == 'human_vs_ai':
             agent_class = game_config['ai_agent']
-            player1_agent = agent_class(1)
+            player1_agent = make_agent(agent_class, 1, search_cache, opening_book)
             player1_type = agent_class.__name__.replace('Agent', '')
+            # Only Minimax agents are speculated for (see agents/speculation.py)
+            if speculator is None and speculation_workers != 0 and issubclass(agent_class, MinimaxAgent):
+                speculator = Speculator(speculation_workers, opening_book, search_cache)
         elif game_config['mode'] == 'ai_vs_ai':
             agent0_class = game_config['ai_agent_0']
             agent1_class = game_config['ai_agent_1']
-            player0_agent = agent0_class(0)
-            player1_agent = agent1_class(1)
+            player0_agent = make_agent(agent0_class, 0, search_cache, opening_book)
+            player1_agent = make_agent(agent1_class, 1, search_cache, opening_book)
             player0_type = agent0_class.__name__.replace('Agent', '')
             player1_type = agent1_class.__name__.replace('Agent', '')
         
+        agents = {0: player0_agent, 1: player1_agent}
+        if decision_stats is not None:
+            for agent in agents.values():
+                if agent:
+                    instrument(agent, decision_stats)
+        if match_log:
+            game_engine.recorder = match_log.recorder((player0_type, player1_type))
+        game_speculator = speculator if game_config['mode'] == 'human_vs_ai' else None
+        agent_worker = AgentWorker(on_done=_post_ai_done, speculator=game_speculator,
+                                   decision_stats=decision_stats)
+        ai_turn_start = 0
+        
         gui = GameGUI(screen, player0_type, player1_type)
         
         gui.last_round_number = 0
@@ -56,28 +130,59 @@ def main():
         first_render_done = False
         
         running = True
+        idle = False
         
         while running:
-            clock.tick(60)
+            if idle:
+                # Nothing moved last frame: sleep until input, a GUI timer or the AI wakes us
+                timeout = gui.next_update_delay()
+                if gui.thinking_player is not None:
+                    remaining = AI_MOVE_DELAY - (pygame.time.get_ticks() - ai_turn_start)
+                    if remaining > 0:
+                        timeout = remaining if timeout is None else min(timeout, remaining)
+                events = wait_for_events(timeout)
+                clock.tick()
+            else:
+                clock.tick(60)
+                events = pygame.event.get()
+            
+            state_changed = False
             
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
+            for event in events:
+                if event.type in (pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED):
+                    gui.invalidate()
+                elif event.type == pygame.QUIT:
+                    agent_worker.cancel()
+                    if decision_stats is not None:
+                        decision_stats.save(decision_stats_path)
+                    if search_cache is not None:
+                        _save_search_cache(search_cache, search_cache_path)
+                    if speculator is not None:
+                        speculator.shutdown()
                     pygame.quit()
                     sys.exit()
+                elif event.type == pygame.KEYDOWN and event.key == pygame.K_TAB:
+                    gui.skip_animations()
                 elif event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE:
+                    # Also abandons a decision that is still being computed
+                    agent_worker.cancel()
+                    if game_speculator is not None:
+                        game_speculator.cancel()
+                    gui.thinking_player = None
                     running = False
                 elif game_state.game_over:
                     if event.type == pygame.KEYDOWN and event.key == pygame.K_SPACE:
                         running = False
             
             # Render first to trigger the banner
-            gui.render(game_state)
+            dirty_rects = gui.render(game_state)
             
             if not first_render_done:
                 first_render_done = True
             
             if not game_state.game_over:
-                game_engine.check_auto_end_round()
+                if game_engine.check_auto_end_round():
+                    state_changed = True
             
             announcements_showing = gui.banner_state is not None
             
@@ -90,48 +195,86 @@ def main():
             if game_config['mode'] == 'ai_vs_ai':
                 can_make_move = can_make_move and match_started
             
-            if can_make_move:
+            if can_make_move and running:
                 current_player_id = game_state.current_player
+                agent = agents[current_player_id]
                 
-                if current_player_id == 0:
-                    if player0_agent:
-                        pygame.time.wait(500)
-                        valid_actions = game_engine.get_valid_actions()
-                        action = player0_agent.decide_action(game_state, valid_actions)
-                        game_engine.execute_action(action)
-                    else:
-                        action = gui.handle_input(game_state)
+                if agent:
+                    # The agent decides on a worker thread; keep rendering until it is done
+                    if gui.thinking_player is None:
+                        agent_worker.start(agent, game_state, game_engine.get_valid_actions())
+                        gui.thinking_player = current_player_id
+                        ai_turn_start = pygame.time.get_ticks()
+                        state_changed = True
+                    elif pygame.time.get_ticks() - ai_turn_start >= AI_MOVE_DELAY:
+                        action = agent_worker.poll()
                         if action:
-                            valid_actions = game_engine.get_valid_actions()
-                            if _is_action_valid(action, valid_actions):
-                                game_engine.execute_action(action)
-                                gui.selected_card = None
-                
-                elif current_player_id == 1:
-                    if player1_agent:
-                        pygame.time.wait(500)
+                            gui.thinking_player = None
+                            game_engine.execute_action(action)
+                            state_changed = True
+                else:
+                    opponent = agents[1 - current_player_id]
+                    if game_speculator is not None and opponent:
+                        # Work out the AI's replies while the human thinks
+                        game_speculator.start(opponent, game_state)
+                    selected_before = gui.selected_card
+                    # A hover change is drawn by the next render, which must not wait for an event
+                    if gui.update_hover(game_state, pygame.mouse.get_pos()):
+                        state_changed = True
+                    action = gui.handle_input(game_state)
+                    if action:
                         valid_actions = game_engine.get_valid_actions()
-                        action = player1_agent.decide_action(game_state, valid_actions)
-                        game_engine.execute_action(action)
-                    else:
-                        action = gui.handle_input(game_state)
-                        if action:
-                            valid_actions = game_engine.get_valid_actions()
-                            if _is_action_valid(action, valid_actions):
-                                game_engine.execute_action(action)
-                                gui.selected_card = None
+                        if _is_action_valid(action, valid_actions):
+                            game_engine.execute_action(action)
+                            gui.selected_card = None
+                            state_changed = True
+                    if gui.selected_card is not selected_before or pygame.mouse.get_pressed()[0]:
+                        state_changed = True
             
-            if game_state.game_over:
-                gui.show_game_over(game_state)
+            if dirty_rects:
+                pygame.display.update(dirty_rects)
             
-            pygame.display.flip()
+            idle = not dirty_rects and not state_changed
         
+        if decision_stats is not None:
+            decision_stats.save(decision_stats_path)
         if game_state.game_over:
+            if match_log:
+                match_log.flush()
             pygame.time.wait(2000)
     
+    if search_cache is not None:
+        _save_search_cache(search_cache, search_cache_path)
+    if speculator is not None:
+        speculator.shutdown()
     pygame.quit()
     sys.exit()
 
+def _load_decision_stats(path):
+    if os.path.exists(path):
+        return DecisionStats.load(path)
+    return DecisionStats()
+
+def _load_opening_book(path):
+    try:
+        return OpeningBook.load(path)
+    except (OSError, ValueError) as e:
+        # A missing or unreadable book, or one from an older build; play without it
+        # rather than refuse to start
+        print(f"Ignoring opening book: {e}", file=sys.stderr)
+        return None
+
+def _save_search_cache(search_cache, path):
+    # SearchCache.load starts empty when the snapshot can't be read; an unwritable path
+    # likewise only loses the snapshot, not the exit
+    try:
+        search_cache.save(path)
+    except OSError as e:
+        print(f"Could not save search cache: {e}", file=sys.stderr)
+
+def _post_ai_done():
+    pygame.event.post(pygame.event.Event(AI_DONE_EVENT))
+
 def _is_action_valid(action, valid_actions):
     for valid_action in valid_actions:
         if action.type == valid_action.type:
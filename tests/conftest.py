@@ -0,0 +1,44 @@
+import pytest
+
+from agents.csp_agent import CSPAgent
+from agents.fis_agent import FISAgent
+from core.deals import game_rng, random_deals
+from core.match import play_match
+from core.match_log import MatchLogWriter
+from tools.bench_engine import build_corpus
+
+
+@pytest.fixture(scope='session')
+def corpus():
+    """Every position of six seeded FIS vs CSP games, as tools/bench_engine.py times them."""
+    return [game_state for game_state, _ in build_corpus(random_deals(6, 7), 7)]
+
+
+def cards_left(game_state):
+    return sum(len(player.hand) for player in game_state.players.values())
+
+
+class RandomAgent:
+    """Plays a random valid action, passes included, to reach turn orders the real agents avoid."""
+
+    def __init__(self, player_id, rng):
+        self.player_id = player_id
+        self.rng = rng
+
+    def decide_action(self, game_state, valid_actions):
+        return self.rng.choice(valid_actions)
+
+
+@pytest.fixture(scope='session')
+def logged_games(tmp_path_factory):
+    """(path of a match log, final states of its games): FIS vs CSP, then random play."""
+    path = tmp_path_factory.mktemp('logs') / 'games.ngml'
+    finals = []
+    with MatchLogWriter(str(path)) as log:
+        for game, deal in enumerate(random_deals(40, 11)):
+            if game < 20:
+                agents = (FISAgent(0, rng=game_rng(11, game, 0)), CSPAgent(1, rng=game_rng(11, game, 1)))
+            else:
+                agents = (RandomAgent(0, game_rng(11, game, 0)), RandomAgent(1, game_rng(11, game, 1)))
+            finals.append(play_match(*agents, card_ids=deal, log=log))
+    return str(path), finals
@@ -0,0 +1,66 @@
+import random
+import threading
+
+import pytest
+
+from agents.agent_worker import AgentWorker
+from agents.base_agent import BaseAgent
+from agents.fis_agent import FISAgent
+from core.game_engine import GameEngine
+
+
+class _Stuck(BaseAgent):
+    """Searches until told to stop, as a cancelled search does."""
+
+    def __init__(self, player_id):
+        super().__init__(player_id)
+        self.started = threading.Event()
+
+    def decide_action(self, game_state, valid_actions):
+        self.started.set()
+        while True:
+            self.check_stop()
+
+
+class _Broken(BaseAgent):
+    def decide_action(self, game_state, valid_actions):
+        raise RuntimeError('broken agent')
+
+
+def _run(worker, agent, game_state):
+    done = threading.Event()
+    worker.on_done = done.set
+    valid_actions = GameEngine(game_state).get_valid_actions()
+    worker.start(agent, game_state, valid_actions)
+    assert done.wait(10)
+    return valid_actions, worker.poll()
+
+
+def test_decision_is_the_agents_and_from_the_live_actions(corpus):
+    worker = AgentWorker()
+    for game_state in corpus[::10]:
+        # Same seed for both, as FIS breaks ties at random
+        agent = FISAgent(game_state.current_player, rng=random.Random(0))
+        expected = FISAgent(game_state.current_player, rng=random.Random(0)).decide_action(game_state.clone(), GameEngine(game_state.clone()).get_valid_actions())
+        valid_actions, action = _run(worker, agent, game_state)
+        assert action.key() == expected.key()
+        assert any(action is live for live in valid_actions)
+        assert not worker.busy and worker.poll() is None
+
+
+def test_cancel_stops_the_search_and_drops_it(corpus):
+    game_state = corpus[0]
+    worker = AgentWorker(on_done=lambda: pytest.fail('a cancelled search finished'))
+    agent = _Stuck(game_state.current_player)
+    worker.start(agent, game_state, GameEngine(game_state).get_valid_actions())
+    assert agent.started.wait(10)
+    worker.cancel()
+    worker._thread.join(10)
+    assert not worker._thread.is_alive()
+    assert not worker.busy and worker.poll() is None
+
+
+def test_agent_errors_reach_the_game_loop(corpus):
+    worker = AgentWorker()
+    with pytest.raises(RuntimeError, match='broken agent'):
+        _run(worker, _Broken(corpus[0].current_player), corpus[0])
@@ -0,0 +1,21 @@
+import pytest
+
+from agents.evaluation import encode_position, evaluate, evaluate_batch, flatten
+from agents.minimax_agent import MinimaxAgent
+
+
+@pytest.mark.parametrize('player_id', [0, 1])
+@pytest.mark.parametrize('scale', [1, 3])
+def test_batch_matches_scalar(corpus, player_id, scale):
+    params = {name: weight * scale + index for index, (name, weight)
+              in enumerate(sorted(MinimaxAgent.DEFAULT_PARAMS.items()))}
+    encodings = [encode_position(game_state) for game_state in corpus]
+    values = evaluate_batch([flatten(encoded) for encoded in encodings], player_id, params)
+    assert values.tolist() == [evaluate(encoded, player_id, params) for encoded in encodings]
+
+
+def test_evaluate_is_the_agents_utility(corpus):
+    for game_state in corpus:
+        for player_id in (0, 1):
+            agent = MinimaxAgent(player_id)
+            assert agent._utility(game_state) == evaluate(encode_position(game_state), player_id, agent.params)
@@ -0,0 +1,43 @@
+import numpy as np
+
+from core.log_analysis import DEALS, LogStats, action_actors, analyze, deal_indices, iter_chunks
+from core.match_log import iter_records, read_log
+from core.replay import Replay
+
+
+def test_actors_match_a_replay(logged_games):
+    path, _ = logged_games
+    actors, rounds = action_actors(np.array(read_log(path)))
+    for index, (deal, agents, actions, _, _) in enumerate(iter_records(path)):
+        replay = Replay(deal, actions, agents)
+        n = len(actions)
+        assert actors[index, :n].tolist() == replay.actors
+        assert rounds[index, :n].tolist() == replay.action_rounds
+        assert (actors[index, n:] == -1).all() and (rounds[index, n:] == -1).all()
+
+
+def test_deal_indices_ignore_order(logged_games):
+    path, _ = logged_games
+    records = np.array(read_log(path))
+    indices = deal_indices(records['deal'])
+    for deal, index in zip(records['deal'], indices):
+        assert sorted(DEALS[index]) == sorted(deal.tolist())
+    assert (deal_indices(records['deal'][:, ::-1]) == indices).all()
+
+
+def test_chunks_and_shards_add_up(logged_games):
+    path, finals = logged_games
+    whole = analyze([path])
+    chunked = LogStats()
+    for chunk in iter_chunks(path, chunk_records=7):
+        chunked.update(chunk)
+    sharded = analyze([path, path], workers=2, shard_records=9)
+
+    assert whole.games == chunked.games == len(finals)
+    assert sharded.games == 2 * len(finals)
+    for name in ('agent_results', 'matchups', 'deal_results', 'round_results',
+                 'score_histogram', 'margin_histogram', 'moves', 'game_length'):
+        assert (getattr(chunked, name) == getattr(whole, name)).all()
+        assert (getattr(sharded, name) == 2 * getattr(whole, name)).all()
+    # Every logged action is counted once, for the agent that made it
+    assert whole.moves.sum() == sum(len(actions) for _, _, actions, _, _ in iter_records(path))
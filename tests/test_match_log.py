@@ -0,0 +1,62 @@
+import pytest
+
+from core.match_log import (AGENT_CODES, MAX_ACTIONS, UNKNOWN_AGENT, MatchLogWriter, iter_records,
+                            pack_record, read_log, unpack_record)
+from core.replay import Replay
+
+
+def test_pack_unpack_round_trip():
+    deal = [3, 1, 4, 15, 9, 2, 6, 5, 8, 7]
+    actions = [4, 0, 16, 17, 1, 19] + [0] * 20
+    record = pack_record(deal, ('FIS', 'Nobody'), actions, [(12, 300), (0, 7)], None)
+    assert unpack_record(record) == (deal, [AGENT_CODES['FIS'], UNKNOWN_AGENT], actions,
+                                     [(12, 255), (0, 7)], None)
+
+
+def test_too_many_actions_are_refused():
+    with pytest.raises(ValueError):
+        pack_record(list(range(1, 11)), ('FIS', 'CSP'), [0] * (MAX_ACTIONS + 1), [], 0)
+
+
+def test_logged_games_replay_to_their_results(logged_games):
+    path, finals = logged_games
+    records = list(iter_records(path))
+    assert len(records) == len(finals)
+    for record, final in zip(records, finals):
+        deal, _, _, round_scores, winner = record
+        assert deal == [card.id for card in final.initial_hand[:10]]
+        assert winner == final.winner
+        assert round_scores == [(min(p0, 255), min(p1, 255)) for p0, p1 in final.round_scores]
+        Replay.from_record(record)  # raises if the actions do not replay to the logged result
+
+
+def test_reader_and_iterator_agree(logged_games):
+    path, _ = logged_games
+    records = list(iter_records(path))
+    assert list(iter_records(path, 5, 9)) == records[5:9]
+    array = read_log(path)
+    assert len(array) == len(records)
+    for row, (deal, agents, actions, round_scores, winner) in zip(array, records):
+        assert row['deal'].tolist() == deal
+        assert row['agents'].tolist() == agents
+        assert row['actions'][:row['n_actions']].tolist() == actions
+        assert row['round_scores'][:row['n_rounds']].tolist() == [list(scores) for scores in round_scores]
+        assert row['winner'] == (-1 if winner is None else winner)
+
+
+def test_appending_keeps_the_header(tmp_path):
+    path = str(tmp_path / 'log.ngml')
+    record = pack_record(list(range(1, 11)), ('CSP', 'Minimax'), [0, 0], [(0, 0)], None)
+    for _ in range(2):
+        with MatchLogWriter(path) as log:
+            log.write(record)
+    assert len(list(iter_records(path))) == 2
+
+
+def test_foreign_files_are_refused(tmp_path):
+    path = tmp_path / 'other.bin'
+    path.write_bytes(bytes(16))
+    with pytest.raises(ValueError):
+        MatchLogWriter(str(path))
+    with pytest.raises(ValueError):
+        list(iter_records(str(path)))
@@ -0,0 +1,139 @@
+import math
+
+import pytest
+
+from agents.minimax_agent import MinimaxAgent, _play
+from agents.transposition import TranspositionTable
+from core.action import Action
+from core.game_engine import GameEngine
+
+DEPTH = 3
+
+
+def reference_value(agent, game_state, depth):
+    """Plain negamax without pruning, table or ordering: the value of game_state for the
+    side to move in it, with the agent's pass handling."""
+    sign = 1 if game_state.current_player == agent.player_id else -1
+    if game_state.game_over:
+        return sign * agent._terminal(game_state)
+    if depth == 0:
+        return sign * agent._utility(game_state)
+    valid_actions = GameEngine(game_state).get_valid_actions()
+    best = -math.inf
+    for action in valid_actions:
+        if action.type == Action.PASS and len(valid_actions) > 1:
+            continue
+        child = _play(game_state, action)
+        if child.game_over:
+            value = sign * agent._terminal(child)
+        else:
+            value = reference_value(agent, child, depth - 1)
+            if child.current_player != game_state.current_player:
+                value = -value
+        best = max(best, value)
+    return best
+
+
+def root_values(agent, game_state, depth):
+    """Reference value of each of the agent's moves at the root."""
+    values = {}
+    for action in GameEngine(game_state).get_valid_actions():
+        if action.type == Action.PASS:
+            continue
+        child = _play(game_state, action)
+        if child.game_over:
+            values[action.key()] = agent._terminal(child)
+        else:
+            value = reference_value(agent, child, depth - 1)
+            values[action.key()] = value if child.current_player == agent.player_id else -value
+    return values
+
+
+@pytest.fixture(scope='module')
+def positions(corpus):
+    """Positions with a real choice, both seats and both sides of a pass."""
+    chosen = [game_state for game_state in corpus
+              if sum(action.type != Action.PASS for action in GameEngine(game_state).get_valid_actions()) >= 2]
+    return chosen[::4]
+
+
+def _search(agent, game_state):
+    children = [(action, _play(game_state, action))
+                for action in GameEngine(game_state).get_valid_actions() if action.type != Action.PASS]
+    return agent._search_root(agent._order(children, 1), agent.max_depth, -math.inf, math.inf)
+
+
+@pytest.mark.parametrize('make_agent', [
+    lambda seat: MinimaxAgent(seat, max_depth=DEPTH),
+    lambda seat: MinimaxAgent(seat, max_depth=DEPTH, tt=TranspositionTable(1 << 14)),
+    lambda seat: MinimaxAgent(seat, max_depth=DEPTH, batch_leaves=True),
+], ids=['pvs', 'pvs+tt', 'batch'])
+def test_root_value_matches_plain_negamax(positions, make_agent):
+    assert {game_state.current_player for game_state in positions} == {0, 1}
+    for game_state in positions:
+        agent = make_agent(game_state.current_player)
+        expected = root_values(agent, game_state, DEPTH)
+        value, best_action = _search(agent, game_state)
+        assert value == max(expected.values())
+        assert expected[best_action.key()] == value
+
+
+@pytest.mark.parametrize('window', [1, 50, 1000])
+def test_aspiration_picks_a_best_value_move(positions, window):
+    for game_state in positions:
+        agent = MinimaxAgent(game_state.current_player, max_depth=DEPTH, aspiration=window,
+                             tt=TranspositionTable(1 << 14))
+        expected = root_values(agent, game_state, DEPTH)
+        action = agent.decide_action(game_state.clone(), GameEngine(game_state).get_valid_actions())
+        assert expected[action.key()] == max(expected.values())
+
+
+@pytest.mark.parametrize('seat', [0, 1])
+def test_shared_table_gives_the_same_values_for_fewer_nodes(positions, seat):
+    table = TranspositionTable.create_shared(1 << 14)
+    try:
+        for game_state in positions:
+            if game_state.current_player != seat:
+                continue
+            first = MinimaxAgent(seat, max_depth=DEPTH, tt=table)
+            # Another process's agent of the same seat, reading what the first one stored
+            second = MinimaxAgent(seat, max_depth=DEPTH,
+                                  tt=TranspositionTable.attach(table.shm.name, len(table.entries)))
+            first_value, _ = _search(first, game_state)
+            second_value, _ = _search(second, game_state)
+            assert second_value == first_value
+            assert second.nodes_explored < first.nodes_explored
+    finally:
+        table.shm.close()
+        table.shm.unlink()
+
+
+@pytest.mark.parametrize('seat', [0, 1])
+def test_table_bounds_keep_their_sign_at_both_sides_nodes(positions, seat):
+    # Narrow windows around the true value leave lower and upper bounds in the table, at
+    # this agent's nodes and, negated with the bounds swapped, at the opponent's; every
+    # later search on the table reads them back
+    table = TranspositionTable(1 << 16)
+    agent = MinimaxAgent(seat, max_depth=DEPTH, tt=table)
+    reference = MinimaxAgent(seat, max_depth=DEPTH)
+    for game_state in positions:
+        # Value of a child for the side that moved into it (seat if is_maximizing)
+        is_maximizing = game_state.current_player == seat
+        for action in GameEngine(game_state).get_valid_actions():
+            child = _play(game_state, action)
+            if child.game_over:
+                continue
+            expected = reference_value(reference, child, DEPTH - 1)
+            if (child.current_player == seat) != is_maximizing:
+                expected = -expected
+            for alpha, beta in ((expected - 1, expected), (expected, expected + 1),
+                                (expected - 100, expected - 50), (expected + 50, expected + 100),
+                                (expected - 1, expected + 1), (-math.inf, math.inf)):
+                value = agent._child(child, DEPTH - 1, alpha, beta, is_maximizing)
+                # Fail-soft: a value outside the window bounds the true value from that side
+                if value <= alpha:
+                    assert expected <= value
+                elif value >= beta:
+                    assert expected >= value
+                else:
+                    assert value == expected
@@ -0,0 +1,115 @@
+import math
+
+import pytest
+
+from agents.minimax_agent import PROVEN_DEPTH, MinimaxAgent, _play
+from agents.proof_search import DRAW, LOSS, WIN, ProofSearch, _children
+from agents.transposition import EXACT, TranspositionTable, position_key, table_key
+from core.action import Action
+from core.game_engine import GameEngine
+from tests.conftest import cards_left
+
+
+def exact_outcome(game_state, player_id, alpha=LOSS, beta=WIN):
+    """WIN, DRAW or LOSS for player_id by alpha-beta over every move, passes included."""
+    if game_state.game_over:
+        if game_state.winner is None:
+            return DRAW
+        return WIN if game_state.winner == player_id else LOSS
+    maximizing = game_state.current_player == player_id
+    best = LOSS if maximizing else WIN
+    for _, child in _children(game_state):
+        value = exact_outcome(child, player_id, alpha, beta)
+        if maximizing:
+            best = max(best, value)
+            alpha = max(alpha, value)
+        else:
+            best = min(best, value)
+            beta = min(beta, value)
+        if alpha >= beta:
+            break
+    return best
+
+
+@pytest.fixture(scope='module')
+def endgames(corpus):
+    return [game_state for game_state in corpus
+            if 3 <= cards_left(game_state) <= 7 and len(GameEngine(game_state).get_valid_actions()) > 1]
+
+
+def test_solve_agrees_with_exact_search(endgames):
+    assert len(endgames) >= 20
+    for game_state in endgames:
+        player_id = game_state.current_player
+        outcome, code = ProofSearch(10 ** 6).solve(game_state, player_id)
+        assert outcome == exact_outcome(game_state, player_id)
+        if outcome == LOSS:
+            assert code is None
+        else:
+            # The move returned reaches the outcome
+            child = dict(_children(game_state))[code]
+            assert exact_outcome(child, player_id) == outcome
+
+
+def test_bounds_hold_after_an_unfinished_proof(endgames):
+    bounded = 0
+    for game_state in endgames:
+        player_id = game_state.current_player
+        prover = ProofSearch(20)
+        prover.solve(game_state, player_id)
+        for _, child in _children(game_state):
+            if child.game_over:
+                continue
+            lower, upper = prover.bounds(child, player_id)
+            assert lower <= exact_outcome(child, player_id) <= upper
+            bounded += (lower, upper) != (LOSS, WIN)
+    assert bounded > 0
+
+
+class _FixedProof:
+    """Stands in for ProofSearch: every position is proven to have the same outcome."""
+
+    def __init__(self, outcome):
+        self.outcome = outcome
+
+    def bounds(self, game_state, player_id):
+        return self.outcome, self.outcome
+
+
+@pytest.mark.parametrize('outcome, value', [(WIN, 10000), (DRAW, 0), (LOSS, -10000)])
+@pytest.mark.parametrize('seat', [0, 1])
+@pytest.mark.parametrize('opponent_passed', [False, True])
+def test_proven_values_come_back_from_a_shared_table(corpus, outcome, value, seat, opponent_passed):
+    # With the opponent passed the same side moves again below the root, so both the
+    # maximizing and the minimizing side of the table are read back
+    game_state = next(game_state for game_state in corpus
+                      if game_state.current_player == seat
+                      and game_state.players[1 - seat].passed == opponent_passed
+                      and len(game_state.players[seat].hand) >= 2)
+    table = TranspositionTable.create_shared(1 << 12)
+    try:
+        seeder = MinimaxAgent(seat, tt=table)
+        seeder.prover = _FixedProof(outcome)
+        valid_actions = GameEngine(game_state).get_valid_actions()
+        children = [(action, _play(game_state, action)) for action in valid_actions if action.type != Action.PASS]
+        children = [(action, child) for action, child in children if not child.game_over]
+        seeder._seed_proven(children)
+
+        # Another agent of the seat, on the table as another process attaches it
+        reader = MinimaxAgent(seat, tt=TranspositionTable.attach(table.shm.name, len(table.entries)))
+        for action, child in children:
+            assert (child.current_player == seat) == opponent_passed
+            assert reader._child(child, PROVEN_DEPTH, -math.inf, math.inf, True) == value
+            assert reader._child(child, 4, -math.inf, math.inf, True) == value
+        assert reader.nodes_explored == 0
+        assert all(entry_flag == EXACT for entry_flag in _flags(reader, children))
+    finally:
+        table.shm.close()
+        table.shm.unlink()
+
+
+
+def _flags(agent, children):
+    for _, child in children:
+        key = table_key(position_key(child), child.current_player == agent.player_id, agent._tt_salt)
+        yield agent.tt.probe(key)[2]
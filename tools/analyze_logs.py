@@ -0,0 +1,146 @@
+"""Summarize match logs: win rates, first-mover advantage, deals, scores and moves.
+
+Logs are streamed in chunks through core/log_analysis.py, so memory use stays flat
+however many games they hold; --workers splits them into shards on a process pool.
+
+Usage:
+    python -m tools.analyze_logs games.ngml [more.ngml ...] --workers 8 --json stats.json
+"""
+import argparse
+import json
+import time
+
+from core.log_analysis import MAX_ROUNDS, N_CODES, analyze
+from core.match_log import AGENT_NAMES, DEBUFF_CODES, PASS_CODE, SCORCH_CODE
+from utils import constants
+
+CODE_LABELS = {PASS_CODE: 'pass', SCORCH_CODE: 'scorch'}
+CODE_LABELS.update({code: f'debuff {row}' for row, code in DEBUFF_CODES.items()})
+CODE_LABELS.update({card_id: f'unit {card_id} ({strength})'
+                    for card_id, strength in zip(constants.CARD_POOL, constants.CARD_STRENGTHS)})
+
+
+def agent_label(code):
+    return AGENT_NAMES.get(code, f'agent {code}')
+
+
+def summarize(stats, min_deal_games, top):
+    """Everything printed by the report, as plain JSON-serializable values."""
+    game_rate, round_rates = stats.first_mover_advantage()
+    matchups = []
+    for code0, code1 in zip(*stats.matchups.sum(axis=2).nonzero()):
+        wins0, wins1, draws = (int(v) for v in stats.matchups[code0, code1])
+        matchups.append({'player0': agent_label(code0), 'player1': agent_label(code1),
+                         'games': wins0 + wins1 + draws, 'player0_wins': wins0,
+                         'player1_wins': wins1, 'draws': draws})
+
+    deals = sorted(stats.deal_win_rates(min_deal_games), key=lambda entry: entry[2])
+    deal_entry = lambda entry: {'deal': list(entry[0]), 'games': entry[1], 'player0_win_rate': entry[2]}
+
+    rounds = []
+    for r in range(MAX_ROUNDS):
+        scores = [stats.score_summary(r, seat) for seat in (0, 1)]
+        rounds.append({'round': r + 1, 'games': int(stats.round_results[r].sum()),
+                       'player0_score': scores[0], 'player1_score': scores[1],
+                       'margin': stats.margin_summary(r)})
+
+    moves = {}
+    for code in stats.moves.sum(axis=(1, 2)).nonzero()[0]:
+        table = stats.moves[code]
+        moves[agent_label(code)] = {
+            CODE_LABELS.get(action, str(action)): [int(table[r, action]) for r in range(MAX_ROUNDS)]
+            for action in range(N_CODES) if table[:, action].any()
+        }
+
+    lengths = stats.game_length
+    return {
+        'games': stats.games,
+        'agents': {agent_label(code): {'games': games, 'win_rate': win_rate, 'draw_rate': draw_rate}
+                   for code, (games, win_rate, draw_rate) in stats.agent_win_rates().items()},
+        'matchups': matchups,
+        'first_mover': {'game_win_rate': game_rate, 'round_opener_win_rates': round_rates},
+        'deals_seen': int((stats.deal_results.sum(axis=1) > 0).sum()),
+        'min_deal_games': min_deal_games,
+        'worst_deals': [deal_entry(entry) for entry in deals[:top]],
+        'best_deals': [deal_entry(entry) for entry in reversed(deals[-top:])],
+        'rounds': rounds,
+        'moves': moves,
+        'mean_actions': float((lengths * range(len(lengths))).sum() / lengths.sum()) if lengths.sum() else None,
+    }
+
+
+def _rate(value):
+    return f"{value * 100:5.1f}%"
+
+
+def _distribution(summary):
+    if summary is None:
+        return "-"
+    mean, p10, p50, p90 = summary
+    return f"mean {mean:6.2f}  p10 {p10:4d}  p50 {p50:4d}  p90 {p90:4d}"
+
+
+def print_report(summary, elapsed):
+    print(f"{summary['games']} games analyzed in {elapsed:.2f}s, "
+          f"{summary['mean_actions'] or 0:.1f} actions per game on average")
+
+    print("\nAgents (both seats, draws count half)")
+    for name, entry in summary['agents'].items():
+        print(f"  {name:<10}{entry['games']:>10} games  win {_rate(entry['win_rate'])}  "
+              f"draw {_rate(entry['draw_rate'])}")
+
+    print("\nMatchups (player 0 vs player 1)")
+    for entry in summary['matchups']:
+        print(f"  {entry['player0']:>8} vs {entry['player1']:<8}{entry['games']:>10} games  "
+              f"{entry['player0_wins']:>8} / {entry['player1_wins']:>8} / {entry['draws']:>6} draws")
+
+    first_mover = summary['first_mover']
+    print(f"\nFirst mover: player 0 wins {_rate(first_mover['game_win_rate'])} of games; "
+          f"round openers win " + ", ".join(f"R{r + 1} {_rate(rate)}"
+                                            for r, rate in enumerate(first_mover['round_opener_win_rates'])))
+
+    print(f"\nDeals: {summary['deals_seen']} of 3003 seen; player 0 win rate")
+    if not summary['best_deals']:
+        print(f"  no deal has >= {summary['min_deal_games']} games (use --min-deal-games)")
+    for title, key in (("best", 'best_deals'), ("worst", 'worst_deals')):
+        for entry in summary[key]:
+            print(f"  {title:<6}{_rate(entry['player0_win_rate'])} over {entry['games']:>6} games  {entry['deal']}")
+
+    print("\nRound scores")
+    for entry in summary['rounds']:
+        print(f"  R{entry['round']} ({entry['games']} played)")
+        print(f"    player 0  {_distribution(entry['player0_score'])}")
+        print(f"    player 1  {_distribution(entry['player1_score'])}")
+        print(f"    margin    {_distribution(entry['margin'])}")
+
+    print("\nMoves by round")
+    for name, table in summary['moves'].items():
+        print(f"  {name:<18}{'R1':>8}{'R2':>8}{'R3':>8}")
+        for label, counts in table.items():
+            print(f"    {label:<16}" + "".join(f"{count:>8}" for count in counts))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Streaming statistics over match logs")
+    parser.add_argument('logs', nargs='+', help="match log files")
+    parser.add_argument('--workers', type=int, default=1, help="processes to spread shards over")
+    parser.add_argument('--shard-records', type=int, default=1 << 22, help="games per shard")
+    parser.add_argument('--min-deal-games', type=int, default=5,
+                        help="games a deal needs before it is ranked")
+    parser.add_argument('--top', type=int, default=5, help="best and worst deals to list")
+    parser.add_argument('--json', help="also write the summary to this file")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    stats = analyze(args.logs, workers=args.workers, shard_records=args.shard_records)
+    elapsed = time.perf_counter() - start
+
+    summary = summarize(stats, args.min_deal_games, args.top)
+    print_report(summary, elapsed)
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump(summary, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
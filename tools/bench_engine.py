@@ -0,0 +1,268 @@
+"""Benchmark the engine and agent hot paths on a fixed corpus of positions.
+
+The corpus is every position (before each move) of seeded FIS vs CSP games, so every
+run times exactly the same work. Each benchmark times single operations - GameState.clone,
+GameEngine.execute_action, get_valid_actions, PlayerState.get_board_strength,
+GameEngine._apply_scorch, MinimaxAgent._utility and decide_action of each agent - and
+reports operations per second and latency percentiles. Any setup an operation needs (a fresh clone to mutate,
+an agent) happens outside the timed call, and the garbage collector is paused while
+timing, as timeit does.
+
+--save writes the results as a JSON baseline; --compare checks a run against one and
+exits with status 1 if any benchmark got slower by more than --threshold. The gate uses
+the fastest per-pass median latency ("best p50"), which varies much less from run to
+run than pooled percentiles on a busy machine. Passes within one process do not cancel
+out everything, though: a process can land on a slow core or memory layout and stay
+there, so whole processes differ by up to 2x on a noisy virtual machine. --repeats runs
+the benchmarks in that many fresh processes and keeps each benchmark's fastest one.
+
+Usage:
+    python -m tools.bench_engine --save bench_baseline.json
+    python -m tools.bench_engine --compare bench_baseline.json --threshold 0.30
+"""
+import argparse
+import gc
+import json
+import multiprocessing
+import platform
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from agents.csp_agent import CSPAgent
+from agents.fis_agent import FISAgent
+from agents.minimax_agent import MinimaxAgent
+from core.deals import game_rng, random_deals, read_deal_set
+from core.game_engine import GameEngine
+from core.game_state import GameState
+from core.replay import settle
+
+
+def percentiles(samples, points=(50, 90, 99)):
+    ordered = sorted(samples)
+    result = {}
+    for point in points:
+        index = min(len(ordered) - 1, int(round(point / 100 * (len(ordered) - 1))))
+        result[f'p{point}'] = ordered[index]
+    return result
+
+
+def build_corpus(deals, seed):
+    """(GameState, action played there) for every move of FIS vs CSP games over deals."""
+    corpus = []
+    for game, deal in enumerate(deals):
+        game_state = GameState()
+        game_state.initialize(deal)
+        game_engine = GameEngine(game_state)
+        agents = {0: FISAgent(0, rng=game_rng(seed, game, 0)), 1: CSPAgent(1, rng=game_rng(seed, game, 1))}
+        while True:
+            settle(game_engine)
+            if game_state.game_over:
+                break
+            action = agents[game_state.current_player].decide_action(game_state, game_engine.get_valid_actions())
+            corpus.append((game_state.clone(), action.key()))
+            game_engine.execute_action(action)
+    return corpus
+
+
+def _action_for(game_engine, key):
+    for action in game_engine.get_valid_actions():
+        if action.key() == key:
+            return action
+    raise ValueError(f"action {key} is not valid in the corpus position")
+
+
+def _time_calls(calls):
+    """Time each zero-argument callable once; returns the latencies in seconds."""
+    samples = []
+    clock = time.perf_counter
+    gc_was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        for call in calls:
+            start = clock()
+            call()
+            samples.append(clock() - start)
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+    return samples
+
+
+# Each benchmark turns one corpus position into the call to time, or None to skip the position
+
+def _bench_clone(game_state, key, args):
+    return game_state.clone
+
+
+def _bench_execute_action(game_state, key, args):
+    game_engine = GameEngine(game_state.clone())
+    action = _action_for(game_engine, key)
+    return lambda: game_engine.execute_action(action)
+
+
+def _bench_get_valid_actions(game_state, key, args):
+    return GameEngine(game_state).get_valid_actions
+
+
+def _bench_get_board_strength(game_state, key, args):
+    return game_state.players[game_state.current_player].get_board_strength
+
+
+def _bench_apply_scorch(game_state, key, args):
+    return GameEngine(game_state.clone())._apply_scorch
+
+
+def _bench_utility(game_state, key, args):
+    agent = MinimaxAgent(game_state.current_player)
+    return lambda: agent._utility(game_state)
+
+
+def _agent_bench(agent_class, **options):
+    def bench(game_state, key, args):
+        valid_actions = GameEngine(game_state).get_valid_actions()
+        if len(valid_actions) < 2:
+            return None  # answered without thinking
+        if agent_class is MinimaxAgent:
+            options['max_depth'] = args.depth
+        agent = agent_class(game_state.current_player, rng=game_rng(args.seed, 'bench', agent_class.__name__), **options)
+        state = game_state.clone()
+        return lambda: agent.decide_action(state, valid_actions)
+    return bench
+
+
+BENCHMARKS = {
+    'clone': _bench_clone,
+    'execute_action': _bench_execute_action,
+    'get_valid_actions': _bench_get_valid_actions,
+    'get_board_strength': _bench_get_board_strength,
+    'apply_scorch': _bench_apply_scorch,
+    'minimax._utility': _bench_utility,
+    'minimax.decide_action': _agent_bench(MinimaxAgent),
+    'csp.decide_action': _agent_bench(CSPAgent),
+    'fis.decide_action': _agent_bench(FISAgent),
+}
+
+
+def run_benchmark(name, corpus, args):
+    bench = BENCHMARKS[name]
+    samples = []
+    pass_medians = []
+    slow = name.endswith('decide_action')
+    rounds = max(1, args.rounds // 4) if slow else args.rounds
+    for round_index in range(args.warmup + rounds):
+        calls = [call for call in (bench(state, key, args) for state, key in corpus) if call is not None]
+        latencies = _time_calls(calls)
+        if round_index >= args.warmup:
+            samples.extend(latencies)
+            pass_medians.append(percentiles(latencies, (50,))['p50'])
+    total = sum(samples)
+    return {
+        'ops': len(samples),
+        'ops_per_sec': len(samples) / total if total else 0.0,
+        'mean_us': total / len(samples) * 1e6,
+        **{key: value * 1e6 for key, value in percentiles(samples).items()},
+        'best_p50': min(pass_medians) * 1e6,
+    }
+
+
+def _measure(task):
+    """Results of every named benchmark, measured in this process."""
+    names, deals, args = task
+    corpus = build_corpus(deals, args.seed)
+    return {name: run_benchmark(name, corpus, args) for name in names}
+
+
+def compare(results, baseline, threshold):
+    """Return (name, baseline, current best p50, change) for every benchmark that slowed past threshold."""
+    regressions = []
+    for name, result in results['benchmarks'].items():
+        before = baseline['benchmarks'].get(name)
+        if before is None:
+            continue
+        change = result['best_p50'] / before['best_p50'] - 1
+        if change > threshold:
+            regressions.append((name, before['best_p50'], result['best_p50'], change))
+    return regressions
+
+
+def print_report(results, baseline=None):
+    print(f"{results['corpus']['positions']} positions from {results['corpus']['games']} games, "
+          f"minimax depth {results['depth']}")
+    print(f"  {'benchmark':24} {'ops':>7} {'ops/s':>11} {'mean us':>10} {'p50 us':>10} {'p90 us':>10} "
+          f"{'p99 us':>10} {'best p50':>10}" + ("   vs base" if baseline else ""))
+    for name, result in results['benchmarks'].items():
+        line = (f"  {name:24} {result['ops']:>7} {result['ops_per_sec']:>11,.0f} {result['mean_us']:>10.2f} "
+                f"{result['p50']:>10.2f} {result['p90']:>10.2f} {result['p99']:>10.2f} {result['best_p50']:>10.2f}")
+        before = baseline['benchmarks'].get(name) if baseline else None
+        if before:
+            line += f"   {result['best_p50'] / before['best_p50'] - 1:+8.1%}"
+        print(line)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark engine and agent hot paths")
+    parser.add_argument('--games', type=int, default=20, help="seeded games whose positions form the corpus")
+    parser.add_argument('--deal-set', default=None, help="take the corpus games' deals from this deal-set file")
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--depth', type=int, default=3, help="MinimaxAgent search depth")
+    parser.add_argument('--rounds', type=int, default=20, help="timed passes over the corpus (a quarter as many for agents)")
+    parser.add_argument('--warmup', type=int, default=1, help="untimed passes before the timed ones")
+    parser.add_argument('--only', nargs='+', choices=sorted(BENCHMARKS), default=None)
+    parser.add_argument('--save', default=None, help="write the results to this JSON baseline")
+    parser.add_argument('--compare', default=None, help="JSON baseline to check for regressions")
+    parser.add_argument('--repeats', type=int, default=5,
+                        help="fresh processes to run the benchmarks in; each keeps its fastest (1 = this process)")
+    parser.add_argument('--threshold', type=float, default=0.25,
+                        help="allowed slowdown of the best p50 latency before failing, e.g. 0.25 = 25%%. "
+                             "A tree compared against itself varied by up to 17%% with the default 5 repeats "
+                             "(and 25%% with 3) on a noisy virtual machine; keep the threshold above the "
+                             "noise of the machine the gate runs on")
+    args = parser.parse_args()
+
+    deals = read_deal_set(args.deal_set)[:args.games] if args.deal_set else random_deals(args.games, args.seed)
+    corpus = build_corpus(deals, args.seed)
+    results = {
+        'corpus': {'games': len(deals), 'positions': len(corpus), 'seed': args.seed, 'deal_set': args.deal_set},
+        'depth': args.depth,
+        'python': sys.version.split()[0],
+        'machine': platform.platform(),
+        'repeats': args.repeats,
+        'benchmarks': {},
+    }
+    names = args.only or list(BENCHMARKS)
+    if args.repeats <= 1:
+        runs = [_measure((names, deals, args))]
+    else:
+        # One process per repeat, one after the other so they do not compete for the CPU
+        context = multiprocessing.get_context('spawn')
+        with ProcessPoolExecutor(max_workers=1, mp_context=context, max_tasks_per_child=1) as executor:
+            runs = list(executor.map(_measure, [(names, deals, args)] * args.repeats))
+    for name in names:
+        results['benchmarks'][name] = min((run[name] for run in runs), key=lambda result: result['best_p50'])
+
+    baseline = None
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+        for key in ('corpus', 'depth', 'python', 'machine', 'repeats'):
+            if baseline.get(key) != results[key]:
+                print(f"Warning: baseline {key} {baseline.get(key)!r} differs from this run's {results[key]!r}")
+    print_report(results, baseline)
+
+    if args.save:
+        with open(args.save, 'w') as f:
+            json.dump(results, f, indent=2)
+
+    if baseline is not None:
+        regressions = compare(results, baseline, args.threshold)
+        for name, before, after, change in regressions:
+            print(f"REGRESSION {name}: best p50 {before:.2f} us -> {after:.2f} us ({change:+.1%}, "
+                  f"threshold {args.threshold:.0%})")
+        if regressions:
+            sys.exit(1)
+        print(f"no benchmark slowed by more than {args.threshold:.0%}")
+
+
+if __name__ == "__main__":
+    main()
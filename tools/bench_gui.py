@@ -0,0 +1,276 @@
+"""Headless rendering benchmark for GameGUI.
+
+Records seeded agent-vs-agent games once, then replays them and drives GameGUI.render (and show_game_over once
+a game ends) frame by frame, the way the AI vs AI screen does: a thinking pause before
+every move, then frames until card moves and banners have settled. Runs on the SDL
+dummy video driver, so it needs no display, and uses a simulated clock that advances a
+fixed step per frame, so every run draws exactly the same frames.
+
+Reports frame-time percentiles, Python memory allocated per frame (tracemalloc, in a
+separate pass so it does not skew the timings) and the time spent in each draw routine.
+
+Usage:
+    python -m tools.bench_gui --games 2 --mode both --json gui_bench.json
+"""
+import os
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+
+import argparse
+import json
+import random
+import time
+import tracemalloc
+
+import pygame
+
+from agents.csp_agent import CSPAgent
+from agents.fis_agent import FISAgent
+from core.game_engine import GameEngine
+from core.game_state import GameState
+from gui.config import SCREEN_WIDTH, SCREEN_HEIGHT, preload_card_images
+from gui.game_gui import GameGUI
+
+ROUTINES = [
+    '_draw_round_info',
+    '_draw_boards',
+    '_draw_hands',
+    '_draw_score',
+    '_draw_round_end_announcement',
+    '_draw_round_start_announcement',
+    'show_game_over',
+]
+
+
+class FrameClock:
+    """Stands in for pygame.time.get_ticks so banners and animations advance per frame, not per second."""
+
+    def __init__(self, frame_ms):
+        self.frame_ms = frame_ms
+        self.now = 0
+
+    def ticks(self):
+        return self.now
+
+    def advance(self):
+        self.now += self.frame_ms
+
+
+def percentiles(samples, points=(50, 90, 99)):
+    ordered = sorted(samples)
+    result = {}
+    for point in points:
+        index = min(len(ordered) - 1, int(round(point / 100 * (len(ordered) - 1))))
+        result[f'p{point}'] = ordered[index]
+    return result
+
+
+def _instrument(gui, routine_times):
+    """Wrap the draw routines of one GUI instance to accumulate their time."""
+    for name in ROUTINES:
+        method = getattr(gui, name)
+
+        def timed(*args, _method=method, _name=name):
+            start = time.perf_counter()
+            try:
+                return _method(*args)
+            finally:
+                routine_times[_name].append(time.perf_counter() - start)
+
+        setattr(gui, name, timed)
+
+
+def record_games(seed, games):
+    """Play seeded FIS vs CSP games and return (deal, action keys) for each, to replay without the agents."""
+    scripts = []
+    for game in range(games):
+        rng = random.Random(seed + game)
+        game_state = GameState()
+        game_state.initialize(rng=rng)
+        deal = [card.id for card in game_state.initial_hand]
+        game_engine = GameEngine(game_state)
+        agents = {0: FISAgent(0, rng=rng), 1: CSPAgent(1, rng=rng)}
+        keys = []
+        while not game_state.game_over:
+            if game_engine.check_auto_end_round():
+                continue
+            action = agents[game_state.current_player].decide_action(game_state, game_engine.get_valid_actions())
+            keys.append(action.key())
+            game_engine.execute_action(action)
+        scripts.append((deal, keys))
+    return scripts
+
+
+def run_frames(screen, clock, scripts, full_redraw, think_ms, settle_frames, game_over_frames, frame_hook):
+    """Replay the recorded games and call frame_hook(draw) for every frame to be measured.
+
+    Yields each game's GameGUI before its first frame so the caller can instrument it.
+    """
+    for deal, keys in scripts:
+        game_state = GameState()
+        game_state.initialize(deal)
+        game_engine = GameEngine(game_state)
+        moves = iter(keys)
+        gui = GameGUI(screen, "FIS", "CSP")
+        yield gui
+
+        def render():
+            if full_redraw:
+                gui.invalidate()
+            gui.render(game_state)
+
+        def settle():
+            for _ in range(settle_frames):
+                frame_hook(render)
+                clock.advance()
+                if gui.next_update_delay() is None:
+                    break
+
+        settle()
+        while not game_state.game_over:
+            if game_engine.check_auto_end_round():
+                settle()
+                continue
+
+            # Thinking dots while the agent "decides", then the move and its animation
+            gui.thinking_player = game_state.current_player
+            for _ in range(max(1, think_ms // clock.frame_ms)):
+                frame_hook(render)
+                clock.advance()
+            gui.thinking_player = None
+
+            key = next(moves)
+            action = next(a for a in game_engine.get_valid_actions() if a.key() == key)
+            game_engine.execute_action(action)
+            settle()
+
+        for _ in range(game_over_frames):
+            frame_hook(lambda: gui.show_game_over(game_state))
+            clock.advance()
+
+
+def benchmark(screen, scripts, args, full_redraw):
+    clock = FrameClock(args.frame_ms)
+    pygame.time.get_ticks = clock.ticks
+
+    # Timing pass
+    frame_times = []
+    routine_times = {name: [] for name in ROUTINES}
+
+    def time_frame(draw):
+        start = time.perf_counter()
+        draw()
+        frame_times.append(time.perf_counter() - start)
+
+    for gui in run_frames(screen, clock, scripts, full_redraw, args.think_ms,
+                          args.settle_frames, args.game_over_frames, time_frame):
+        _instrument(gui, routine_times)
+
+    # Allocation pass over the same frames
+    frame_bytes = []
+    frame_peaks = []
+
+    def trace_frame(draw):
+        before, _ = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        draw()
+        after, peak = tracemalloc.get_traced_memory()
+        frame_bytes.append(after - before)
+        frame_peaks.append(peak - before)
+
+    clock.now = 0
+    tracemalloc.start()
+    snapshot_start = None
+    for gui in run_frames(screen, clock, scripts, full_redraw, args.think_ms,
+                          args.settle_frames, args.game_over_frames, trace_frame):
+        if snapshot_start is None:
+            snapshot_start = tracemalloc.take_snapshot()
+    snapshot_end = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+
+    total_time = sum(frame_times)
+    frame_ms = [t * 1000 for t in frame_times]
+    report = {
+        'mode': 'full' if full_redraw else 'dirty',
+        'frames': len(frame_times),
+        'frame_ms': {
+            'mean': total_time * 1000 / len(frame_times),
+            **percentiles(frame_ms),
+            'max': max(frame_ms),
+        },
+        'alloc_bytes_per_frame': {
+            'mean_retained': sum(frame_bytes) / len(frame_bytes),
+            'mean_peak': sum(frame_peaks) / len(frame_peaks),
+            'max_peak': max(frame_peaks),
+        },
+        'routines': {},
+        'top_allocations': [],
+    }
+    for name, times in routine_times.items():
+        if times:
+            report['routines'][name] = {
+                'calls': len(times),
+                'total_ms': sum(times) * 1000,
+                'mean_ms': sum(times) * 1000 / len(times),
+                'share': sum(times) / total_time if total_time else 0.0,
+            }
+
+    stats = snapshot_end.filter_traces([tracemalloc.Filter(False, tracemalloc.__file__),
+                                        tracemalloc.Filter(False, __file__)])
+    for stat in stats.compare_to(snapshot_start, 'lineno')[:5]:
+        report['top_allocations'].append(f"{stat.traceback}: {stat.size_diff / 1024:+.1f} KiB")
+    return report
+
+
+def print_report(report):
+    frame = report['frame_ms']
+    alloc = report['alloc_bytes_per_frame']
+    print(f"\n[{report['mode']} redraw] {report['frames']} frames")
+    print(f"  frame time: mean {frame['mean']:.3f} ms  p50 {frame['p50']:.3f}  p90 {frame['p90']:.3f}  "
+          f"p99 {frame['p99']:.3f}  max {frame['max']:.3f}")
+    print(f"  allocations: {alloc['mean_retained']:.0f} B retained/frame, "
+          f"{alloc['mean_peak']:.0f} B peak/frame (max {alloc['max_peak']})")
+    print("  routine                           calls   total ms    mean ms   share")
+    for name, stats in sorted(report['routines'].items(), key=lambda item: -item[1]['total_ms']):
+        print(f"  {name:32} {stats['calls']:6} {stats['total_ms']:10.1f} {stats['mean_ms']:10.3f} "
+              f"{stats['share']:7.1%}")
+    if report['top_allocations']:
+        print("  largest allocation growth over the run:")
+        for line in report['top_allocations']:
+            print(f"    {line}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark GameGUI rendering without a display")
+    parser.add_argument('--games', type=int, default=2)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--mode', choices=['dirty', 'full', 'both'], default='both',
+                        help="dirty: normal incremental redraw, full: redraw the whole screen every frame")
+    parser.add_argument('--frame-ms', type=int, default=16, help="simulated time per frame")
+    parser.add_argument('--think-ms', type=int, default=500, help="simulated agent thinking time per move")
+    parser.add_argument('--settle-frames', type=int, default=300, help="max frames to wait for animations and banners")
+    parser.add_argument('--game-over-frames', type=int, default=30)
+    parser.add_argument('--json', default=None, help="write the reports to this JSON file")
+    args = parser.parse_args()
+
+    pygame.init()
+    screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+    preload_card_images()
+
+    scripts = record_games(args.seed, args.games)
+    modes = {'dirty': [False], 'full': [True], 'both': [False, True]}[args.mode]
+    reports = []
+    for full_redraw in modes:
+        report = benchmark(screen, scripts, args, full_redraw)
+        print_report(report)
+        reports.append(report)
+
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump(reports, f, indent=2)
+
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
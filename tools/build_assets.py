@@ -0,0 +1,60 @@
+"""Build assets/bundle.bin: every game image pre-scaled to its display size in one file.
+
+The game reads the bundle in one go instead of decoding and scaling each PNG/WebP at
+startup, and falls back to the loose files for anything missing or changed since the
+bundle was built. Re-run after changing images or display sizes.
+
+Usage:
+    python -m tools.build_assets [--output assets/bundle.bin]
+"""
+import os
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+
+import argparse
+import time
+
+import pygame
+
+from gui.asset_bundle import AssetBundle, BUNDLE_PATH, write_bundle
+from gui.config import bundled_assets
+
+
+def build(output):
+    entries = []
+    for key, path, size in bundled_assets():
+        if not os.path.exists(path):
+            print(f"Warning: {path} not found, {key} left out of the bundle")
+            continue
+        # Scaled exactly as the loose-file loaders in gui/config.py do
+        surface = pygame.image.load(path)
+        if size is not None:
+            surface = pygame.transform.scale(surface, size)
+        entries.append((key, surface, path))
+    write_bundle(output, entries)
+    return entries
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Pack pre-scaled game images into one bundle file")
+    parser.add_argument('--output', default=BUNDLE_PATH)
+    args = parser.parse_args()
+
+    pygame.init()
+    start = time.perf_counter()
+    entries = build(args.output)
+    elapsed = time.perf_counter() - start
+
+    print(f"{len(entries)} images -> {args.output} ({os.path.getsize(args.output) / 1024:.0f} KiB) "
+          f"in {elapsed:.2f}s")
+
+    start = time.perf_counter()
+    bundle = AssetBundle.open(args.output)
+    for key, _, _ in entries:
+        bundle.get(key)
+    print(f"loading everything back from the bundle takes {(time.perf_counter() - start) * 1000:.1f} ms")
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+"""Build an opening book of MinimaxAgent's round 1 decisions (see agents/opening_book.py).
+
+Every deal's first --plies plies are expanded over all valid actions of both players and
+each position where a decision is needed is searched to --depth on a process pool. Each
+worker keeps its own transposition table for the positions of the deals it is given.
+The book is only consulted by agents with the weights it was built with (the defaults,
+or those in a --params JSON file as written by tools/tune.py).
+
+Usage:
+    python -m tools.build_book --output opening.ngob
+    python -m tools.build_book --depth 8 --plies 3 --workers 8 --output opening.ngob
+    python -m tools.build_book --deal-set deals.ngds --output opening.ngob
+"""
+import argparse
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from agents.minimax_agent import MinimaxAgent
+from agents.opening_book import OpeningBook, book_key, book_positions
+from agents.transposition import TranspositionTable
+from core.deals import ALL_DEALS, read_deal_set
+from core.game_engine import GameEngine
+from core.match_log import encode_action
+
+
+def _search_chunk(task):
+    deals, depth, plies, params, tt_entries = task
+    tt = TranspositionTable(tt_entries) if tt_entries else None
+    agents = [MinimaxAgent(player_id, max_depth=depth, params=params, tt=tt) for player_id in (0, 1)]
+    entries = {}
+    for deal in deals:
+        for game_state in book_positions(deal, plies):
+            agent = agents[game_state.current_player]
+            action = agent.decide_action(game_state, GameEngine(game_state).get_valid_actions())
+            entries[book_key(game_state, agent._tt_salt)] = encode_action(action)
+    return entries
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build an opening book for MinimaxAgent")
+    parser.add_argument('--output', required=True, help="book file to write")
+    parser.add_argument('--depth', type=int, default=6, help="search depth of the book moves")
+    parser.add_argument('--plies', type=int, default=2,
+                        help="plies from the start of each deal to cover (2 = both players' first move)")
+    parser.add_argument('--deal-set', default=None, help="only these deals (default all 3003)")
+    parser.add_argument('--params', default=None, help="JSON file of weights the agents will use")
+    parser.add_argument('--chunk', type=int, default=20, help="deals per worker task")
+    parser.add_argument('--workers', type=int, default=None)
+    parser.add_argument('--tt-entries', type=int, default=1 << 18,
+                        help="transposition table entries per worker (0 disables it)")
+    args = parser.parse_args()
+
+    deals = read_deal_set(args.deal_set) if args.deal_set else list(ALL_DEALS)
+    params = None
+    if args.params:
+        with open(args.params) as f:
+            params = json.load(f)
+    tasks = [(deals[first:first + args.chunk], args.depth, args.plies, params, args.tt_entries)
+             for first in range(0, len(deals), args.chunk)]
+
+    start = time.perf_counter()
+    book = OpeningBook(depth=args.depth, plies=args.plies)
+    with ProcessPoolExecutor(max_workers=args.workers or os.cpu_count() or 1) as executor:
+        for done, entries in enumerate(executor.map(_search_chunk, tasks), 1):
+            book.entries.update(entries)
+            print(f"\r{min(done * args.chunk, len(deals))}/{len(deals)} deals, {len(book)} positions",
+                  end='', flush=True)
+    print()
+    book.save(args.output)
+    print(f"{len(book)} positions searched to depth {args.depth} written to {args.output} "
+          f"in {time.perf_counter() - start:.1f}s ({os.path.getsize(args.output)} bytes)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,45 @@
+"""Create or inspect deal-set files (see core/deals.py).
+
+Usage:
+    python -m tools.deal_set --random 500 --seed 1 --output deals.ngds
+    python -m tools.deal_set --all --output all_deals.ngds
+    python -m tools.deal_set --show deals.ngds
+"""
+import argparse
+import random
+
+from core.deals import ALL_DEALS, deal_index, random_deals, read_deal_set, write_deal_set
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Create or inspect deal-set files")
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument('--random', type=int, metavar='COUNT', help="COUNT random deals drawn with --seed")
+    source.add_argument('--all', action='store_true', help=f"all {len(ALL_DEALS)} possible deals")
+    source.add_argument('--show', metavar='FILE', help="print the deals in a deal-set file")
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--shuffle', action='store_true', help="with --all, shuffle the deals with --seed")
+    parser.add_argument('--output', help="deal-set file to write")
+    args = parser.parse_args()
+
+    if args.show:
+        deals = read_deal_set(args.show)
+        print(f"{args.show}: {len(deals)} deals, {len({deal_index(deal) for deal in deals})} distinct")
+        for number, deal in enumerate(deals):
+            print(f"  {number:>5}  #{deal_index(deal):<5} {list(deal)}")
+        return
+
+    if not args.output:
+        parser.error("--output is required to write a deal set")
+    if args.all:
+        deals = list(ALL_DEALS)
+        if args.shuffle:
+            random.Random(args.seed).shuffle(deals)
+    else:
+        deals = random_deals(args.random, args.seed)
+    write_deal_set(args.output, deals)
+    print(f"{len(deals)} deals written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
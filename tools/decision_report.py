@@ -0,0 +1,24 @@
+"""Print decision latency histograms saved by tools/selfplay.py --decision-stats or by the
+game with NANO_GWENT_DECISION_STATS set; several files are merged.
+
+Usage:
+    python -m tools.decision_report latency.json [more.json ...]
+"""
+import argparse
+
+from agents.decision_stats import DecisionStats, format_report
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Print agent decision latency histograms")
+    parser.add_argument('stats', nargs='+', help="JSON files written by DecisionStats.save")
+    args = parser.parse_args()
+
+    stats = DecisionStats()
+    for path in args.stats:
+        stats.merge(DecisionStats.load(path))
+    print(format_report(stats))
+
+
+if __name__ == "__main__":
+    main()
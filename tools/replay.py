@@ -0,0 +1,80 @@
+"""Replay a game from a match log: in the game window, as a move list, or check a whole log.
+
+Usage:
+    python -m tools.replay games.ngml --game 17 --move 12 --speed 4
+    python -m tools.replay games.ngml --game 17 --print
+    python -m tools.replay games.ngml --check
+"""
+import argparse
+import time
+
+from core.game_engine import GameEngine
+from core.match_log import AGENT_NAMES, iter_records
+from core.replay import Replay
+
+
+def print_moves(replay):
+    names = [AGENT_NAMES.get(code, '?') for code in (replay.agents or (None, None))]
+    print(f"deal {replay.deal}, P1 {names[0]} vs P2 {names[1]}")
+    game_state = replay.state_at(0)
+    game_engine = GameEngine(game_state)
+    for position, code in enumerate(replay.actions):
+        action = replay.action_at(game_state, position)
+        player = game_state.players[game_state.current_player]
+        print(f"  {position + 1:>3}  R{game_state.round_number}  P{game_state.current_player + 1}  "
+              f"{action!r:<45} board {player.get_board_strength():>3}, hand {len(player.hand):>2}")
+        Replay.play(game_engine, code)
+    print(f"round scores {game_state.round_scores}, "
+          f"winner {'draw' if game_state.winner is None else f'P{game_state.winner + 1}'}")
+
+
+def check_log(path):
+    """Replay every game of a log; return the number that do not reproduce their logged result."""
+    start = time.perf_counter()
+    games = failures = 0
+    for index, record in enumerate(iter_records(path)):
+        games += 1
+        try:
+            Replay.from_record(record)
+        except ValueError as error:
+            failures += 1
+            print(f"game {index}: {error}")
+    elapsed = time.perf_counter() - start
+    print(f"{games} games replayed in {elapsed:.1f}s, {failures} did not match the log")
+    return failures
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Replay games from a match log")
+    parser.add_argument('log')
+    parser.add_argument('--game', type=int, default=0, help="game index in the log, from 0")
+    parser.add_argument('--move', type=int, default=1, help="start at this move, from 1")
+    parser.add_argument('--speed', type=float, default=1.0, help="playback speed multiplier")
+    parser.add_argument('--paused', action='store_true', help="start paused")
+    parser.add_argument('--print', action='store_true', help="print the move list instead of opening a window")
+    parser.add_argument('--check', action='store_true', help="replay every game and report mismatches")
+    args = parser.parse_args()
+
+    if args.check:
+        raise SystemExit(1 if check_log(args.log) else 0)
+
+    replay = Replay.load(args.log, args.game)
+    if args.print:
+        print_moves(replay)
+        return
+
+    # Imported here so --print and --check work without a display
+    import pygame
+    from gui.replay_viewer import ReplayViewer
+    from main import create_window
+
+    screen = create_window()
+    viewer = ReplayViewer(screen, replay, speed=args.speed, position=args.move - 1,
+                          title=f"{args.log} game {args.game}")
+    viewer.paused = args.paused
+    viewer.run()
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,129 @@
+"""Play headless agent-vs-agent games on a process pool and append them to a match log.
+
+Every game draws its deal and its agents' random choices from generators seeded by
+(--seed, game number), so a run is reproducible whatever the worker count and chunking.
+
+Usage:
+    python -m tools.selfplay --agents fis csp --games 10000 --output games.ngml
+    python -m tools.selfplay --agents fis csp --deal-set deals.ngds --output games.ngml
+    python -m tools.selfplay --agents minimax csp --decision-stats latency.json --profile-slowest 10
+"""
+import argparse
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from agents.decision_stats import DecisionStats, SlowestProfiles, format_report, instrument
+from agents.opening_book import OpeningBook
+from agents.transposition import TranspositionTable
+from core.deals import game_rng, read_deal_set
+from core.match import play_match
+from core.match_log import MatchLogWriter, MatchRecorder
+from tools.tune import AGENTS
+
+
+class _RecordBuffer:
+    """Stands in for a MatchLogWriter inside a worker; records go back to the parent."""
+
+    def __init__(self):
+        self.records = []
+
+    def recorder(self, agents):
+        return MatchRecorder(self, agents)
+
+    def write(self, record):
+        self.records.append(record)
+
+
+def _make_agent(name, player_id, depth, rng, tt=None, book=None, proof_budget=0):
+    if name == 'minimax':
+        return AGENTS[name](player_id, max_depth=depth, rng=rng, tt=tt, book=book, proof_budget=proof_budget)
+    return AGENTS[name](player_id, rng=rng)
+
+
+def _play_chunk(task):
+    agent0, agent1, seed, first, count, depth, deals, measure, profiles, tt, book, proof_budget = task
+    buffer = _RecordBuffer()
+    stats = DecisionStats() if measure else None
+    for game in range(first, first + count):
+        card_ids = deals[game % len(deals)] if deals else None
+        agents = [_make_agent(agent0, 0, depth, game_rng(seed, game, 0), tt, book, proof_budget),
+                  _make_agent(agent1, 1, depth, game_rng(seed, game, 1), tt, book, proof_budget)]
+        if stats is not None:
+            for agent in agents:
+                instrument(agent, stats, profiles)
+        play_match(*agents, card_ids, log=buffer, rng=game_rng(seed, game, 'deal'))
+    return buffer.records, stats.to_dict() if stats else None, profiles
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Record headless self-play games to a match log")
+    parser.add_argument('--agents', nargs=2, choices=sorted(AGENTS), default=['fis', 'csp'],
+                        metavar='AGENT', help="player 0 and player 1 agents")
+    parser.add_argument('--games', type=int, default=None,
+                        help="games to play (default 1000, or one per deal with --deal-set)")
+    parser.add_argument('--deal-set', default=None, help="play these deals in order, cycling if --games is larger")
+    parser.add_argument('--chunk', type=int, default=100, help="games per worker task")
+    parser.add_argument('--depth', type=int, default=2, help="MinimaxAgent search depth")
+    parser.add_argument('--workers', type=int, default=None)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--output', required=True, help="match log to append to")
+    parser.add_argument('--decision-stats', default=None,
+                        help="time every decision and write the latency histograms to this JSON file")
+    parser.add_argument('--profile-slowest', type=int, default=0, metavar='N',
+                        help="profile every decision and keep the N slowest (implies timing)")
+    parser.add_argument('--profiler', choices=['cprofile', 'sample'], default='cprofile')
+    parser.add_argument('--profile-dir', default='decision_profiles')
+    parser.add_argument('--shared-tt', type=int, default=0, metavar='ENTRIES',
+                        help="give every MinimaxAgent in every worker one shared transposition table of this "
+                             "many entries (faster, but results then depend on scheduling)")
+    parser.add_argument('--book', default=None, help="opening book for MinimaxAgent (see tools/build_book.py)")
+    parser.add_argument('--proof-budget', type=int, default=0, metavar='NODES',
+                        help="let MinimaxAgent solve positions from round 2 on exactly with df-pn, "
+                             "expanding at most NODES nodes per decision")
+    args = parser.parse_args()
+
+    deals = read_deal_set(args.deal_set) if args.deal_set else None
+    games = args.games or (len(deals) if deals else 1000)
+    tt = TranspositionTable.create_shared(args.shared_tt) if args.shared_tt else None
+    book = OpeningBook.load(args.book) if args.book else None
+    tasks = []
+    for first in range(0, games, args.chunk):
+        count = min(args.chunk, games - first)
+        profiles = SlowestProfiles(args.profile_slowest, args.profiler) if args.profile_slowest else None
+        tasks.append((args.agents[0], args.agents[1], args.seed, first, count, args.depth, deals,
+                      bool(args.decision_stats or profiles), profiles, tt, book, args.proof_budget))
+
+    start = time.perf_counter()
+    played = 0
+    stats = DecisionStats()
+    slowest = SlowestProfiles(args.profile_slowest, args.profiler) if args.profile_slowest else None
+    with MatchLogWriter(args.output) as log, \
+            ProcessPoolExecutor(max_workers=args.workers or os.cpu_count() or 1) as executor:
+        for records, chunk_stats, chunk_profiles in executor.map(_play_chunk, tasks):
+            for record in records:
+                log.write(record)
+            played += len(records)
+            if chunk_stats:
+                stats.merge(DecisionStats.from_dict(chunk_stats))
+            if chunk_profiles:
+                slowest.merge(chunk_profiles)
+    elapsed = time.perf_counter() - start
+    if tt is not None:
+        print(f"shared transposition table {tt.occupancy():.1%} full")
+        tt.unlink()
+
+    print(f"{played} games ({args.agents[0]} vs {args.agents[1]}) appended to {args.output} "
+          f"in {elapsed:.1f}s ({played / elapsed if elapsed else 0:.0f} games/s)")
+
+    if stats.histograms:
+        print(format_report(stats))
+    if args.decision_stats:
+        stats.save(args.decision_stats)
+    if slowest:
+        paths = slowest.dump(args.profile_dir)
+        print(f"{len(paths)} profiles of the slowest decisions written to {args.profile_dir}/")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,139 @@
+"""Startup-time report: how long until the menu, and then the first game frame, are on screen.
+
+Each run is a fresh interpreter (so imports are really cold for Python) that times:
+
+    import      importing main and everything it pulls in
+    window      main.create_window(): pygame.init, set_mode, window icon
+    menu        building the menu and drawing its first frame
+    game        building GameGUI and rendering the first frame of a game
+    preload     until the background asset preload has finished
+
+Phases are reported as the median over --runs, followed by the slowest imports from
+`python -X importtime`. Uses the SDL dummy video driver unless SDL_VIDEODRIVER is set.
+
+Usage:
+    python -m tools.startup_report --runs 5
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+PHASES = ['import', 'window', 'menu', 'game', 'preload']
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def measure_startup():
+    """Run the startup sequence in this process and return the time (s) of each phase."""
+    times = {}
+    start = time.perf_counter()
+
+    import main
+    now = time.perf_counter()
+    times['import'], start = now - start, now
+
+    screen = main.create_window()
+    now = time.perf_counter()
+    times['window'], start = now - start, now
+
+    import pygame
+    from gui.menu import GameMenu
+    menu = GameMenu(screen)
+    menu._draw()
+    now = time.perf_counter()
+    times['menu'], start = now - start, now
+
+    from core.game_state import GameState
+    from gui.game_gui import GameGUI
+    game_state = GameState()
+    game_state.initialize()
+    gui = GameGUI(screen, "Human", "Human")
+    gui.render(game_state)
+    pygame.display.flip()
+    now = time.perf_counter()
+    times['game'], start = now - start, now
+
+    import threading
+    for thread in threading.enumerate():
+        if thread.name == 'asset-preload':
+            thread.join()
+    times['preload'] = time.perf_counter() - start
+
+    pygame.quit()
+    return times
+
+
+def _child_env():
+    env = dict(os.environ)
+    env.setdefault('SDL_VIDEODRIVER', 'dummy')
+    env.setdefault('PYGAME_HIDE_SUPPORT_PROMPT', '1')
+    return env
+
+
+def run_once():
+    result = subprocess.run(
+        [sys.executable, '-m', 'tools.startup_report', '--child'],
+        cwd=ROOT, env=_child_env(), capture_output=True, text=True, check=True,
+    )
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def slowest_imports(count):
+    """Return (cumulative us, self us, module) for the slowest modules main imports, from -X importtime."""
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', 'import main'],
+        cwd=ROOT, env=_child_env(), capture_output=True, text=True, check=True,
+    )
+    rows = []
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+        self_us, cumulative_us, module = line[len('import time:'):].split('|')
+        depth = (len(module) - len(module.lstrip()) - 1) // 2
+        if depth == 0 and module.strip() == 'main':
+            break
+        if depth == 0:
+            rows = []  # imports of an earlier top-level module (site, encodings, ...)
+        elif depth == 1:
+            rows.append((int(cumulative_us), int(self_us), module.strip()))
+    return sorted(rows, reverse=True)[:count]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure the game's startup time")
+    parser.add_argument('--runs', type=int, default=5)
+    parser.add_argument('--imports', type=int, default=10, help="number of slowest imports to list")
+    parser.add_argument('--json', default=None, help="write the median phase times to this JSON file")
+    parser.add_argument('--child', action='store_true', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        print(json.dumps(measure_startup()))
+        return
+
+    runs = [run_once() for _ in range(args.runs)]
+    medians = {phase: statistics.median(run[phase] for run in runs) for phase in PHASES}
+
+    print(f"startup over {args.runs} cold runs (median, ms):")
+    elapsed = 0.0
+    for phase in PHASES:
+        elapsed += medians[phase]
+        worst = max(run[phase] for run in runs)
+        print(f"  {phase:8} {medians[phase] * 1000:8.1f}   (max {worst * 1000:7.1f})   at {elapsed * 1000:8.1f}")
+    first_frame = medians['import'] + medians['window'] + medians['menu']
+    print(f"  menu on screen after {first_frame * 1000:.1f} ms")
+
+    print("\nslowest imports of main (cumulative / self, ms):")
+    for cumulative_us, self_us, module in slowest_imports(args.imports):
+        print(f"  {cumulative_us / 1000:8.1f} {self_us / 1000:8.1f}  {module}")
+
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump(medians, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
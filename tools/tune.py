@@ -0,0 +1,252 @@
+"""Evolution-strategy tuner for agent parameters.
+
+Each candidate parameter set plays headless games against the default-parameter
+version of the same agent over a fixed set of deals, once from each seat. Games
+are spread over a process pool and every (parameters, deal, seat) result is
+cached, so re-evaluated candidates and resumed runs cost nothing.
+
+Usage:
+    python -m tools.tune --agent minimax --depth 2 --generations 20 --population 16 --deals 24
+"""
+import argparse
+import json
+import math
+import os
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from agents.csp_agent import CSPAgent
+from agents.fis_agent import FISAgent
+from agents.minimax_agent import MinimaxAgent
+from core.deals import random_deals, read_deal_set
+from core.match import play_match
+
+# Part of every cached game result's key; bump it whenever an agent's play changes, so
+# results cached by the old code are not reused (version 2: Minimax plays the cards it
+# searches, before no card moved below the root)
+CACHE_VERSION = 2
+
+AGENTS = {
+    'fis': FISAgent,
+    'csp': CSPAgent,
+    'minimax': MinimaxAgent,
+}
+
+
+def flatten_params(params):
+    """Turn a parameter dict (numbers and breakpoint tuples) into names, values and step scales."""
+    names, values, scales = [], [], []
+    for name in sorted(params):
+        value = params[name]
+        if isinstance(value, (tuple, list)):
+            span = max(max(value) - min(value), 1)
+            for index, v in enumerate(value):
+                names.append((name, index))
+                values.append(float(v))
+                scales.append(float(span))
+        else:
+            names.append((name, None))
+            values.append(float(value))
+            scales.append(max(abs(float(value)), 1.0))
+    return names, values, scales
+
+
+def unflatten_params(names, values):
+    params = {}
+    for (name, index), value in zip(names, values):
+        value = round(value, 3)
+        if index is None:
+            params[name] = max(value, 0.0)  # weights are magnitudes, the sign lives in the code
+        else:
+            params.setdefault(name, []).append(value)
+    for name, value in params.items():
+        if isinstance(value, list):
+            params[name] = tuple(sorted(value))  # membership breakpoints must stay ordered
+    return params
+
+
+def _make_agent(agent_name, player_id, params, depth, rng):
+    if agent_name == 'minimax':
+        return MinimaxAgent(player_id, max_depth=depth, params=params, rng=rng)
+    return AGENTS[agent_name](player_id, params=params, rng=rng)
+
+
+def _play_task(task):
+    agent_name, params_key, card_ids, seat, depth = task
+    # Same seed for every candidate on a given (deal, seat): common random numbers
+    rng = random.Random(f"{card_ids}:{seat}")
+    candidate = _make_agent(agent_name, seat, dict(params_key), depth, rng)
+    reference = _make_agent(agent_name, 1 - seat, None, depth, rng)
+    if seat == 0:
+        final_state = play_match(candidate, reference, card_ids)
+    else:
+        final_state = play_match(reference, candidate, card_ids)
+
+    if final_state.winner is None:
+        return 0.5
+    return 1.0 if final_state.winner == seat else 0.0
+
+
+class EvolutionStrategyTuner:
+    def __init__(self, agent_name, deals, population=16, sigma=0.2, depth=2,
+                 workers=None, seed=0, cache_path=None):
+        self.agent_name = agent_name
+        self.deals = deals
+        self.population = population + population % 2  # mirrored sampling needs pairs
+        self.sigma = sigma
+        self.depth = depth
+        self.workers = workers or os.cpu_count() or 1
+        self.rng = random.Random(seed)
+        self.cache_path = cache_path
+        self.cache = {}
+        self.games_played = 0
+        self.cache_hits = 0
+        self.play_time = 0.0
+
+        if cache_path and os.path.exists(cache_path):
+            with open(cache_path) as f:
+                cache = json.load(f)
+            # Results of other cache versions are never looked up again, so they are not kept
+            prefix = f'({CACHE_VERSION}, '
+            self.cache = {key: result for key, result in cache.items() if key.startswith(prefix)}
+
+        defaults = AGENTS[agent_name].DEFAULT_PARAMS
+        self.names, self.mean, self.scales = flatten_params(defaults)
+
+    def _cache_key(self, params_key, card_ids, seat):
+        return repr((CACHE_VERSION, self.agent_name, self.depth, params_key, card_ids, seat))
+
+    def evaluate(self, executor, candidates):
+        """Return the fitness (mean score vs. the default agent) of each candidate params dict."""
+        tasks = []
+        keys = []
+        for params in candidates:
+            params_key = tuple(sorted(params.items()))
+            for card_ids in self.deals:
+                for seat in (0, 1):
+                    key = self._cache_key(params_key, card_ids, seat)
+                    keys.append(key)
+                    if key in self.cache:
+                        self.cache_hits += 1
+                    else:
+                        tasks.append((key, (self.agent_name, params_key, card_ids, seat, self.depth)))
+
+        # Duplicate candidates share tasks
+        unique_tasks = dict(tasks)
+        start = time.perf_counter()
+        chunksize = max(1, len(unique_tasks) // (self.workers * 4))
+        results = executor.map(_play_task, unique_tasks.values(), chunksize=chunksize)
+        for key, result in zip(unique_tasks.keys(), results):
+            self.cache[key] = result
+        self.play_time += time.perf_counter() - start
+        self.games_played += len(unique_tasks)
+
+        games_per_candidate = len(self.deals) * 2
+        fitness = []
+        for i in range(len(candidates)):
+            candidate_keys = keys[i * games_per_candidate:(i + 1) * games_per_candidate]
+            fitness.append(sum(self.cache[key] for key in candidate_keys) / games_per_candidate)
+        return fitness
+
+    def _sample(self):
+        half = []
+        for _ in range(self.population // 2):
+            half.append([self.rng.gauss(0, 1) for _ in self.mean])
+        return half + [[-z for z in noise] for noise in half]
+
+    def run(self, generations, report=print):
+        mu = self.population // 2
+        weights = [math.log(mu + 0.5) - math.log(i + 1) for i in range(mu)]
+        total = sum(weights)
+        weights = [w / total for w in weights]
+
+        # The cache is saved after every generation, and on the way out if the run is
+        # interrupted, so games already played are not lost
+        with ProcessPoolExecutor(max_workers=self.workers) as executor:
+            try:
+                return self._generations(executor, generations, weights, mu, report)
+            finally:
+                self.save_cache()
+
+    def _generations(self, executor, generations, weights, mu, report):
+        best_params = unflatten_params(self.names, self.mean)
+        best_fitness = self.evaluate(executor, [best_params])[0]
+        self.save_cache()
+        report(f"defaults: fitness={best_fitness:.3f}")
+
+        for generation in range(1, generations + 1):
+            gen_start = time.perf_counter()
+            games_before = self.games_played
+
+            noise = self._sample()
+            vectors = [[m + self.sigma * s * z for m, s, z in zip(self.mean, self.scales, n)] for n in noise]
+            candidates = [unflatten_params(self.names, v) for v in vectors]
+            fitness = self.evaluate(executor, candidates)
+
+            ranked = sorted(range(len(candidates)), key=lambda i: fitness[i], reverse=True)
+            self.mean = [
+                sum(w * vectors[i][d] for w, i in zip(weights, ranked[:mu]))
+                for d in range(len(self.mean))
+            ]
+
+            if fitness[ranked[0]] > best_fitness:
+                best_fitness = fitness[ranked[0]]
+                best_params = candidates[ranked[0]]
+
+            elapsed = time.perf_counter() - gen_start
+            games = self.games_played - games_before
+            report(f"gen {generation}: best={fitness[ranked[0]]:.3f} "
+                   f"mean={sum(fitness) / len(fitness):.3f} overall_best={best_fitness:.3f} "
+                   f"games={games} ({games / elapsed if elapsed else 0:.1f} games/s)")
+            self.save_cache()
+
+        return best_params, best_fitness
+
+    def save_cache(self):
+        if not self.cache_path:
+            return
+        tmp_path = self.cache_path + '.tmp'
+        with open(tmp_path, 'w') as f:
+            json.dump(self.cache, f)
+        os.replace(tmp_path, self.cache_path)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Tune agent parameters by self-play")
+    parser.add_argument('--agent', choices=sorted(AGENTS), default='fis')
+    parser.add_argument('--generations', type=int, default=10)
+    parser.add_argument('--population', type=int, default=16)
+    parser.add_argument('--sigma', type=float, default=0.2, help="step size relative to each parameter's scale")
+    parser.add_argument('--deals', type=int, default=32, help="number of fixed deals per evaluation")
+    parser.add_argument('--deal-set', default=None, help="deal-set file to evaluate on instead of --deals random deals")
+    parser.add_argument('--depth', type=int, default=2, help="MinimaxAgent search depth")
+    parser.add_argument('--workers', type=int, default=None)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--cache', default=None, help="JSON file to persist game results between runs")
+    parser.add_argument('--output', default=None, help="write the best parameters to this JSON file")
+    args = parser.parse_args()
+
+    deals = read_deal_set(args.deal_set) if args.deal_set else random_deals(args.deals, args.seed)
+    tuner = EvolutionStrategyTuner(
+        args.agent, deals, population=args.population,
+        sigma=args.sigma, depth=args.depth, workers=args.workers, seed=args.seed,
+        cache_path=args.cache,
+    )
+    start = time.perf_counter()
+    best_params, best_fitness = tuner.run(args.generations)
+    elapsed = time.perf_counter() - start
+
+    print(f"\nbest fitness {best_fitness:.3f} vs. default {args.agent}")
+    print(f"{tuner.games_played} games in {elapsed:.1f}s "
+          f"({tuner.games_played / tuner.play_time if tuner.play_time else 0:.1f} games/s in pool, "
+          f"{tuner.cache_hits} cached results reused)")
+    print(json.dumps(best_params, indent=2))
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(best_params, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()